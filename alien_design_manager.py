@@ -2,16 +2,32 @@ import pygame
 import os
 import random
 import math
+import visual_assets
+from visual_assets import create_flash_sprite
+from art_cache import get_art_cache, generator_version
+from game_logger import get_logger
+
+assets_log = get_logger("assets")
 
 class AlienDesignManager:
     def __init__(self):
         self.alien_designs = {}
         self.design_variations = {}
+        self.flash_variations = {}  # alien_type -> {variation index: damage-flash variant}, built on first hit
         self.load_all_designs()
     
     def load_all_designs(self):
         """Load alien designs from files or create procedural ones"""
-        print("👾 Loading alien design variations...")
+        assets_log.info("👾 Loading alien design variations...")
+        
+        # Reuse the designs generated by an earlier launch while the generators are unchanged
+        version = generator_version(__file__, visual_assets.__file__, "alien_designs")
+        cached = get_art_cache().load("alien_designs", version)
+        if cached is not None:
+            self.design_variations = cached['design_variations']
+            assets_log.info("✅ Loaded %d alien design variations from cache",
+                            sum(len(v) for v in self.design_variations.values()))
+            return
         
         # Create multiple design variations for each alien type
         alien_types = ['basic', 'scout', 'warrior', 'commander']
@@ -26,15 +42,16 @@ class AlienDesignManager:
                     try:
                         sprite = pygame.image.load(design_path)
                         self.design_variations[alien_type].append(sprite)
-                        print(f"📁 Loaded {alien_type} variation {variation} from file")
+                        assets_log.info("📁 Loaded %s variation %d from file", alien_type, variation)
                     except Exception as e:
-                        print(f"⚠️ Error loading {design_path}: {e}")
+                        assets_log.warning("⚠️ Error loading %s: %s", design_path, e)
                         self.design_variations[alien_type].append(self.create_alien_variation(alien_type, variation))
                 else:
                     # Create procedural variation
                     self.design_variations[alien_type].append(self.create_alien_variation(alien_type, variation))
         
-        print(f"✅ Created {sum(len(v) for v in self.design_variations.values())} alien design variations")
+        get_art_cache().save("alien_designs", version, {'design_variations': self.design_variations})
+        assets_log.info("✅ Created %d alien design variations", sum(len(v) for v in self.design_variations.values()))
     
     def create_alien_variation(self, alien_type, variation):
         """Create procedural alien design variations"""
@@ -278,8 +295,8 @@ class AlienDesignManager:
         
         return alien
     
-    def get_alien_design(self, alien_type, level=1):
-        """Get alien design based on type and level"""
+    def get_alien_design(self, alien_type, level=1, flash=False):
+        """Get alien design based on type and level (flash=True for the damage-flash variant)"""
         if alien_type not in self.design_variations:
             return None
         
@@ -289,7 +306,14 @@ class AlienDesignManager:
         
         # Use different variations based on level
         variation_index = (level - 1) % len(variations)
-        return variations[variation_index]
+        if not flash:
+            return variations[variation_index]
+        
+        # The damage-flash variant is only built once a design is actually hit
+        flash_sprites = self.flash_variations.setdefault(alien_type, {})
+        if variation_index not in flash_sprites:
+            flash_sprites[variation_index] = create_flash_sprite(variations[variation_index])
+        return flash_sprites[variation_index]
     
     def get_random_design(self, alien_type):
         """Get random design variation for alien type"""
@@ -0,0 +1,161 @@
+"""
+Art Cache for Cosmic Raiders
+Content-addressed on-disk cache for procedurally generated sprites: each asset
+manager's surfaces are stored as raw pixel buffers in a single file, keyed by a
+hash of the generator source, so later launches skip procedural generation
+"""
+
+import os
+import json
+import struct
+import hashlib
+import pygame
+from game_logger import get_logger
+
+assets_log = get_logger("assets")
+
+ART_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".art_cache")
+ART_CACHE_ENV_VAR = "COSMIC_RAIDERS_ART_CACHE"  # Cache directory to use, or "off"
+CACHE_FORMAT_VERSION = 1
+HEADER_LENGTH = struct.Struct("<I")
+
+_default_cache = None
+
+
+def generator_version(*sources):
+    """Hash generator source files (and asset directory listings) into a cache version"""
+    digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{pygame.version.ver}".encode())
+    for source in sources:
+        digest.update(source.encode())
+        if os.path.isdir(source):
+            # Sprite files dropped into an asset directory replace generated art
+            for name in sorted(os.listdir(source)):
+                stat = os.stat(os.path.join(source, name))
+                digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        elif os.path.isfile(source):
+            with open(source, "rb") as source_file:
+                digest.update(source_file.read())
+    return digest.hexdigest()[:16]
+
+
+def encode_container(container, surfaces):
+    """Replace every surface in a (nested) dict or list with a reference into surfaces"""
+    if isinstance(container, pygame.Surface):
+        surfaces.append(container)
+        return {'surface': len(surfaces) - 1}
+    if isinstance(container, dict):
+        return {'dict': [[key, encode_container(value, surfaces)] for key, value in container.items()]}
+    if isinstance(container, list):
+        return {'list': [encode_container(value, surfaces) for value in container]}
+    raise TypeError(f"Cannot cache {type(container).__name__}")
+
+
+def decode_container(layout, surfaces):
+    """Rebuild a container encoded by encode_container"""
+    if 'surface' in layout:
+        return surfaces[layout['surface']]
+    if 'dict' in layout:
+        return {key: decode_container(value, surfaces) for key, value in layout['dict']}
+    return [decode_container(value, surfaces) for value in layout['list']]
+
+
+def get_art_cache():
+    """Get the shared cache (directory from COSMIC_RAIDERS_ART_CACHE, "off" disables it)"""
+    global _default_cache
+    if _default_cache is None:
+        cache_dir = os.environ.get(ART_CACHE_ENV_VAR, ART_CACHE_DIR)
+        _default_cache = ArtCache(None if cache_dir.lower() == "off" else cache_dir)
+    return _default_cache
+
+
+class ArtCache:
+    def __init__(self, cache_dir=ART_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get_path(self, name, version):
+        """Cache file for one asset set and generator version"""
+        return os.path.join(self.cache_dir, f"{name}-{version}.art")
+
+    def load(self, name, version):
+        """Load a cached container of surfaces with a single read, or None on a miss"""
+        if not self.cache_dir:
+            return None
+        path = self.get_path(name, version)
+        try:
+            with open(path, "rb") as cache_file:
+                data = cache_file.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        try:
+            (header_length,) = HEADER_LENGTH.unpack_from(data)
+            header_end = HEADER_LENGTH.size + header_length
+            header = json.loads(data[HEADER_LENGTH.size:header_end])
+            surfaces = []
+            for entry in header['surfaces']:
+                start = header_end + entry['offset']
+                pixels = data[start:start + entry['length']]
+                surface = pygame.image.frombytes(pixels, tuple(entry['size']), entry['mode'])
+                if entry['colorkey'] is not None:
+                    surface.set_colorkey(entry['colorkey'])
+                surfaces.append(surface)
+            container = decode_container(header['layout'], surfaces)
+        except Exception as e:
+            assets_log.warning("⚠️ Ignoring unreadable art cache %s: %s", path, e)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        assets_log.info("📦 Loaded %d cached %s surfaces", len(surfaces), name)
+        return container
+
+    def save(self, name, version, container):
+        """Store a container of surfaces as raw pixel buffers"""
+        if not self.cache_dir:
+            return False
+        surfaces = []
+        try:
+            layout = encode_container(container, surfaces)
+            entries = []
+            buffers = []
+            offset = 0
+            for surface in surfaces:
+                mode = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+                pixels = pygame.image.tobytes(surface, mode)
+                colorkey = surface.get_colorkey()
+                entries.append({
+                    'size': surface.get_size(),
+                    'mode': mode,
+                    'colorkey': list(colorkey) if colorkey is not None else None,
+                    'offset': offset,
+                    'length': len(pixels)
+                })
+                buffers.append(pixels)
+                offset += len(pixels)
+            header = json.dumps({'layout': layout, 'surfaces': entries}).encode()
+
+            # Write to a temporary file first so a crash never leaves a truncated cache entry
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self.get_path(name, version)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(HEADER_LENGTH.pack(len(header)))
+                cache_file.write(header)
+                for pixels in buffers:
+                    cache_file.write(pixels)
+            os.replace(temp_path, path)
+        except Exception as e:
+            assets_log.warning("⚠️ Could not write art cache for %s: %s", name, e)
+            return False
+
+        self.writes += 1
+        assets_log.debug("📦 Cached %d %s surfaces (%d bytes)", len(surfaces), name, offset)
+        return True
+
+    def get_stats(self):
+        """Get hit, miss and write counts"""
+        return {'hits': self.hits, 'misses': self.misses, 'writes': self.writes}
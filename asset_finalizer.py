@@ -0,0 +1,126 @@
+"""
+Asset Finalizer for Cosmic Raiders
+Converts every cached sprite to the display's pixel format once the window
+exists, so blits skip per-frame format conversion, and turns on RLE
+acceleration for sprites that are mostly transparent
+"""
+
+import pygame
+from game_logger import get_logger
+
+assets_log = get_logger("assets")
+
+RLE_TRANSPARENT_RATIO = 0.25  # RLE pays off once a quarter of the pixels are see-through
+
+
+def describe_format(surface):
+    """Short pixel format description, e.g. "32bpp SRCALPHA RLE\""""
+    flags = surface.get_flags()
+    parts = [f"{surface.get_bitsize()}bpp"]
+    if flags & pygame.SRCALPHA:
+        parts.append("SRCALPHA")
+    if surface.get_colorkey() is not None:
+        parts.append("COLORKEY")
+    if flags & (pygame.RLEACCEL | pygame.RLEACCELOK):
+        parts.append("RLE")
+    return " ".join(parts)
+
+
+def surface_bytes(surface):
+    """Memory used by a surface's pixel data"""
+    return surface.get_pitch() * surface.get_height()
+
+
+def transparent_ratio(surface):
+    """Fraction of fully transparent pixels in a per-pixel alpha surface"""
+    width, height = surface.get_size()
+    if width == 0 or height == 0:
+        return 0.0
+    try:
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        ratio = float((alpha == 0).sum()) / (width * height)
+        del alpha  # Release the surface lock
+        return ratio
+    except Exception:
+        return 0.0
+
+
+class AssetFinalizer:
+    def __init__(self, rle_threshold=RLE_TRANSPARENT_RATIO):
+        self.rle_threshold = rle_threshold
+        self.report = []
+
+    def finalize_surface(self, surface, name="surface"):
+        """Return a display-format copy of surface, RLE-accelerated where it helps"""
+        before_format = describe_format(surface)
+        before_bytes = surface_bytes(surface)
+
+        if surface.get_flags() & pygame.SRCALPHA:
+            converted = surface.convert_alpha()
+            if transparent_ratio(converted) >= self.rle_threshold:
+                converted.set_alpha(255, pygame.RLEACCEL)
+        else:
+            colorkey = surface.get_colorkey()
+            converted = surface.convert()
+            if colorkey is not None:
+                converted.set_colorkey(colorkey, pygame.RLEACCEL)
+
+        self.report.append({
+            'name': name,
+            'size': converted.get_size(),
+            'before_format': before_format,
+            'after_format': describe_format(converted),
+            'before_bytes': before_bytes,
+            'after_bytes': surface_bytes(converted)
+        })
+        return converted
+
+    def finalize_container(self, container, prefix):
+        """Convert every surface in a (nested) dict or list in place"""
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in list(items):
+            name = f"{prefix}.{key}"
+            if isinstance(value, pygame.Surface):
+                container[key] = self.finalize_surface(value, name)
+            elif isinstance(value, (dict, list)):
+                self.finalize_container(value, name)
+
+    def finalize_game_assets(self, visual_assets=None, alien_design_manager=None, spaceship_designer=None):
+        """Convert all sprites cached by the game's asset managers"""
+        if visual_assets:
+            self.finalize_container(visual_assets.sprites, "visual_assets")
+        if alien_design_manager:
+            self.finalize_container(alien_design_manager.design_variations, "alien_designs")
+            self.finalize_container(alien_design_manager.flash_variations, "alien_designs_flash")
+        if spaceship_designer:
+            self.finalize_container(spaceship_designer.spaceship_designs, "spaceships")
+            self.finalize_container(spaceship_designer.flash_designs, "spaceships_flash")
+
+        summary = self.get_summary()
+        assets_log.info("🖼️ Converted %d surfaces to display format (%d RLE, %.1f KB)",
+                        summary['surfaces'], summary['rle_surfaces'], summary['after_bytes'] / 1024)
+        for entry in self.report:
+            assets_log.debug("   %s %dx%d: %s -> %s, %d bytes", entry['name'], entry['size'][0], entry['size'][1],
+                             entry['before_format'], entry['after_format'], entry['after_bytes'])
+        return summary
+
+    def get_summary(self):
+        """Get totals over all finalized surfaces"""
+        return {
+            'surfaces': len(self.report),
+            'rle_surfaces': sum(1 for entry in self.report if 'RLE' in entry['after_format']),
+            'before_bytes': sum(entry['before_bytes'] for entry in self.report),
+            'after_bytes': sum(entry['after_bytes'] for entry in self.report)
+        }
+
+    def format_report(self):
+        """Get the per-surface report as printable lines"""
+        lines = [f"{'Surface':<40} {'Size':>9} {'Bytes':>8}  Format"]
+        for entry in self.report:
+            size = f"{entry['size'][0]}x{entry['size'][1]}"
+            lines.append(f"{entry['name']:<40} {size:>9} {entry['after_bytes']:>8}  "
+                         f"{entry['before_format']} -> {entry['after_format']}")
+        summary = self.get_summary()
+        lines.append(f"{summary['surfaces']} surfaces, {summary['rle_surfaces']} RLE, "
+                     f"{summary['after_bytes']} bytes")
+        return lines
@@ -22,18 +22,15 @@ class AssetLoader:
         self.font_path = "fonts/"
         self.log_path = "logs/"
         
-        # Ensure directories exist
-        self._ensure_directories()
+        # The mixer is opened on the first sound load, not when the loader is created
+        self.audio_initialized = False
         
-        # Initialize pygame components
-        pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=256)
-        pygame.mixer.init()
-        pygame.mixer.set_num_channels(16)
-        
-    def _ensure_directories(self):
-        """Create asset directories if they don't exist"""
-        for path in [self.sprite_path, self.sound_path, self.font_path, self.log_path]:
-            os.makedirs(path, exist_ok=True)
+    def _ensure_audio(self):
+        """Initialize the mixer the first time a sound is needed"""
+        if not self.audio_initialized:
+            from audio_manager import init_mixer  # The audio engine owns the mixer settings
+            init_mixer()
+            self.audio_initialized = True
     
     def _log_error(self, error_type, asset_name, error_msg):
         """Log asset loading errors"""
@@ -46,6 +43,7 @@ class AssetLoader:
         """Save error log to file"""
         if self.error_log:
             try:
+                os.makedirs(self.log_path, exist_ok=True)
                 log_file = os.path.join(self.log_path, "errors.log")
                 with open(log_file, "a", encoding="utf-8") as f:
                     f.write(f"\n=== Game Session {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n")
@@ -62,22 +60,13 @@ class AssetLoader:
         return surface
     
     def create_fallback_sound(self, frequency=440, duration=0.1):
-        """Create a fallback beep sound"""
+        """Create a fallback beep sound (synthesized once, then cached)"""
         try:
-            sample_rate = 22050
-            frames = int(duration * sample_rate)
-            import numpy as np
-            
-            # Generate simple beep
-            t = np.linspace(0, duration, frames)
-            wave = np.sin(2 * np.pi * frequency * t) * 0.3
-            
-            # Convert to pygame sound
-            sound_array = (wave * 32767).astype(np.int16)
-            sound = pygame.sndarray.make_sound(sound_array.reshape(-1, 1))
-            return sound
-        except:
-            # If numpy isn't available, return None
+            self._ensure_audio()
+            from sound_synth import get_sound_synth
+            return get_sound_synth().get_sound({'kind': 'blip', 'frequency': frequency, 'duration': duration})
+        except Exception:
+            # If numpy or the mixer isn't available, return None
             return None
     
     def load_sprite(self, name, filename, fallback_size=(32, 32), fallback_color=(255, 255, 255)):
@@ -112,6 +101,7 @@ class AssetLoader:
         
         try:
             if os.path.exists(filepath):
+                self._ensure_audio()
                 sound = pygame.mixer.Sound(filepath)
                 sound.set_volume(volume)
                 self.sounds[name] = sound
@@ -207,5 +197,19 @@ class AssetLoader:
         
         print("🧹 Asset loader cleaned up")
 
-# Global asset loader instance
-asset_loader = AssetLoader()
+_asset_loader = None
+
+
+def get_asset_loader():
+    """Get the shared asset loader, creating it on first use"""
+    global _asset_loader
+    if _asset_loader is None:
+        _asset_loader = AssetLoader()
+    return _asset_loader
+
+
+def __getattr__(name):
+    # Keeps `from asset_loader import asset_loader` working without creating the loader at import
+    if name == "asset_loader":
+        return get_asset_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
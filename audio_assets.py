@@ -0,0 +1,242 @@
+"""
+Audio Assets for Cosmic Raiders
+Music tracks are transcoded once into a compact streamable file cached in
+.audio_cache/ and loaded on a background thread, while short effects are
+decoded up front into one in-memory sound bank
+"""
+
+import os
+import queue
+import hashlib
+import shutil
+import threading
+import subprocess
+import wave
+import numpy as np
+import pygame
+from game_logger import get_logger
+
+audio_log = get_logger("audio")
+
+AUDIO_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".audio_cache")
+AUDIO_CACHE_ENV_VAR = "COSMIC_RAIDERS_AUDIO_CACHE"  # Cache directory to use, or "off"
+MUSIC_VOLUME = 0.4
+
+# Encoders tried in order; the cached file keeps the source's channels at the mixer rate
+MUSIC_ENCODERS = {
+    'ffmpeg': lambda source, target, frequency: [
+        "ffmpeg", "-v", "error", "-y", "-i", source, "-ar", str(frequency),
+        "-c:a", "libvorbis", "-q:a", "4", "-f", "ogg", target],
+    'oggenc': lambda source, target, frequency: [
+        "oggenc", "-Q", "-q", "4", "--resample", str(frequency), "-o", target, source]
+}
+
+
+def get_audio_cache_dir():
+    """Get the music cache directory (from COSMIC_RAIDERS_AUDIO_CACHE, None when "off")"""
+    cache_dir = os.environ.get(AUDIO_CACHE_ENV_VAR, AUDIO_CACHE_DIR)
+    return None if cache_dir.lower() == "off" else cache_dir
+
+
+def source_key(path):
+    """Key a source file by its size and modification time, without reading it"""
+    stat = os.stat(path)
+    return hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def find_encoder():
+    """Get the name of the first available Vorbis encoder, or None"""
+    for name in MUSIC_ENCODERS:
+        if shutil.which(name):
+            return name
+    return None
+
+
+def resample_wav(source, target, frequency):
+    """Write a 16-bit copy of a WAV file at the given sample rate"""
+    with wave.open(source, "rb") as source_file:
+        channels = source_file.getnchannels()
+        rate = source_file.getframerate()
+        if source_file.getsampwidth() != 2:
+            raise ValueError(f"{source} is not 16-bit PCM")
+        samples = np.frombuffer(source_file.readframes(source_file.getnframes()), dtype="<i2")
+    samples = samples.reshape(-1, channels).astype(np.float32)
+
+    if rate % frequency == 0:
+        # Whole-number ratio (44100 -> 22050): average each block, a cheap low-pass
+        factor = rate // frequency
+        length = len(samples) // factor * factor
+        samples = samples[:length].reshape(-1, factor, channels).mean(axis=1)
+    elif rate != frequency:
+        positions = np.arange(int(len(samples) * frequency / rate)) * (rate / frequency)
+        samples = np.stack([np.interp(positions, np.arange(len(samples)), samples[:, channel])
+                            for channel in range(channels)], axis=1)
+
+    with wave.open(target, "wb") as target_file:
+        target_file.setnchannels(channels)
+        target_file.setsampwidth(2)
+        target_file.setframerate(frequency)
+        target_file.writeframes(np.clip(np.round(samples), -32768, 32767).astype("<i2").tobytes())
+
+
+def get_sample_rate(path):
+    """Get a WAV file's sample rate, or None if it cannot be read"""
+    try:
+        with wave.open(path, "rb") as wav_file:
+            return wav_file.getframerate()
+    except (OSError, wave.Error, EOFError):
+        return None
+
+
+def transcode_music(source, frequency=22050, cache_dir=None, encoder="auto"):
+    """Get a cached compact copy of a music track, transcoding it on first use"""
+    cache_dir = get_audio_cache_dir() if cache_dir is None else cache_dir
+    if not cache_dir or not source.lower().endswith(".wav"):
+        return source
+    encoder = find_encoder() if encoder == "auto" else encoder
+    if not encoder and get_sample_rate(source) == frequency:
+        return source  # Nothing to gain from a resampled copy
+    extension = "ogg" if encoder else "wav"
+    name = os.path.splitext(os.path.basename(source))[0]
+    target = os.path.join(cache_dir, f"{name}-{source_key(source)}-{frequency}.{extension}")
+    if os.path.exists(target):
+        return target
+
+    # Write to a temporary file first so a crash never leaves a truncated track
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        if encoder:
+            subprocess.run(MUSIC_ENCODERS[encoder](source, temp_path, frequency),
+                           check=True, capture_output=True, timeout=120)
+        else:
+            resample_wav(source, temp_path, frequency)
+        os.replace(temp_path, target)
+    except Exception as e:
+        audio_log.warning("⚠️ Could not transcode %s, streaming the original: %s", source, e)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return source
+
+    audio_log.info("🎼 Transcoded %s (%d KB -> %d KB)", os.path.basename(source),
+                   os.path.getsize(source) // 1024, os.path.getsize(target) // 1024)
+    return target
+
+
+class SoundBank:
+    """Short effects decoded once into mixer-format buffers, ready to play"""
+    def __init__(self):
+        self.sounds = {}
+        self.bytes = 0
+
+    def load(self, name, path, volume=0.7):
+        """Decode one effect into the bank"""
+        return self.add(name, pygame.mixer.Sound(path), volume)
+
+    def add(self, name, sound, volume=0.7):
+        """Put an already decoded (or synthesized) effect into the bank"""
+        sound.set_volume(volume)
+        self.sounds[name] = sound
+        self.bytes += len(sound.get_raw())
+        return sound
+
+    def get(self, name):
+        """Get a decoded effect, or None"""
+        return self.sounds.get(name)
+
+    def get_stats(self):
+        """Get the number of effects and their decoded size"""
+        return {'sounds': len(self.sounds), 'bytes': self.bytes}
+
+    def __contains__(self, name):
+        return name in self.sounds
+
+    def __len__(self):
+        return len(self.sounds)
+
+
+class MusicStreamer:
+    """Loads and starts music tracks on a worker thread so switching never blocks a frame"""
+    def __init__(self, volume=MUSIC_VOLUME):
+        self.volume = volume
+        self.requests = queue.Queue()
+        self.thread = None
+        self.current_path = None
+        self.lock = threading.Lock()
+        self.idle = threading.Event()
+        self.idle.set()
+
+    def start(self):
+        """Start the worker thread on first use"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="music-streamer", daemon=True)
+            self.thread.start()
+
+    def request(self, *command):
+        self.start()
+        with self.lock:
+            self.idle.clear()
+            self.requests.put(command)
+
+    def prepare(self, paths):
+        """Transcode tracks in the background ahead of their first play"""
+        self.request('prepare', list(paths))
+
+    def play(self, path, loops=-1):
+        """Switch to a track (only the most recent pending switch is carried out)"""
+        self.request('play', path, loops)
+
+    def stop(self):
+        """Stop the current track"""
+        self.request('stop')
+
+    def run(self):
+        while True:
+            command = self.requests.get()
+            prepares = []
+            if command[0] == 'play':
+                # Skip switches superseded while this one was waiting, but keep every prepare
+                while not self.requests.empty():
+                    pending = self.requests.get_nowait()
+                    if pending[0] == 'prepare':
+                        prepares.append(pending)
+                    else:
+                        command = pending
+            if command[0] == 'quit':
+                break
+            for task in [command] + prepares:  # The winning switch first, then the skipped prepares
+                try:
+                    self.execute(task)
+                except Exception as e:
+                    audio_log.warning("⚠️ Music %s failed: %s", task[0], e)
+            with self.lock:
+                if self.requests.empty():
+                    self.idle.set()
+        self.idle.set()
+
+    def execute(self, command):
+        frequency = pygame.mixer.get_init()[0]
+        if command[0] == 'prepare':
+            for path in command[1]:
+                transcode_music(path, frequency)
+        elif command[0] == 'play':
+            _, path, loops = command
+            pygame.mixer.music.stop()
+            pygame.mixer.music.load(transcode_music(path, frequency))
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(loops)
+            self.current_path = path
+        elif command[0] == 'stop':
+            pygame.mixer.music.stop()
+            self.current_path = None
+
+    def wait_idle(self, timeout=None):
+        """Wait until every queued request has been carried out"""
+        return self.idle.wait(timeout)
+
+    def close(self):
+        """Stop the worker thread"""
+        if self.thread is not None:
+            self.requests.put(('quit',))
+            self.thread.join(timeout=2.0)
+            self.thread = None
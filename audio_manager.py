@@ -1,14 +1,47 @@
+"""
+Audio Manager for Cosmic Raiders
+The game's single audio engine: opens the mixer once, decodes effects on a
+worker thread and streams music, with visual feedback when audio is unavailable
+"""
+
 import pygame
 import os
 import sys
+import threading
+from game_logger import get_logger
+from audio_assets import SoundBank, MusicStreamer
+from voice_manager import VoiceManager
+from sound_synth import get_sound_synth
+
+audio_log = get_logger("audio")
+
+# Low-latency mixer settings, shared by everything that may open the mixer first
+MIXER_SETTINGS = {'frequency': 22050, 'size': -16, 'channels': 2, 'buffer': 256}
+MIXER_CHANNELS = 16
+
+
+def init_mixer():
+    """Open the mixer with the game's settings unless it is already open"""
+    if not pygame.mixer.get_init():
+        pygame.mixer.pre_init(**MIXER_SETTINGS)
+        pygame.mixer.init()
+    if pygame.mixer.get_num_channels() < MIXER_CHANNELS:
+        pygame.mixer.set_num_channels(MIXER_CHANNELS)
+    return pygame.mixer.get_init()
+
 
 class AudioManager:
-    def __init__(self):
-        """Initialize audio system with fallback handling"""
-        self.audio_enabled = True
+    def __init__(self, enabled=True):
+        """Initialize audio system with fallback handling (enabled=False never opens the mixer)"""
+        self.audio_enabled = enabled
         self.sounds_loaded = False
         self.muted = False
-        self.sounds = {}
+        self.sound_bank = SoundBank()
+        self.sounds = self.sound_bank.sounds
+        self.music_streamer = MusicStreamer()
+        self.voice_manager = None
+        self.loader_thread = None
+        self.sounds_ready = threading.Event()
         self.music_playing = False
         self.current_music = None
         
@@ -37,71 +70,98 @@ class AudioManager:
             'level_advance': '*NEXT*'
         }
         
-        self.initialize_audio()
-        self.load_sounds()
+        if self.audio_enabled:
+            self.initialize_audio()
+        self.start_loading()
         
     def initialize_audio(self):
         """Initialize pygame mixer with optimized settings for low latency"""
         try:
-            # Initialize mixer with low latency settings
-            pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=256)  # Smaller buffer for less delay
-            pygame.mixer.init()
-            pygame.mixer.set_num_channels(16)  # More channels for simultaneous sounds
+            init_mixer()
+            self.voice_manager = VoiceManager()
             self.audio_enabled = True
-            print("🔊 Audio system initialized with low latency settings")
+            audio_log.info("🔊 Audio system initialized with low latency settings")
         except pygame.error as e:
-            print(f"⚠️ Audio initialization failed: {e}")
-            print("🔇 Running in silent mode with visual feedback")
+            audio_log.warning("⚠️ Audio initialization failed: %s", e)
+            audio_log.warning("🔇 Running in silent mode with visual feedback")
             self.audio_enabled = False
     
-    def load_sounds(self):
-        """Load all sound files with fallback handling"""
+    def start_loading(self):
+        """Decode the sounds on a worker thread so startup never waits for audio"""
         if not self.audio_enabled:
+            self.sounds_ready.set()
             return
-            
+        self.loader_thread = threading.Thread(target=self.load_sounds, name="sound-loader", daemon=True)
+        self.loader_thread.start()
+    
+    def wait_until_loaded(self, timeout=None):
+        """Wait for the worker thread to finish decoding"""
+        return self.sounds_ready.wait(timeout)
+    
+    def load_sounds(self):
+        """Load all sound files with fallback handling"""
+        try:
+            if self.audio_enabled:
+                self.decode_sounds()
+        finally:
+            self.sounds_ready.set()
+    
+    def decode_sounds(self):
+        """Decode every effect into the sound bank (each one is playable as soon as it is in)"""
         loaded_count = 0
         total_sounds = len(self.sound_files)
         
         for sound_name, file_path in self.sound_files.items():
+            if sound_name.endswith('_music'):
+                # Music files are handled separately
+                if not os.path.exists(file_path):
+                    audio_log.warning("⚠️ Sound file not found: %s", file_path)
+                continue
+            # Decode sound effects into the bank at reasonable volume levels
+            if 'shoot' in sound_name:
+                volume = 0.3  # Quieter for frequent sounds
+            elif 'hit' in sound_name:
+                volume = 0.5
+            else:
+                volume = 0.7
             try:
                 if os.path.exists(file_path):
-                    if sound_name.endswith('_music'):
-                        # Music files are handled separately
-                        continue
-                    else:
-                        # Load sound effects
-                        sound = pygame.mixer.Sound(file_path)
-                        # Set reasonable volume levels
-                        if 'shoot' in sound_name:
-                            sound.set_volume(0.3)  # Quieter for frequent sounds
-                        elif 'hit' in sound_name:
-                            sound.set_volume(0.5)
-                        else:
-                            sound.set_volume(0.7)
-                        
-                        self.sounds[sound_name] = sound
-                        loaded_count += 1
-                        print(f"✅ Loaded sound: {sound_name}")
+                    self.sound_bank.load(sound_name, file_path, volume)
+                    loaded_count += 1
+                    audio_log.debug("✅ Loaded sound: %s", sound_name)
                 else:
-                    print(f"⚠️ Sound file not found: {file_path}")
-            except pygame.error as e:
-                print(f"⚠️ Failed to load {sound_name}: {e}")
+                    # Effects left out of a deployment are synthesized instead
+                    sound = get_sound_synth().get_preset(sound_name)
+                    if sound is None:
+                        audio_log.warning("⚠️ Sound file not found: %s", file_path)
+                        continue
+                    self.sound_bank.add(sound_name, sound, volume)
+                    loaded_count += 1
+                    audio_log.debug("🎛️ Synthesized sound: %s", sound_name)
+            except (pygame.error, ValueError) as e:
+                audio_log.warning("⚠️ Failed to load %s: %s", sound_name, e)
+        
+        # Transcode the music tracks in the background before they are first needed
+        self.music_streamer.prepare(path for name, path in self.sound_files.items()
+                                    if name.endswith('_music') and os.path.exists(path))
         
         if loaded_count > 0:
             self.sounds_loaded = True
-            print(f"🔊 Audio system ready: {loaded_count}/{total_sounds-2} sounds loaded")
+            audio_log.info("🔊 Audio system ready: %d/%d sounds loaded (%d KB decoded)", loaded_count, total_sounds - 2,
+                          self.sound_bank.get_stats()['bytes'] // 1024)
         else:
-            print("🔇 No sounds loaded - using visual feedback only")
+            audio_log.warning("🔇 No sounds loaded - using visual feedback only")
     
     def play_sound(self, sound_name):
         """Play sound immediately without visual feedback"""
-        # Play audio if available and not muted
-        if self.audio_enabled and self.sounds_loaded and not self.muted:
-            if sound_name in self.sounds:
+        # Play audio if available and not muted; effects still decoding are skipped
+        if self.audio_enabled and not self.muted:
+            sound = self.sound_bank.get(sound_name)
+            if sound is not None:
                 try:
-                    self.sounds[sound_name].play()
+                    self.voice_manager.play(sound_name, sound)
                 except pygame.error as e:
-                    print(f"⚠️ Failed to play {sound_name}: {e}")
+                    audio_log.warning("⚠️ Failed to play %s: %s", sound_name, e)
     
     def play_music(self, music_type='menu', loop=True):
         """Play background music with fallback handling"""
@@ -114,21 +174,19 @@ class AudioManager:
             
         try:
             if self.current_music != music_type:
-                pygame.mixer.music.stop()
-                pygame.mixer.music.load(music_file)
-                pygame.mixer.music.set_volume(0.4)  # Background music quieter
-                pygame.mixer.music.play(-1 if loop else 0)
+                # Loaded and started on the streamer thread so the switch never stalls a frame
+                self.music_streamer.play(music_file, -1 if loop else 0)
                 self.current_music = music_type
                 self.music_playing = True
-                print(f"🎵 Playing {music_type} music")
+                audio_log.info("🎵 Playing %s music", music_type)
         except pygame.error as e:
-            print(f"⚠️ Failed to play music: {e}")
+            audio_log.warning("⚠️ Failed to play music: %s", e)
     
     def stop_music(self):
         """Stop background music"""
         if self.audio_enabled:
             try:
-                pygame.mixer.music.stop()
+                self.music_streamer.stop()
                 self.music_playing = False
                 self.current_music = None
             except pygame.error:
@@ -158,10 +216,10 @@ class AudioManager:
             # Stop all currently playing sounds
             if self.audio_enabled:
                 pygame.mixer.stop()
-            print("🔇 Audio muted")
+            audio_log.info("🔇 Audio muted")
         else:
             self.resume_music()
-            print("🔊 Audio unmuted")
+            audio_log.info("🔊 Audio unmuted")
         return self.muted
     
     def is_muted(self):
@@ -180,7 +238,13 @@ class AudioManager:
     def cleanup(self):
         """Clean up audio resources"""
         if self.audio_enabled:
+            if self.voice_manager:
+                audio_log.info("🎚️ Voices: %(played)d played, %(stolen)d stolen, %(dropped)d dropped",
+                               self.voice_manager.get_stats())
+            if self.loader_thread is not None:
+                self.loader_thread.join(timeout=2.0)
             try:
+                self.music_streamer.close()
                 pygame.mixer.music.stop()
                 pygame.mixer.quit()
             except pygame.error:
@@ -228,12 +292,14 @@ class VisualFeedback:
             text_surface, _ = font_manager.render_text(
                 feedback['text'], 'title', (255, 255, 0)  # Large yellow text
             )
+            text_surface = text_surface.copy()  # Cached text is shared, fade a copy
             text_surface.set_alpha(feedback['alpha'])
             
             # Draw with black outline for better visibility
             outline_surface, _ = font_manager.render_text(
                 feedback['text'], 'title', (0, 0, 0)  # Black outline
             )
+            outline_surface = outline_surface.copy()
             outline_surface.set_alpha(feedback['alpha'])
             
             # Draw outline first (multiple positions for thick outline)
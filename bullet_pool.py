@@ -0,0 +1,165 @@
+"""
+Bullet Pool for Cosmic Raiders
+Structure-of-arrays projectile storage: positions, speeds and directions live in
+preallocated NumPy arrays so moving, culling and hit-testing are vectorised
+"""
+
+import math
+import numpy as np
+import pygame
+
+BULLET_WIDTH = 4
+BULLET_HEIGHT = 12
+BULLET_BASE_SPEED = 8
+OFF_SCREEN_MARGIN = 10
+
+
+class BulletPool:
+    def __init__(self, direction, screen_height, visual_assets=None, sprite_name=None,
+                 color=(255, 255, 0), outline_color=(255, 255, 255), capacity=256):
+        self.default_direction = direction  # 1 for up (player), -1 for down (alien)
+        self.screen_height = screen_height
+        self.visual_assets = visual_assets
+        self.sprite_name = sprite_name
+        self.color = color
+        self.outline_color = outline_color
+        self.width = BULLET_WIDTH
+        self.height = BULLET_HEIGHT
+
+        # Slots [0, count) are in use, packed in firing order
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.direction = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    @property
+    def capacity(self):
+        return len(self.x)
+
+    def _grow(self):
+        """Double the preallocated arrays when every slot is in use"""
+        new_capacity = self.capacity * 2
+        for name in ('x', 'y', 'speed', 'direction', 'alive'):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
+
+    def spawn(self, x, y, speed_multiplier=1.0, direction=None):
+        """Fire a bullet and return its slot index"""
+        if self.count == self.capacity:
+            self._grow()
+
+        index = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.speed[index] = BULLET_BASE_SPEED * speed_multiplier
+        self.direction[index] = self.default_direction if direction is None else direction
+        self.alive[index] = True
+        self.count += 1
+        return index
+
+    def kill(self, index):
+        """Mark a bullet as spent; its slot is reclaimed by the next compact()"""
+        self.alive[index] = False
+
+    def clear(self):
+        """Remove every bullet"""
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def compact(self):
+        """Pack live bullets to the front of the arrays, keeping firing order"""
+        count = self.count
+        alive = self.alive[:count]
+        live_count = int(np.count_nonzero(alive))
+        if live_count == count:
+            return
+
+        keep = np.flatnonzero(alive)
+        for array in (self.x, self.y, self.speed, self.direction):
+            array[:live_count] = array[keep]
+        self.alive[:live_count] = True
+        self.alive[live_count:count] = False
+        self.count = live_count
+
+    def update(self):
+        """Move every bullet and cull off-screen ones in one vectorised step"""
+        count = self.count
+        if count == 0:
+            return
+
+        y = self.y[:count]
+        y -= self.speed[:count] * self.direction[:count]
+        off_screen = (y < -OFF_SCREEN_MARGIN) | (y > self.screen_height + OFF_SCREEN_MARGIN)
+        self.alive[:count] &= ~off_screen
+        self.compact()
+
+    def active_indices(self):
+        """Get slot indices of live bullets, in firing order"""
+        return np.flatnonzero(self.alive[:self.count])
+
+    def positions(self):
+        """Get integer (x, y) arrays of all in-use slots, matching the old per-bullet Rect
+        (built with a truncated x, then moved by assigning y, which rounds halves away from zero)"""
+        count = self.count
+        ys = self.y[:count]
+        return (np.trunc(self.x[:count]).astype(np.int32),
+                np.copysign(np.floor(np.abs(ys) + 0.5), ys).astype(np.int32))
+
+    def overlapping(self, rect):
+        """Get indices of live bullets whose rect overlaps rect, in firing order"""
+        if self.count == 0:
+            return np.empty(0, dtype=np.intp)
+
+        xs, ys = self.positions()
+        hit = (self.alive[:self.count] &
+               (xs < rect.right) & (xs + self.width > rect.left) &
+               (ys < rect.bottom) & (ys + self.height > rect.top))
+        return np.flatnonzero(hit)
+
+    def get_rect(self, index):
+        """Get the collision rect of one bullet"""
+        y = float(self.y[index])
+        return pygame.Rect(int(self.x[index]), int(math.copysign(math.floor(abs(y) + 0.5), y)),
+                           self.width, self.height)
+
+    def add_to_batch(self, batch, screen, atlas=None):
+        """Queue every live bullet for a batched blit (fallback rects are drawn now and returned)"""
+        indices = self.active_indices()
+        if len(indices) == 0:
+            return []
+
+        xs = self.x[indices].tolist()
+        ys = self.y[indices].tolist()
+
+        # Use enhanced laser sprites if available
+        bullet_sprite = self.visual_assets.get_sprite(self.sprite_name) if self.visual_assets else None
+        if bullet_sprite:
+            packed = atlas.lookup(bullet_sprite) if atlas else None
+            if packed:
+                page, area = packed
+                batch.extend((page, position, area) for position in zip(xs, ys))
+            else:
+                batch.extend((bullet_sprite, position) for position in zip(xs, ys))
+            return []
+
+        # Fallback to original drawing
+        rects = []
+        for x, y in zip(xs, ys):
+            pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
+            rects.append(pygame.draw.rect(screen, self.outline_color,
+                                          (x - 1, y - 1, self.width + 2, self.height + 2), 1))
+        return rects
+
+    def draw(self, screen, atlas=None):
+        """Draw every live bullet with a single batched blit and return the areas covered"""
+        batch = []
+        rects = self.add_to_batch(batch, screen, atlas)
+        rects.extend(screen.blits(batch))
+        return rects
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.count]))
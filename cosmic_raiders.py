@@ -1,9 +1,13 @@
+import startup_profiler
+startup_profiler.start_if_requested()  # Before the other imports, so --profile-startup can time them
 import pygame
 import random
 import sys
 import os
 import math
+import bisect
 from enum import Enum
+from collections import OrderedDict
 from high_score_manager import HighScoreManager
 from visual_assets import VisualAssets
 from alien_design_manager import AlienDesignManager
@@ -11,15 +15,46 @@ from difficulty_manager import DifficultyManager
 from ui_manager import UIManager
 from spaceship_designer import SpaceshipDesigner
 from progressive_spawner import ProgressiveSpawner
-from audio_manager import AudioManager
+from audio_manager import AudioManager, MIXER_SETTINGS
+from input_recorder import KeyState, InputRecorder
+from spatial_hash import SpatialHash
+from bullet_pool import BulletPool
+from object_pool import ObjectPool
+from dirty_rect_renderer import DirtyRectRenderer
+from asset_finalizer import AssetFinalizer
+from starfield import Starfield
+from parallax_background import ParallaxBackground
+from sprite_atlas import SpriteAtlas
+from performance_monitor import PerformanceMonitor, NullPhaseTimer
+import game_logger
+from game_logger import get_logger
 
-# Initialize Pygame
-pygame.init()
+# Per-subsystem loggers (levels can be changed via game_logger / COSMIC_RAIDERS_LOG)
+game_log = get_logger("game")
+combat_log = get_logger("combat")
+spawn_log = get_logger("spawner")
+alien_log = get_logger("aliens")
+ui_log = get_logger("ui")
+
+startup_profiler.mark("imports")
 
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+FRAME_MS = 1000.0 / FPS  # Fixed simulation timestep
+COLLISION_CELL_SIZE = 64  # Spatial hash cell size for collision checks
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by FontManager
+PERFORMANCE_REPORT_PATH = "performance_report.json"  # F4 dump when --perf-report is not given
+
+# Point sizes for FontManager.render_text size names
+TEXT_SIZES = {
+    'small': 14,
+    'medium': 18,
+    'large': 24,
+    'title': 32,
+    'huge': 48
+}
 
 # Colors
 BLACK = (0, 0, 0)
@@ -34,6 +69,16 @@ CYAN = (0, 255, 255)
 MAGENTA = (255, 0, 255)
 GRAY = (128, 128, 128)
 
+def init_pygame(headless=False):
+    """Initialize the pygame subsystems a session needs (headless sessions skip display and audio)"""
+    if headless:
+        pygame.font.init()
+    else:
+        pygame.mixer.pre_init(**MIXER_SETTINGS)  # pygame.init() opens the mixer, so use the audio engine's settings
+        pygame.init()
+    startup_profiler.mark("pygame.init")
+
+
 class GameState(Enum):
     MENU = 1
     PLAYING = 2
@@ -45,25 +90,31 @@ class GameState(Enum):
     CREDITS = 8
 
 class FontManager:
-    def __init__(self):
+    def __init__(self, max_cached_texts=TEXT_CACHE_SIZE):
         self.fonts = {}
         self.font_path = "fonts/Pixeled.ttf"
         self.font_loaded = False
         
+        # LRU cache of rendered text surfaces keyed by (text, size, color, antialias)
+        self.text_cache = OrderedDict()
+        self.max_cached_texts = max_cached_texts
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
         # Try to load custom font
         if os.path.exists(self.font_path):
             try:
                 # Test load the font
                 test_font = pygame.font.Font(self.font_path, 16)
                 self.font_loaded = True
-                print("🎮 Font System: Using custom Pixeled.ttf")
-                print("✅ Custom pixel font loaded successfully!")
-                print("🎨 Authentic retro arcade styling enabled!")
+                ui_log.info("🎮 Font System: Using custom Pixeled.ttf")
+                ui_log.info("✅ Custom pixel font loaded successfully!")
+                ui_log.info("🎨 Authentic retro arcade styling enabled!")
             except pygame.error:
-                print("🎮 Font System: Custom font failed to load, using system fonts")
+                ui_log.warning("🎮 Font System: Custom font failed to load, using system fonts")
                 self.font_loaded = False
         else:
-            print("🎮 Font System: Custom font not found, using system fonts")
+            ui_log.info("🎮 Font System: Custom font not found, using system fonts")
             self.font_loaded = False
     
     def get_font(self, size):
@@ -78,25 +129,51 @@ class FontManager:
                 self.fonts[size] = pygame.font.Font(None, size)
         return self.fonts[size]
     
-    def render_text(self, text, size='medium', color=WHITE, center_pos=None):
-        """Render text with different sizes"""
-        size_map = {
-            'small': 14,
-            'medium': 18,
-            'large': 24,
-            'title': 32,
-            'huge': 48
-        }
-        
-        font_size = size_map.get(size, 18)
-        font = self.get_font(font_size)
-        text_surface = font.render(str(text), True, color)
+    def render_text(self, text, size='medium', color=WHITE, center_pos=None, antialias=True, cache=True):
+        """Render text with different sizes (cached surfaces are shared - copy before modifying)"""
+        font_size = TEXT_SIZES.get(size, 18)
+        text = str(text)
+        
+        if cache:
+            key = (text, font_size, tuple(color), antialias)
+            text_surface = self.text_cache.get(key)
+            if text_surface is not None:
+                self.text_cache.move_to_end(key)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+                text_surface = self.get_font(font_size).render(text, antialias, color)
+                self.text_cache[key] = text_surface
+                if len(self.text_cache) > self.max_cached_texts:
+                    self.text_cache.popitem(last=False)  # Evict least recently used
+        else:
+            # For text whose color changes every frame (would only churn the cache)
+            text_surface = self.get_font(font_size).render(text, antialias, color)
         
         if center_pos:
             text_rect = text_surface.get_rect(center=center_pos)
             return text_surface, text_rect
         else:
             return text_surface, text_surface.get_rect()
+    
+    def invalidate(self, text=None):
+        """Drop cached text surfaces (all of them, or just those for one string)"""
+        if text is None:
+            self.text_cache.clear()
+        else:
+            text = str(text)
+            for key in [key for key in self.text_cache if key[0] == text]:
+                del self.text_cache[key]
+    
+    def get_cache_stats(self):
+        """Get text cache size and hit/miss counters"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            'entries': len(self.text_cache),
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'hit_rate': self.cache_hits / lookups if lookups else 0.0
+        }
 
 class Player:
     def __init__(self, x, y, visual_assets=None):
@@ -123,8 +200,7 @@ class Player:
         if self.visual_assets:
             ship_sprite = self.visual_assets.get_sprite('player')
             if ship_sprite:
-                screen.blit(ship_sprite, (self.x, self.y))
-                return
+                return screen.blit(ship_sprite, (self.x, self.y))
         
         # Fallback to original drawing
         pygame.draw.rect(screen, GREEN, self.rect)
@@ -133,52 +209,14 @@ class Player:
             (self.x, self.y + self.height),
             (self.x + self.width, self.y + self.height)
         ])
-
-class Bullet:
-    def __init__(self, x, y, direction, speed_multiplier=1.0, visual_assets=None):
-        self.x = x
-        self.y = y
-        self.width = 4
-        self.height = 12
-        base_speed = 8
-        self.speed = base_speed * speed_multiplier
-        self.direction = direction  # 1 for up (player), -1 for down (alien)
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-        self.visual_assets = visual_assets
-        
-    def update(self):
-        self.y -= self.speed * self.direction
-        self.rect.y = self.y
-        
-    def is_off_screen(self):
-        return self.y < -10 or self.y > SCREEN_HEIGHT + 10
-        
-    def draw(self, screen):
-        # Use enhanced laser sprites if available
-        if self.visual_assets:
-            if self.direction == 1:  # Player bullet
-                bullet_sprite = self.visual_assets.get_sprite('player_bullet')
-            else:  # Alien bullet
-                bullet_sprite = self.visual_assets.get_sprite('alien_bullet')
-            
-            if bullet_sprite:
-                screen.blit(bullet_sprite, (self.x, self.y))
-                return
-        
-        # Fallback to original drawing
-        if self.direction == 1:  # Player bullet
-            color = YELLOW
-            pygame.draw.rect(screen, color, self.rect)
-            pygame.draw.rect(screen, WHITE, 
-                           (self.x - 1, self.y - 1, self.width + 2, self.height + 2), 1)
-        else:  # Alien bullet
-            color = RED
-            pygame.draw.rect(screen, color, self.rect)
-            pygame.draw.rect(screen, (255, 100, 100), 
-                           (self.x - 1, self.y - 1, self.width + 2, self.height + 2), 1)
+        return self.rect.copy()
 
 class HitEffect:
     def __init__(self, x, y, effect_type="explosion", visual_assets=None):
+        self.reset(x, y, effect_type, visual_assets)
+        
+    def reset(self, x, y, effect_type="explosion", visual_assets=None):
+        """Re-initialise a pooled effect in place of construction"""
         self.x = x
         self.y = y
         self.effect_type = effect_type
@@ -201,35 +239,56 @@ class HitEffect:
         
         return self.timer < self.max_time
     
+    def get_sprite(self):
+        """Get the current explosion frame sprite (None when using the fallback effect)"""
+        if self.effect_type == "explosion" and self.visual_assets:
+            return self.visual_assets.get_explosion_frame(self.explosion_frame)
+        return None
+    
+    def get_sprite_rect(self, sprite):
+        """Get where the sprite is drawn, centered on the effect"""
+        sprite_rect = sprite.get_rect()
+        sprite_rect.center = (int(self.x), int(self.y))
+        return sprite_rect
+    
     def draw(self, screen, font_manager):
         if self.effect_type == "explosion":
             # Use enhanced explosion sprites if available
-            if self.visual_assets:
-                explosion_sprite = self.visual_assets.get_explosion_frame(self.explosion_frame)
-                if explosion_sprite:
-                    # Center the explosion sprite
-                    sprite_rect = explosion_sprite.get_rect()
-                    sprite_rect.center = (int(self.x), int(self.y))
-                    screen.blit(explosion_sprite, sprite_rect)
-                    return
+            explosion_sprite = self.get_sprite()
+            if explosion_sprite:
+                return screen.blit(explosion_sprite, self.get_sprite_rect(explosion_sprite))
             
             # Fallback explosion effect
             colors = [YELLOW, RED, WHITE]
+            drawn_rect = pygame.Rect(int(self.x), int(self.y), 0, 0)
             for i, color in enumerate(colors):
                 radius = max(1, self.size - i * 3)
                 if radius > 0:
-                    pygame.draw.circle(screen, color, (int(self.x), int(self.y)), radius)
+                    drawn_rect.union_ip(pygame.draw.circle(screen, color, (int(self.x), int(self.y)), radius))
             
             # Draw explosion text
             if self.timer < 20:
                 explosion_text, explosion_rect = font_manager.render_text(
                     "💥", 'medium', WHITE, (self.x, self.y - 10)
                 )
-                screen.blit(explosion_text, explosion_rect)
+                drawn_rect.union_ip(screen.blit(explosion_text, explosion_rect))
+            return drawn_rect
 
 class Alien:
     def __init__(self, x, y, alien_type="basic", difficulty_level=1, visual_assets=None, 
-                 alien_design_manager=None, difficulty_manager=None, spaceship_designer=None, progressive_spawner=None):
+                 alien_design_manager=None, difficulty_manager=None, spaceship_designer=None, progressive_spawner=None,
+                 rng=None):
+        self.spaceship_key = None
+        self.spaceship_sprite = None
+        self.spaceship_flash_sprite = None
+        self.reset(x, y, alien_type, difficulty_level, visual_assets, alien_design_manager,
+                   difficulty_manager, spaceship_designer, progressive_spawner, rng)
+    
+    def reset(self, x, y, alien_type="basic", difficulty_level=1, visual_assets=None, 
+              alien_design_manager=None, difficulty_manager=None, spaceship_designer=None, progressive_spawner=None,
+              rng=None):
+        """Re-initialise a pooled alien in place of construction"""
+        self.rng = rng if rng is not None else random  # Session RNG for deterministic runs
         self.x = x
         self.y = y
         self.initial_x = x
@@ -269,7 +328,7 @@ class Alien:
         
         self.vertical_speed = 0.5 * speed_mult
         self.horizontal_speed = self.base_speed * speed_mult
-        self.horizontal_direction = random.choice([-1, 1])
+        self.horizontal_direction = self.rng.choice([-1, 1])
         
         # Enhanced shooting with progressive aggression
         base_shoot_chance = {'basic': 0.001, 'scout': 0.0015, 'warrior': 0.0008, 'commander': 0.002}.get(alien_type, 0.001)
@@ -294,24 +353,35 @@ class Alien:
         # Damage flash effect
         self.damage_flash = 0
         
-        # Get spaceship design
-        self.spaceship_sprite = None
-        if spaceship_designer:
+        # Get spaceship design (a pooled alien keeps its sprite when type and level match)
+        spaceship_key = (id(spaceship_designer), alien_type, difficulty_level)
+        if spaceship_designer and self.spaceship_sprite and spaceship_key == self.spaceship_key:
+            self.width = self.spaceship_sprite.get_width()
+            self.height = self.spaceship_sprite.get_height()
+            self.rect = pygame.Rect(x, y, self.width, self.height)
+        elif spaceship_designer:
+            self.spaceship_sprite = None
+            self.spaceship_key = spaceship_key
             ship_class = spaceship_designer.get_ship_class_for_alien_type(alien_type)
             self.spaceship_sprite = spaceship_designer.get_spaceship_design(ship_class, difficulty_level)
+            self.spaceship_flash_sprite = None  # Fetched (and built if needed) on the first hit
             if self.spaceship_sprite:
                 # Adjust rect size to match spaceship
                 self.width = self.spaceship_sprite.get_width()
                 self.height = self.spaceship_sprite.get_height()
                 self.rect = pygame.Rect(x, y, self.width, self.height)
-                print(f"🛸 Created {alien_type} spaceship (Level {difficulty_level}) - {ship_class} class, Size: {self.width}x{self.height}")
+                alien_log.debug("🛸 Created %s spaceship (Level %d) - %s class, Size: %dx%d",
+                                alien_type, difficulty_level, ship_class, self.width, self.height)
             else:
-                print(f"⚠️ Failed to create spaceship for {alien_type} (Level {difficulty_level})")
+                alien_log.warning("⚠️ Failed to create spaceship for %s (Level %d)", alien_type, difficulty_level)
         else:
-            print(f"⚠️ No spaceship designer available for {alien_type}")
+            self.spaceship_sprite = None
+            self.spaceship_flash_sprite = None
+            self.spaceship_key = None
+            alien_log.debug("⚠️ No spaceship designer available for %s", alien_type)
         
         if not hasattr(self, 'spaceship_sprite') or not self.spaceship_sprite:
-            print(f"🔧 DEBUG: {alien_type} will use fallback rendering")
+            alien_log.debug("🔧 %s will use fallback rendering", alien_type)
     
     def take_damage(self, damage=1):
         """Take damage and return True if destroyed"""
@@ -361,16 +431,16 @@ class Alien:
         self.rect.y = int(self.y)
         
         # Special ability: teleport dodge (high level commanders)
-        if 'teleport_dodge' in self.special_abilities and random.random() < 0.002:  # More frequent
-            self.x = random.randint(50, SCREEN_WIDTH - 50)
+        if 'teleport_dodge' in self.special_abilities and self.rng.random() < 0.002:  # More frequent
+            self.x = self.rng.randint(50, SCREEN_WIDTH - 50)
     
     def should_shoot(self):
         """Enhanced shooting logic with higher frequency"""
-        base_chance = random.random() < self.shoot_chance
+        base_chance = self.rng.random() < self.shoot_chance
         
         # Rapid fire ability (more frequent)
         if 'rapid_fire' in self.special_abilities:
-            return base_chance or (random.random() < self.shoot_chance * 0.8)
+            return base_chance or (self.rng.random() < self.shoot_chance * 0.8)
         
         return base_chance
     
@@ -378,12 +448,13 @@ class Alien:
         """Enhanced drawing with spaceship designs"""
         # Use spaceship designs first
         if hasattr(self, 'spaceship_sprite') and self.spaceship_sprite:
-            # Apply damage flash effect to spaceship
-            if self.damage_flash > 0:
-                # Create flashing effect
-                flash_surface = self.spaceship_sprite.copy()
-                flash_surface.fill((255, 255, 255, 100), special_flags=pygame.BLEND_ADD)
-                screen.blit(flash_surface, (self.x, self.y))
+            # Apply damage flash effect to spaceship (variant built on the first hit)
+            if self.damage_flash > 0 and self.spaceship_flash_sprite is None and self.spaceship_designer:
+                ship_class = self.spaceship_designer.get_ship_class_for_alien_type(self.alien_type)
+                self.spaceship_flash_sprite = self.spaceship_designer.get_spaceship_design(ship_class, self.difficulty_level,
+                                                                                           flash=True)
+            if self.damage_flash > 0 and self.spaceship_flash_sprite:
+                screen.blit(self.spaceship_flash_sprite, (self.x, self.y))
             else:
                 screen.blit(self.spaceship_sprite, (self.x, self.y))
             
@@ -394,15 +465,11 @@ class Alien:
         
         # Fallback to alien design manager
         if self.alien_design_manager:
-            alien_sprite = self.alien_design_manager.get_alien_design(self.alien_type, self.difficulty_level)
+            # Damage flash uses the cached flash variant of the design (built on the first hit)
+            alien_sprite = self.alien_design_manager.get_alien_design(self.alien_type, self.difficulty_level,
+                                                                      flash=self.damage_flash > 0)
             if alien_sprite:
-                # Apply damage flash effect
-                if self.damage_flash > 0:
-                    flash_surface = alien_sprite.copy()
-                    flash_surface.fill((255, 255, 255, 100), special_flags=pygame.BLEND_ADD)
-                    screen.blit(flash_surface, (self.x, self.y))
-                else:
-                    screen.blit(alien_sprite, (self.x, self.y))
+                screen.blit(alien_sprite, (self.x, self.y))
                 
                 # Health bar for multi-health aliens
                 if self.max_health > 1:
@@ -410,7 +477,7 @@ class Alien:
                 return
         
         # Final fallback to basic shapes (this should show what's happening)
-        print(f"🔧 DEBUG: Drawing fallback shape for {self.alien_type} at ({self.x}, {self.y})")
+        alien_log.debug("🔧 Drawing fallback shape for %s at (%s, %s)", self.alien_type, self.x, self.y)
         draw_color = self.color
         if self.damage_flash > 0:
             draw_color = (255, 255, 255)
@@ -471,7 +538,7 @@ class Alien:
         # Enhanced movement with level scaling
         self.vertical_speed = 0.5 * (1.0 + (difficulty_level - 1) * 0.1)  # Slightly faster descent per level
         self.horizontal_speed = self.base_speed * (1.0 + (difficulty_level - 1) * 0.2)  # Significant horizontal speed increase
-        self.horizontal_direction = random.choice([-1, 1])
+        self.horizontal_direction = self.rng.choice([-1, 1])
         
         # Enhanced shooting with level scaling
         base_shoot_chance = {'basic': 0.001, 'scout': 0.0015, 'warrior': 0.0008, 'commander': 0.002}.get(alien_type, 0.001)
@@ -540,16 +607,16 @@ class Alien:
         self.rect.y = int(self.y)
         
         # Special ability: teleport dodge (high level commanders)
-        if 'teleport_dodge' in self.special_abilities and random.random() < 0.001:
-            self.x = random.randint(50, SCREEN_WIDTH - 50)
+        if 'teleport_dodge' in self.special_abilities and self.rng.random() < 0.001:
+            self.x = self.rng.randint(50, SCREEN_WIDTH - 50)
     
     def should_shoot(self):
         """Enhanced shooting logic"""
-        base_chance = random.random() < self.shoot_chance
+        base_chance = self.rng.random() < self.shoot_chance
         
         # Rapid fire ability
         if 'rapid_fire' in self.special_abilities:
-            return base_chance or (random.random() < self.shoot_chance * 0.5)
+            return base_chance or (self.rng.random() < self.shoot_chance * 0.5)
         
         return base_chance
     
@@ -557,16 +624,11 @@ class Alien:
         """Enhanced drawing with level-appropriate designs and damage effects"""
         # Use enhanced alien designs if available
         if self.alien_design_manager:
-            alien_sprite = self.alien_design_manager.get_alien_design(self.alien_type, self.difficulty_level)
+            # Damage flash uses the cached flash variant of the design (built on the first hit)
+            alien_sprite = self.alien_design_manager.get_alien_design(self.alien_type, self.difficulty_level,
+                                                                      flash=self.damage_flash > 0)
             if alien_sprite:
-                # Apply damage flash effect
-                if self.damage_flash > 0:
-                    # Create flashing effect
-                    flash_surface = alien_sprite.copy()
-                    flash_surface.fill((255, 255, 255, 100), special_flags=pygame.BLEND_ADD)
-                    screen.blit(flash_surface, (self.x, self.y))
-                else:
-                    screen.blit(alien_sprite, (self.x, self.y))
+                screen.blit(alien_sprite, (self.x, self.y))
                 
                 # Health bar for multi-health aliens
                 if self.max_health > 1:
@@ -640,7 +702,7 @@ class Alien:
         
         # Horizontal speed increases with level (0.2x per level)
         self.horizontal_speed = 1.0 + (difficulty_level - 1) * 0.2
-        self.horizontal_direction = random.choice([-1, 1])  # Random initial direction
+        self.horizontal_direction = self.rng.choice([-1, 1])  # Random initial direction
         
         # Dynamic shooting based on difficulty
         base_shoot_chance = 0.001
@@ -680,18 +742,22 @@ class Alien:
         self.rect.y = self.y
         
     def should_shoot(self):
-        return random.random() < self.shoot_chance
+        return self.rng.random() < self.shoot_chance
         
+    def get_sprite(self):
+        """Get the sprite this alien is drawn with (None when using fallback shapes)"""
+        if self.visual_assets:
+            return self.visual_assets.get_sprite(f'alien_{self.alien_type}')
+        return None
+    
     def draw(self, screen):
         # Use enhanced alien sprites if available
-        if self.visual_assets:
-            alien_sprite = self.visual_assets.get_sprite(f'alien_{self.alien_type}')
-            if alien_sprite:
-                screen.blit(alien_sprite, (self.x, self.y))
-                return
+        alien_sprite = self.get_sprite()
+        if alien_sprite:
+            return screen.blit(alien_sprite, (self.x, self.y))
         
         # Fallback to original drawing
-        pygame.draw.rect(screen, self.color, self.rect)
+        drawn_rect = pygame.draw.rect(screen, self.color, self.rect)
         
         # Draw different shapes based on alien type
         if self.alien_type == "scout":
@@ -715,6 +781,7 @@ class Alien:
         else:  # basic
             pygame.draw.ellipse(screen, WHITE, 
                               (self.x + 3, self.y + 3, self.width - 6, self.height - 6))
+        return drawn_rect
     
     def is_at_bottom(self):
         """Check if alien has reached the bottom of the screen"""
@@ -722,7 +789,10 @@ class Alien:
 
 class CosmicFormation:
     def __init__(self, difficulty_level=1, visual_assets=None, alien_design_manager=None, 
-                 difficulty_manager=None, spaceship_designer=None, progressive_spawner=None):
+                 difficulty_manager=None, spaceship_designer=None, progressive_spawner=None, rng=None,
+                 alien_pool=None):
+        self.rng = rng if rng is not None else random  # Session RNG for deterministic runs
+        self.alien_pool = alien_pool  # Optional ObjectPool reusing Alien instances
         self.difficulty_level = difficulty_level
         self.visual_assets = visual_assets
         self.alien_design_manager = alien_design_manager
@@ -753,8 +823,8 @@ class CosmicFormation:
         # Generate formation based on level
         self.generate_formation()
         
-        print(f"🌌 Generated {len(self.formation_queue)} aliens for Level {difficulty_level} formation")
-        print(f"📊 Max active: {self.max_active_aliens}, Spawn delay: {self.spawn_delay/60:.1f}s")
+        spawn_log.info("🌌 Generated %d aliens for Level %d formation", len(self.formation_queue), difficulty_level)
+        spawn_log.info("📊 Max active: %d, Spawn delay: %.1fs", self.max_active_aliens, self.spawn_delay / 60)
     
     def generate_formation(self):
         """Generate level-appropriate formation with enhanced difficulty"""
@@ -776,7 +846,7 @@ class CosmicFormation:
         formation_func()
         
         # Shuffle for more dynamic spawning
-        random.shuffle(self.formation_queue)
+        self.rng.shuffle(self.formation_queue)
     
     def create_line_formation(self):
         """Enhanced line formation with progressive scaling"""
@@ -966,11 +1036,11 @@ class CosmicFormation:
         
         # Fallback distribution with more variety at higher levels
         if self.difficulty_level <= 2:
-            return random.choice(['basic', 'basic', 'basic', 'scout'])
+            return self.rng.choice(['basic', 'basic', 'basic', 'scout'])
         elif self.difficulty_level <= 5:
-            return random.choice(['basic', 'basic', 'scout', 'scout', 'warrior'])
+            return self.rng.choice(['basic', 'basic', 'scout', 'scout', 'warrior'])
         else:
-            return random.choice(['basic', 'scout', 'scout', 'warrior', 'warrior', 'commander'])
+            return self.rng.choice(['basic', 'scout', 'scout', 'warrior', 'warrior', 'commander'])
     
     def update(self):
         """Update formation with enhanced spawning"""
@@ -980,7 +1050,7 @@ class CosmicFormation:
             
             # Remove aliens that are off screen or at bottom
             if alien.is_at_bottom() or alien.y > SCREEN_HEIGHT:
-                self.active_aliens.remove(alien)
+                self.discard_alien(alien)
         
         # Spawn new aliens with progressive system
         self.spawn_timer -= 1
@@ -989,13 +1059,12 @@ class CosmicFormation:
             len(self.formation_queue) > 0):
             
             x, y, alien_type = self.formation_queue.pop(0)
-            new_alien = Alien(x, y, alien_type, self.difficulty_level, 
-                            self.visual_assets, self.alien_design_manager, self.difficulty_manager,
-                            self.spaceship_designer, self.progressive_spawner)
+            new_alien = self.create_alien(x, y, alien_type)
             self.active_aliens.append(new_alien)
             self.spawn_timer = self.spawn_delay
             
-            print(f"👾 Spawned {alien_type} spaceship at ({x}, {y}) - Active: {len(self.active_aliens)}/{self.max_active_aliens}")
+            spawn_log.debug("👾 Spawned %s spaceship at (%s, %s) - Active: %d/%d",
+                            alien_type, x, y, len(self.active_aliens), self.max_active_aliens)
     
     def draw(self, screen):
         """Draw all active aliens"""
@@ -1030,7 +1099,7 @@ class CosmicFormation:
         formation_func()
         
         # Shuffle for more dynamic spawning
-        random.shuffle(self.formation_queue)
+        self.rng.shuffle(self.formation_queue)
     
     def create_line_formation(self):
         """Enhanced line formation with level scaling"""
@@ -1182,11 +1251,11 @@ class CosmicFormation:
         
         # Fallback distribution
         if self.difficulty_level <= 2:
-            return random.choice(['basic', 'basic', 'basic', 'scout'])
+            return self.rng.choice(['basic', 'basic', 'basic', 'scout'])
         elif self.difficulty_level <= 5:
-            return random.choice(['basic', 'basic', 'scout', 'warrior'])
+            return self.rng.choice(['basic', 'basic', 'scout', 'warrior'])
         else:
-            return random.choice(['basic', 'scout', 'warrior', 'commander'])
+            return self.rng.choice(['basic', 'scout', 'warrior', 'commander'])
     
     def update(self):
         """Update formation with enhanced spawning"""
@@ -1196,7 +1265,7 @@ class CosmicFormation:
             
             # Remove aliens that are off screen or at bottom
             if alien.is_at_bottom() or alien.y > SCREEN_HEIGHT:
-                self.active_aliens.remove(alien)
+                self.discard_alien(alien)
         
         # Spawn new aliens
         self.spawn_timer -= 1
@@ -1205,13 +1274,11 @@ class CosmicFormation:
             len(self.formation_queue) > 0):
             
             x, y, alien_type = self.formation_queue.pop(0)
-            new_alien = Alien(x, y, alien_type, self.difficulty_level, 
-                            self.visual_assets, self.alien_design_manager, self.difficulty_manager,
-                            self.spaceship_designer, self.progressive_spawner)
+            new_alien = self.create_alien(x, y, alien_type)
             self.active_aliens.append(new_alien)
             self.spawn_timer = self.spawn_delay
             
-            print(f"👾 Spawned {alien_type} alien at ({x}, {y})")
+            spawn_log.debug("👾 Spawned %s alien at (%s, %s)", alien_type, x, y)
     
     def draw(self, screen):
         """Draw all active aliens"""
@@ -1242,7 +1309,7 @@ class CosmicFormation:
         formation_func = formations.get(self.difficulty_level, formations[((self.difficulty_level - 1) % 8) + 1])
         self.formation_queue = formation_func()
         
-        print(f"🌌 Generated {len(self.formation_queue)} aliens for Level {self.difficulty_level} formation")
+        spawn_log.info("🌌 Generated %d aliens for Level %d formation", len(self.formation_queue), self.difficulty_level)
     
     def create_horizontal_line(self):
         """Level 1: Simple horizontal line"""
@@ -1253,7 +1320,7 @@ class CosmicFormation:
             y_pos = 50 + layer * 60
             for i in range(5):  # 5 aliens per layer
                 x_pos = 150 + i * 100
-                alien_type = "basic" if layer == 0 else random.choice(["basic", "scout"])
+                alien_type = "basic" if layer == 0 else self.rng.choice(["basic", "scout"])
                 aliens.append((x_pos, y_pos, alien_type))
         
         return aliens
@@ -1270,7 +1337,7 @@ class CosmicFormation:
                 left_x = SCREEN_WIDTH//2 - (i + 1) * 40 - layer * 20
                 right_x = SCREEN_WIDTH//2 + (i + 1) * 40 + layer * 20
                 
-                alien_type = random.choice(["basic", "scout", "warrior"])
+                alien_type = self.rng.choice(["basic", "scout", "warrior"])
                 aliens.append((left_x, y_pos + i * 15, alien_type))
                 if i > 0:  # Don't duplicate center alien
                     aliens.append((right_x, y_pos + i * 15, alien_type))
@@ -1294,7 +1361,7 @@ class CosmicFormation:
                 x = center_x + radius * math.cos(rad)
                 y = center_y + radius * math.sin(rad) * 0.5  # Flatten the arc
                 
-                alien_type = random.choice(["basic", "scout", "warrior"])
+                alien_type = self.rng.choice(["basic", "scout", "warrior"])
                 aliens.append((x, y, alien_type))
         
         return aliens
@@ -1321,7 +1388,7 @@ class CosmicFormation:
                     elif row < triangle_size // 2:
                         alien_type = "warrior"
                     else:
-                        alien_type = random.choice(["basic", "scout"])
+                        alien_type = self.rng.choice(["basic", "scout"])
                     
                     aliens.append((x_pos, y_pos, alien_type))
         
@@ -1344,7 +1411,7 @@ class CosmicFormation:
                     x_offset = (col - aliens_in_row // 2) * 40
                     y_offset = -row * 25
                     
-                    alien_type = "commander" if row == 0 else random.choice(["warrior", "scout"])
+                    alien_type = "commander" if row == 0 else self.rng.choice(["warrior", "scout"])
                     aliens.append((center_x + x_offset, center_y + y_offset, alien_type))
             
             # Bottom half of diamond
@@ -1354,7 +1421,7 @@ class CosmicFormation:
                     x_offset = (col - aliens_in_row // 2) * 40
                     y_offset = (size - row) * 25
                     
-                    alien_type = random.choice(["basic", "scout"])
+                    alien_type = self.rng.choice(["basic", "scout"])
                     aliens.append((center_x + x_offset, center_y + y_offset, alien_type))
         
         return aliens
@@ -1377,7 +1444,7 @@ class CosmicFormation:
                 x = center_x + radius * math.cos(rad)
                 y = center_y + radius * math.sin(rad) * 0.6
                 
-                alien_type = random.choice(["basic", "scout", "warrior", "commander"])
+                alien_type = self.rng.choice(["basic", "scout", "warrior", "commander"])
                 aliens.append((x, y, alien_type))
         
         return aliens
@@ -1421,7 +1488,7 @@ class CosmicFormation:
                 wave_y = y_base + math.sin(x * 0.02 + layer) * 30
                 
                 if 50 < x < SCREEN_WIDTH - 50:  # Keep within screen bounds
-                    alien_type = random.choice(["basic", "scout", "warrior"])
+                    alien_type = self.rng.choice(["basic", "scout", "warrior"])
                     aliens.append((x, wave_y, alien_type))
         
         return aliens
@@ -1434,12 +1501,10 @@ class CosmicFormation:
             self.spawn_timer <= 0):
             
             x, y, alien_type = self.formation_queue.pop(0)
-            new_alien = Alien(x, y, alien_type, self.difficulty_level, 
-                            self.visual_assets, self.alien_design_manager, self.difficulty_manager,
-                            self.spaceship_designer, self.progressive_spawner)
+            new_alien = self.create_alien(x, y, alien_type)
             self.active_aliens.append(new_alien)
             self.spawn_timer = self.spawn_delay
-            print(f"👾 Spawned {alien_type} alien at ({x:.0f}, {y:.0f})")
+            spawn_log.debug("👾 Spawned %s alien at (%.0f, %.0f)", alien_type, x, y)
         
         # Update spawn timer
         if self.spawn_timer > 0:
@@ -1451,25 +1516,63 @@ class CosmicFormation:
             
             # Remove aliens that reached the bottom or went off screen
             if alien.is_at_bottom() or alien.y > SCREEN_HEIGHT + 50:
-                self.active_aliens.remove(alien)
+                self.discard_alien(alien)
                 if alien.is_at_bottom():
                     return "game_over"  # Signal game over
         
         return "continue"
     
+    def create_alien(self, x, y, alien_type):
+        """Create an alien, reusing a pooled instance when available"""
+        args = (x, y, alien_type, self.difficulty_level, self.visual_assets, self.alien_design_manager,
+                self.difficulty_manager, self.spaceship_designer, self.progressive_spawner, self.rng)
+        if self.alien_pool:
+            return self.alien_pool.acquire(*args)
+        return Alien(*args)
+    
+    def release_alien(self, alien):
+        """Hand a no-longer-active alien back to the pool"""
+        if self.alien_pool:
+            self.alien_pool.release(alien)
+    
+    def discard_alien(self, alien):
+        """Remove an active alien and release it"""
+        self.active_aliens.remove(alien)
+        self.release_alien(alien)
+    
+    def release_all(self):
+        """Release every active alien (formation is being replaced)"""
+        if self.alien_pool:
+            self.alien_pool.release_all(self.active_aliens)
+        self.active_aliens = []
+    
     def remove_alien(self, alien_to_remove):
         """Remove an alien from active aliens"""
         if alien_to_remove in self.active_aliens:
-            self.active_aliens.remove(alien_to_remove)
+            self.discard_alien(alien_to_remove)
     
     def get_shooting_aliens(self):
         """Get all active aliens that can shoot"""
         return self.active_aliens
     
-    def draw(self, screen):
-        """Draw all active aliens"""
+    def add_to_batch(self, batch, screen, atlas=None):
+        """Queue sprite aliens for a batched blit; fallback aliens are drawn now and their areas returned"""
+        drawn_rects = []
         for alien in self.active_aliens:
-            alien.draw(screen)
+            alien_sprite = alien.get_sprite()
+            if alien_sprite:
+                position = (alien.x, alien.y)
+                batch.append(atlas.source(alien_sprite, position) if atlas else (alien_sprite, position))
+            else:
+                drawn_rects.append(alien.draw(screen))
+        return drawn_rects
+    
+    def draw(self, screen, atlas=None):
+        """Draw all active aliens in one batched blit and return the areas they covered"""
+        batch = []
+        drawn_rects = self.add_to_batch(batch, screen, atlas)
+        drawn_rects.extend(screen.blits(batch))
+        return drawn_rects
     
     def is_formation_complete(self):
         """Check if all aliens in formation have been spawned and destroyed"""
@@ -1480,49 +1583,91 @@ class CosmicFormation:
         return len(self.active_aliens) + len(self.formation_queue)
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, seed=None, dirty_rects=False, parallax=False, sprite_atlas=False):
+        self.headless = headless
+        
+        # One injectable RNG for all gameplay randomness in this session
+        self.seed = seed
+        self.run_seed = seed
+        self.rng = random.Random(seed)
+        init_pygame(headless)
+        
         try:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-            pygame.display.set_caption("Cosmic Raiders")
+            if headless:
+                # Headless simulation runs without a window or display surface
+                self.screen = None
+            else:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+                pygame.display.set_caption("Cosmic Raiders")
             self.clock = pygame.time.Clock()
+            startup_profiler.mark("display")
             self.font_manager = FontManager()
+            startup_profiler.mark("FontManager")
             
             # Enhanced visual and scoring systems
-            print("🎮 Initializing Cosmic Raiders enhanced systems...")
+            game_log.info("🎮 Initializing Cosmic Raiders enhanced systems...")
             self.high_score_manager = HighScoreManager()
+            startup_profiler.mark("HighScoreManager")
             
             # Initialize visual systems with error handling
             try:
                 self.visual_assets = VisualAssets()
+                startup_profiler.mark("VisualAssets")
                 self.alien_design_manager = AlienDesignManager()
-                self.difficulty_manager = DifficultyManager()
+                startup_profiler.mark("AlienDesignManager")
+                self.difficulty_manager = DifficultyManager(self.rng)
+                startup_profiler.mark("DifficultyManager")
                 self.ui_manager = UIManager(SCREEN_WIDTH, SCREEN_HEIGHT, self.font_manager)
+                startup_profiler.mark("UIManager")
                 self.spaceship_designer = SpaceshipDesigner()
+                startup_profiler.mark("SpaceshipDesigner")
                 self.progressive_spawner = ProgressiveSpawner(self.difficulty_manager)
+                startup_profiler.mark("ProgressiveSpawner")
             except Exception as e:
-                print(f"⚠️ Warning: Some visual systems failed to initialize: {e}")
+                game_log.warning("⚠️ Warning: Some visual systems failed to initialize: %s", e)
                 # Create minimal fallback systems
                 self.visual_assets = None
                 self.alien_design_manager = None
-                self.difficulty_manager = DifficultyManager()
+                self.difficulty_manager = DifficultyManager(self.rng)
                 self.ui_manager = UIManager(SCREEN_WIDTH, SCREEN_HEIGHT, self.font_manager)
                 self.spaceship_designer = None
                 self.progressive_spawner = ProgressiveSpawner(self.difficulty_manager)
             
+            # Last HUD snapshot, so the UI data is only rebuilt when it changes
+            self.hud_state = None
+            self.hud_data = None
+            
+            # Convert every cached sprite to the display format now that the window exists
+            self.asset_finalizer = AssetFinalizer()
+            if self.screen is not None:
+                try:
+                    self.asset_finalizer.finalize_game_assets(self.visual_assets, self.alien_design_manager,
+                                                              self.spaceship_designer)
+                    if self.spaceship_designer:
+                        # Designs created later (on demand or prefetched) are converted as they are built
+                        self.spaceship_designer.surface_finalizer = self.asset_finalizer.finalize_surface
+                except Exception as e:
+                    game_log.warning("⚠️ Asset conversion failed, using unconverted sprites: %s", e)
+            startup_profiler.mark("AssetFinalizer")
+            
             # Audio and visual feedback systems
-            self.audio_manager = AudioManager()
+            self.audio_manager = AudioManager(enabled=not headless)
+            startup_profiler.mark("AudioManager")
             
         except Exception as e:
-            print(f"❌ Critical error during game initialization: {e}")
-            print("🔄 Attempting minimal initialization...")
+            game_log.error("❌ Critical error during game initialization: %s", e)
+            game_log.warning("🔄 Attempting minimal initialization...")
             
             # Minimal fallback initialization
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-            pygame.display.set_caption("Cosmic Raiders (Safe Mode)")
+            if headless:
+                self.screen = None
+            else:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+                pygame.display.set_caption("Cosmic Raiders (Safe Mode)")
             self.clock = pygame.time.Clock()
             self.font_manager = FontManager()
             self.high_score_manager = HighScoreManager()
-            self.audio_manager = AudioManager()
+            self.audio_manager = AudioManager(enabled=not headless)
             
             # Set safe mode flag
             self.safe_mode = True
@@ -1557,6 +1702,13 @@ class Game:
         self.credits_fade_alpha = 0
         self.credits_fade_speed = 3
         self.credits_content = self._create_credits_content()
+        self.credits_strip = None  # Pre-rendered on first use by build_credits_strip()
+        
+        # Twinkling stars shared by the menu, credits and level transition screens
+        self.starfield = Starfield(SCREEN_WIDTH, SCREEN_HEIGHT)
+        if self.screen is not None:
+            self.starfield.convert()
+        startup_profiler.mark("Starfield")
         
         # Performance optimization
         self.background_cache = None
@@ -1564,6 +1716,42 @@ class Game:
         self.last_state = None
         self.needs_redraw = True
         
+        # Optional dirty-rectangle renderer for gameplay frames (see dirty_rect_renderer.py)
+        self.dirty_renderer = None
+        if dirty_rects and self.screen is not None:
+            visual_assets = getattr(self, 'visual_assets', None)
+            background = visual_assets.get_sprite('background') if visual_assets else None
+            self.dirty_renderer = DirtyRectRenderer(background, BLACK)
+        
+        # Per-phase frame timing for the windowed game (F3 toggles the overlay)
+        self.performance_monitor = None
+        self.frame_timer = NullPhaseTimer()
+        self.frame_timing_path = None
+        self.performance_report_path = None
+        if self.screen is not None:
+            self.performance_monitor = PerformanceMonitor(FPS)
+            self.frame_timer = self.performance_monitor.phase_timer
+        
+        # Optional scrolling gameplay background: four layers cost more per frame than the static
+        # background, and a moving background would make every dirty-rect frame a full redraw
+        self.parallax_background = None
+        if parallax and self.dirty_renderer is None and self.screen is not None:
+            try:
+                self.parallax_background = ParallaxBackground(SCREEN_WIDTH, SCREEN_HEIGHT)
+                self.parallax_background.convert()
+            except Exception as e:
+                game_log.warning("⚠️ Parallax background unavailable, using static background: %s", e)
+                self.parallax_background = None
+        startup_profiler.mark("ParallaxBackground")
+        
+        # Optional sprite atlas: small sprites packed into shared pages and blitted from there
+        self.sprite_atlas = None
+        if sprite_atlas and self.screen is not None and getattr(self, 'visual_assets', None):
+            self.sprite_atlas = SpriteAtlas()
+            self.sprite_atlas.add_game_assets(self.visual_assets, self.alien_design_manager, self.spaceship_designer)
+            self.sprite_atlas.build()
+            startup_profiler.mark("SpriteAtlas")
+        
         # Pause system
         self.previous_state = None  # Store state before pausing
         
@@ -1573,15 +1761,32 @@ class Game:
         self.player_invulnerable_timer = 0
         self.player_invulnerable_duration = 60  # frames of invulnerability after hit
         
+        # Simulation clock (advances by FRAME_MS per unpaused update, independent of wall time)
+        self.sim_time = 0.0
+        
+        # Input recording (see input_recorder.py)
+        self.recording_path = None
+        self.input_recorder = None
+        
         # Initialize game objects with enhanced visuals and progressive spawning
         self.player = Player(SCREEN_WIDTH // 2 - 25, SCREEN_HEIGHT - 50, self.visual_assets)
-        self.player_bullets = []  # Multiple bullets allowed
-        self.alien_bullets = []
-        self.cosmic_formation = CosmicFormation(self.difficulty_level, self.visual_assets, 
-                                              self.alien_design_manager, self.difficulty_manager,
-                                              self.spaceship_designer, self.progressive_spawner)
+        self.player_bullets = BulletPool(1, SCREEN_HEIGHT, self.visual_assets, 'player_bullet',
+                                         YELLOW, WHITE)  # Multiple bullets allowed
+        self.alien_bullets = BulletPool(-1, SCREEN_HEIGHT, self.visual_assets, 'alien_bullet',
+                                        RED, (255, 100, 100))
+        
+        # Free-list pools so aliens and hit effects are reused instead of reallocated
+        self.alien_pool = ObjectPool(Alien)
+        self.effect_pool = ObjectPool(HitEffect)
+        
+        self.cosmic_formation = None
+        self.create_cosmic_formation()
+        startup_profiler.mark("CosmicFormation")
         self.hit_effects = []  # Visual effects for hits
         
+        # Broad-phase collision grid, rebuilt every tick in check_collisions
+        self.alien_grid = SpatialHash(COLLISION_CELL_SIZE)
+        
         # Shooting mechanics - Fast and responsive
         self.last_shot_time = 0
         self.shot_cooldown = 150  # Minimal delay (150ms) for responsive shooting
@@ -1590,10 +1795,11 @@ class Game:
         self.menu_selection = 0
         self.menu_options = ["START GAME", "CREDITS", "QUIT"]
         
-    def handle_input(self):
+    def handle_input(self, keys=None):
         """Handle player input based on game state"""
-        keys = pygame.key.get_pressed()
-        current_time = pygame.time.get_ticks()
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        current_time = self.sim_time
         
         if self.state == GameState.MENU:
             # Menu navigation is handled in event loop
@@ -1610,23 +1816,44 @@ class Game:
                 self.shoot_player_bullet()
                 self.last_shot_time = current_time
             
+    def create_cosmic_formation(self):
+        """Replace the formation for the current level, recycling the old one's aliens"""
+        if self.cosmic_formation:
+            self.cosmic_formation.release_all()
+        self.cosmic_formation = CosmicFormation(self.difficulty_level, self.visual_assets,
+                                                self.alien_design_manager, self.difficulty_manager,
+                                                self.spaceship_designer, self.progressive_spawner, rng=self.rng,
+                                                alien_pool=self.alien_pool)
+    
+    def clear_hit_effects(self):
+        """Remove all hit effects, returning them to the pool"""
+        self.effect_pool.release_all(self.hit_effects)
+        self.hit_effects = []
+    
+    def get_pool_stats(self):
+        """Get live/free counts for every object pool"""
+        return {
+            'aliens': self.alien_pool.get_stats(),
+            'hit_effects': self.effect_pool.get_stats()
+        }
+        
     def shoot_player_bullet(self):
         """Create multiple bullets from player position - fast and responsive"""
         bullet_x = self.player.x + self.player.width // 2 - 2
         bullet_y = self.player.y
-        self.player_bullets.append(Bullet(bullet_x, bullet_y, 1, 1.0, self.visual_assets))
+        self.player_bullets.spawn(bullet_x, bullet_y)
         
         # Play shoot sound immediately without visual feedback
         self.audio_manager.play_sound('player_shoot')
         
-        print(f"🔫 Bullet fired! ({len(self.player_bullets)} bullets active)")
+        combat_log.debug("🔫 Bullet fired! (%d bullets active)", len(self.player_bullets))
         
     def shoot_alien_bullet(self, alien):
         """Create a bullet from alien position with dynamic speed"""
         bullet_x = alien.x + alien.width // 2 - 2
         bullet_y = alien.y + alien.height
         speed_multiplier = 1.0 + (self.difficulty_level - 1) * 0.1  # Slight speed increase per level
-        self.alien_bullets.append(Bullet(bullet_x, bullet_y, -1, speed_multiplier, self.visual_assets))
+        self.alien_bullets.spawn(bullet_x, bullet_y, speed_multiplier)
         
     def update_cosmic_formation(self):
         """Update cosmic formation and handle alien shooting"""
@@ -1638,7 +1865,7 @@ class Game:
             self.game_over_reason = "Cosmic Raiders reached Earth!"
             if self.score > self.high_score:
                 self.high_score = self.score
-            print("💀 Game Over: Cosmic Raiders reached the bottom!")
+            game_log.info("💀 Game Over: Cosmic Raiders reached the bottom!")
             return
         
         # Handle alien shooting
@@ -1650,23 +1877,22 @@ class Game:
     def update_bullets(self):
         """Update all bullets and remove off-screen ones"""
         # Update player bullets (multiple bullets system)
-        for bullet in self.player_bullets[:]:
-            bullet.update()
-            if bullet.is_off_screen():
-                self.player_bullets.remove(bullet)
+        self.player_bullets.update()
                 
         # Update alien bullets
-        for bullet in self.alien_bullets[:]:
-            bullet.update()
-            if bullet.is_off_screen():
-                self.alien_bullets.remove(bullet)
+        self.alien_bullets.update()
                 
     def update_effects(self):
         """Update visual effects and player hit timers"""
         # Update hit effects
-        for effect in self.hit_effects[:]:
-            if not effect.update():
-                self.hit_effects.remove(effect)
+        if self.hit_effects:
+            running_effects = []
+            for effect in self.hit_effects:
+                if effect.update():
+                    running_effects.append(effect)
+                else:
+                    self.effect_pool.release(effect)
+            self.hit_effects = running_effects
         
         # Update player hit feedback timer
         if self.player_hit_timer > 0:
@@ -1699,78 +1925,98 @@ class Game:
                 #     print(f"🎁 Bonus life! Lives: {self.lives}")
                 
                 # Create new cosmic formation for next level
-                self.cosmic_formation = CosmicFormation(self.difficulty_level, self.visual_assets,
-                                                      self.alien_design_manager, self.difficulty_manager,
-                                                      self.spaceship_designer, self.progressive_spawner)
+                self.create_cosmic_formation()
                 
                 # Play level advance sound immediately
                 self.audio_manager.play_sound('level_advance')
                 
-                print(f"🌊 Advancing to Level {self.difficulty_level}! Lives reset to {self.lives}")
+                game_log.info("🌊 Advancing to Level %d! Lives reset to %d", self.difficulty_level, self.lives)
                 
         elif self.state == GameState.LEVEL_TRANSITION:
             self.transition_timer -= 1
             if self.transition_timer <= 0:
                 # Resume gameplay
                 self.state = GameState.PLAYING
-                print(f"🚀 Level {self.difficulty_level} begins!")
+                game_log.info("🚀 Level %d begins!", self.difficulty_level)
                 
     def check_collisions(self):
         """Check all collision scenarios with enhanced damage system"""
+        # Broad phase: bucket aliens by grid cell so each bullet only tests nearby aliens
+        alien_grid = self.alien_grid
+        alien_grid.clear()
+        for alien in self.cosmic_formation.active_aliens:
+            alien_grid.insert(alien, alien.rect)
+
         # Player bullets vs aliens (multiple bullets system with health)
-        for bullet in self.player_bullets[:]:
-            for alien in self.cosmic_formation.active_aliens[:]:
-                if bullet.rect.colliderect(alien.rect):
-                    # Remove bullet first
-                    self.player_bullets.remove(bullet)
-                    
-                    # Alien takes damage
-                    if alien.take_damage():
-                        # Alien destroyed
-                        self.score += alien.points
-                        print(f"💥 {alien.alien_type.capitalize()} destroyed! +{alien.points} points (Score: {self.score}) [{len(self.player_bullets)} bullets remaining]")
-                        
-                        # Create explosion effect
-                        effect_x = alien.x + alien.width // 2
-                        effect_y = alien.y + alien.height // 2
-                        self.hit_effects.append(HitEffect(effect_x, effect_y, "explosion", self.visual_assets))
-                        
-                        # Play destruction sound immediately
-                        self.audio_manager.play_sound('alien_destroy')
-                        
-                        # Remove alien
-                        self.cosmic_formation.active_aliens.remove(alien)
-                    else:
-                        # Alien damaged but not destroyed
-                        print(f"🎯 {alien.alien_type.capitalize()} hit! Health: {alien.health}/{alien.max_health}")
-                        
-                        # Play hit sound immediately
-                        self.audio_manager.play_sound('alien_hit')
-                    
-                    break
-                    
+        bullets = self.player_bullets
+        active_aliens = self.cosmic_formation.active_aliens
+        destroyed_aliens = set()
+        if active_aliens and len(bullets):
+            # Vectorised prefilter: only bullets inside the formation's bounds reach the grid
+            formation_bounds = active_aliens[0].rect.unionall([alien.rect for alien in active_aliens[1:]])
+            for bullet_index in bullets.overlapping(formation_bounds):
+                hits = alien_grid.query(bullets.get_rect(bullet_index))
+                if not hits:
+                    continue
+
+                # Bullet is consumed by the first alien it hits
+                bullets.kill(bullet_index)
+                alien = hits[0]
+
+                # Alien takes damage
+                if alien.take_damage():
+                    # Alien destroyed
+                    self.score += alien.points
+                    combat_log.debug("💥 %s destroyed! +%d points (Score: %d) [%d bullets remaining]",
+                                     alien.alien_type.capitalize(), alien.points, self.score, len(bullets))
+
+                    # Create explosion effect
+                    effect_x = alien.x + alien.width // 2
+                    effect_y = alien.y + alien.height // 2
+                    self.hit_effects.append(self.effect_pool.acquire(effect_x, effect_y, "explosion", self.visual_assets))
+
+                    # Play destruction sound immediately
+                    self.audio_manager.play_sound('alien_destroy')
+
+                    # Remove alien from the grid now, from the formation after the pass
+                    alien_grid.remove(alien)
+                    destroyed_aliens.add(id(alien))
+                else:
+                    # Alien damaged but not destroyed
+                    combat_log.debug("🎯 %s hit! Health: %d/%d", alien.alien_type.capitalize(), alien.health, alien.max_health)
+
+                    # Play hit sound immediately
+                    self.audio_manager.play_sound('alien_hit')
+
+            bullets.compact()
+
+        if destroyed_aliens:
+            destroyed = [alien for alien in active_aliens if id(alien) in destroyed_aliens]
+            active_aliens[:] = [alien for alien in active_aliens if id(alien) not in destroyed_aliens]
+            self.alien_pool.release_all(destroyed)
+
         # Alien bullets vs player (with invulnerability frames)
         if self.player_invulnerable_timer <= 0:  # Only check if not invulnerable
-            for bullet in self.alien_bullets[:]:
-                if bullet.rect.colliderect(self.player.rect):
-                    self.alien_bullets.remove(bullet)
-                    self.lives -= 1
-                    
-                    # Activate hit feedback and invulnerability
-                    self.player_hit_timer = self.player_hit_duration
-                    self.player_invulnerable_timer = self.player_invulnerable_duration
-                    
-                    # Create hit effect on player
-                    effect_x = self.player.x + self.player.width // 2
-                    effect_y = self.player.y + self.player.height // 2
-                    self.hit_effects.append(HitEffect(effect_x, effect_y, "explosion", self.visual_assets))
-                    
-                    # Play player hit sound immediately
-                    self.audio_manager.play_sound('player_hit')
-                    
-                    print(f"⚠️ PLAYER HIT! Lives remaining: {self.lives}")
-                    break
-                
+            hits = self.alien_bullets.overlapping(self.player.rect)
+            if len(hits):
+                self.alien_bullets.kill(hits[0])
+                self.alien_bullets.compact()
+                self.lives -= 1
+
+                # Activate hit feedback and invulnerability
+                self.player_hit_timer = self.player_hit_duration
+                self.player_invulnerable_timer = self.player_invulnerable_duration
+
+                # Create hit effect on player
+                effect_x = self.player.x + self.player.width // 2
+                effect_y = self.player.y + self.player.height // 2
+                self.hit_effects.append(self.effect_pool.acquire(effect_x, effect_y, "explosion", self.visual_assets))
+
+                # Play player hit sound immediately
+                self.audio_manager.play_sound('player_hit')
+
+                combat_log.info("⚠️ PLAYER HIT! Lives remaining: %d", self.lives)
+
     def check_game_over_conditions(self):
         """Check if game should end or level should advance"""
         # Game over is handled in update_cosmic_formation for alien invasion
@@ -1788,17 +2034,21 @@ class Game:
                     self.high_score = self.score
                     self.high_score_manager.save_high_score(self.score, self.difficulty_level)
                 
-                print(f"🏆 VICTORY! Completed all {self.max_levels} levels! Final Score: {self.score}")
+                game_log.info("🏆 VICTORY! Completed all %d levels! Final Score: %d", self.max_levels, self.score)
                 return
             
             # Regular level completion
             self.state = GameState.LEVEL_COMPLETE
             self.level_complete_timer = self.level_complete_duration
             
+            # Build the next level's spaceship designs while the level complete screen shows
+            if self.spaceship_designer:
+                self.spaceship_designer.prefetch_level(self.difficulty_level + 1)
+            
             # Play level complete sound immediately
             self.audio_manager.play_sound('level_complete')
             
-            print(f"🎉 Level {self.difficulty_level} completed! Score: {self.score}")
+            game_log.info("🎉 Level %d completed! Score: %d", self.difficulty_level, self.score)
             return
             
         # Check if player died
@@ -1812,10 +2062,15 @@ class Game:
             self.audio_manager.stop_music()
             self.audio_manager.play_sound('game_over')
             
-            print("💀 Game Over: No lives remaining!")
+            game_log.info("💀 Game Over: No lives remaining!")
             
     def draw_background(self):
         """Draw enhanced space background"""
+        if self.parallax_background and self.state in [GameState.PLAYING, GameState.PAUSED, GameState.LEVEL_COMPLETE,
+                                                       GameState.GAME_OVER, GameState.VICTORY]:
+            self.parallax_background.draw(self.screen)
+            return
+        
         bg_sprite = self.visual_assets.get_sprite('background')
         if bg_sprite:
             self.screen.blit(bg_sprite, (0, 0))
@@ -1829,26 +2084,7 @@ class Game:
         self.draw_background()
         
         # Add animated twinkling stars for menu
-        import math, random
-        time_offset = pygame.time.get_ticks() * 0.001
-        
-        # Create some animated stars
-        random.seed(42)  # Fixed seed for consistent star positions
-        for i in range(50):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            
-            # Twinkling effect
-            alpha = int(100 + 155 * abs(math.sin(time_offset * 2 + i * 0.5)))
-            star_color = (255, 255, 255, alpha)
-            
-            # Different star sizes
-            if i % 3 == 0:
-                pygame.draw.circle(self.screen, (255, 255, 255), (x, y), 2)
-            elif i % 3 == 1:
-                pygame.draw.circle(self.screen, (200, 200, 255), (x, y), 1)
-            else:
-                self.screen.set_at((x, y), (255, 255, 200))
+        self.starfield.draw(self.screen, pygame.time.get_ticks() * 0.001)
     
     def draw_menu(self):
         """Draw the enhanced main menu with retro effects"""
@@ -1898,7 +2134,7 @@ class Game:
         title_color = (title_color_r, title_color_g, title_color_b)
         
         title_text, title_rect = self.font_manager.render_text(
-            "COSMIC RAIDERS", 'title', title_color, (SCREEN_WIDTH//2, title_y)
+            "COSMIC RAIDERS", 'title', title_color, (SCREEN_WIDTH//2, title_y), cache=False
         )
         self.screen.blit(title_text, title_rect)
         
@@ -1971,45 +2207,95 @@ class Game:
             )
             self.screen.blit(inst_text, inst_rect)
     
-    def draw_game_ui(self):
-        """Draw compact, non-intrusive game UI with progressive info"""
-        # Prepare game data for UI manager
-        formation_names = {1: "LINE", 2: "V-SHAPE", 3: "ARC", 4: "TRIANGLE", 5: "DIAMOND", 6: "SPIRAL", 7: "CROSS", 8: "WAVE"}
-        formation_name = formation_names.get(((self.difficulty_level - 1) % 8) + 1, "CUSTOM")
+    def draw_playing_scene(self):
+        """Draw the gameplay scene and return the screen areas it touched"""
+        drawn_rects = []
+        
+        # Draw player with hit feedback
+        if self.player_hit_timer > 0 and self.player_hit_timer % 6 < 3:
+            # Flash red when hit
+            player_surface = pygame.Surface((self.player.width, self.player.height))
+            player_surface.fill(RED)
+            player_surface.set_alpha(128)
+            drawn_rects.append(self.screen.blit(player_surface, (self.player.x, self.player.y)))
+        
+        # Draw player (with invulnerability flashing)
+        if self.player_invulnerable_timer <= 0 or self.player_invulnerable_timer % 8 < 4:
+            drawn_rects.append(self.player.draw(self.screen))
+        
+        # Aliens, player bullets, alien bullets and hit effects go out in one batched blit
+        batch = []
+        atlas = self.sprite_atlas
+        drawn_rects.extend(self.cosmic_formation.add_to_batch(batch, self.screen, atlas))
+        drawn_rects.extend(self.player_bullets.add_to_batch(batch, self.screen, atlas))
+        drawn_rects.extend(self.alien_bullets.add_to_batch(batch, self.screen, atlas))
+        for effect in self.hit_effects:
+            effect_sprite = effect.get_sprite()
+            if effect_sprite:
+                position = effect.get_sprite_rect(effect_sprite)
+                batch.append(atlas.source(effect_sprite, position) if atlas else (effect_sprite, position))
+            else:
+                drawn_rects.append(effect.draw(self.screen, self.font_manager))
+        drawn_rects.extend(self.screen.blits(batch))
         
-        # Get progressive spawning info
-        max_aliens = self.cosmic_formation.max_active_aliens if hasattr(self.cosmic_formation, 'max_active_aliens') else 3
+        # Draw warning if player is low on lives
+        if self.lives == 1:
+            warning_text, warning_rect = self.font_manager.render_text(
+                "⚠️ LAST LIFE! ⚠️", 'medium', RED, (SCREEN_WIDTH//2, 50)
+            )
+            drawn_rects.append(self.screen.blit(warning_text, warning_rect))
         
-        game_data = {
-            'lives': self.lives,
-            'level': self.difficulty_level,
-            'wave': self.wave,
-            'score': self.score,
-            'high_score': self.high_score,
-            'active_aliens': len(self.cosmic_formation.active_aliens),
-            'remaining_aliens': self.cosmic_formation.get_total_aliens_remaining(),
-            'total_aliens': len(self.cosmic_formation.formation_queue) + len(self.cosmic_formation.active_aliens),
-            'formation_name': formation_name,
-            'active_bullets': len(self.player_bullets),
-            'max_aliens': max_aliens,
-            'in_game': True,
-            'show_progress': True,
-            'show_stats': len(self.player_bullets) > 3  # Only show bullet count when many active
-        }
+        # Draw UI
+        drawn_rects.extend(self.draw_game_ui())
+        return drawn_rects
+    
+    def draw_game_ui(self):
+        """Draw compact, non-intrusive game UI with progressive info"""
+        # Only rebuild the UI data when something it shows has changed
+        formation = self.cosmic_formation
+        max_aliens = formation.max_active_aliens if hasattr(formation, 'max_active_aliens') else 3
+        active_bullets = len(self.player_bullets)
+        hud_state = (self.lives, self.difficulty_level, self.wave, self.score, self.high_score,
+                     len(formation.active_aliens), formation.get_total_aliens_remaining(),
+                     len(formation.formation_queue) + len(formation.active_aliens),
+                     active_bullets, max_aliens)
+
+        if hud_state != self.hud_state:
+            self.hud_state = hud_state
+            formation_names = {1: "LINE", 2: "V-SHAPE", 3: "ARC", 4: "TRIANGLE", 5: "DIAMOND", 6: "SPIRAL", 7: "CROSS", 8: "WAVE"}
+            formation_name = formation_names.get(((self.difficulty_level - 1) % 8) + 1, "CUSTOM")
+            self.hud_data = {
+                'lives': self.lives,
+                'level': self.difficulty_level,
+                'wave': self.wave,
+                'score': self.score,
+                'high_score': self.high_score,
+                'active_aliens': hud_state[5],
+                'remaining_aliens': hud_state[6],
+                'total_aliens': hud_state[7],
+                'formation_name': formation_name,
+                'active_bullets': active_bullets,
+                'max_aliens': max_aliens,
+                'in_game': True,
+                'show_progress': True,
+                'show_stats': active_bullets > 3  # Only show bullet count when many active
+            }
         
         # Use compact UI manager - it handles all UI elements including high score
-        self.ui_manager.draw_compact_hud(self.screen, game_data)
+        self.ui_manager.draw_compact_hud(self.screen, self.hud_data)
+        drawn_rects = list(self.ui_manager.get_ui_zones().values())
         
         # Player status (only additional UI element not handled by UI manager)
         if self.player_invulnerable_timer > 0:
             status_text, _ = self.font_manager.render_text("INVULNERABLE", 'small', YELLOW)
-            self.screen.blit(status_text, (10, 265))
+            drawn_rects.append(self.screen.blit(status_text, (10, 265)))
         
         # Instructions at bottom (updated to include mute key)
         instruction_text, instruction_rect = self.font_manager.render_text(
             "SPACE: RAPID FIRE  |  ESC: PAUSE  |  M: MUTE", 'small', GRAY, (SCREEN_WIDTH//2, SCREEN_HEIGHT - 20)
         )
-        self.screen.blit(instruction_text, instruction_rect)
+        drawn_rects.append(self.screen.blit(instruction_text, instruction_rect))
+        return drawn_rects
     
     def draw_level_complete(self):
         """Draw level complete screen"""
@@ -2114,7 +2400,8 @@ class Game:
             'difficulty_summary': difficulty_summary
         }
         
-        # Use UI manager for consistent styling - it handles all the text rendering
+        # Stars behind the overlay, then the UI manager for consistent styling
+        self.starfield.draw(self.screen, pygame.time.get_ticks() * 0.001)
         self.ui_manager.draw_level_transition(self.screen, level_data)
         
     def draw_game_over(self):
@@ -2262,67 +2549,103 @@ class Game:
             )
             self.screen.blit(control_text, control_rect)
     
+    def credit_line_color(self, text, size):
+        """Choose a credits line color based on its content"""
+        if size == "huge":
+            return YELLOW
+        elif size == "large":
+            return GREEN
+        elif "🚀" in text or "👾" in text or "🏆" in text or "⭐" in text:
+            return CYAN
+        elif text.startswith("Press"):
+            return WHITE if (pygame.time.get_ticks() // 500) % 2 else GRAY
+        return WHITE
+    
+    def build_credits_strip(self):
+        """Pre-render every static credits line into one tall strip, with a table of line offsets"""
+        self.credits_offsets = []
+        self.credits_live_lines = []  # Blinking lines are drawn per frame
+        lines = []
+        offset = 0
+        for index, (text, size, spacing) in enumerate(self.credits_content):
+            self.credits_offsets.append(offset)
+            if text:
+                if text.startswith("Press"):
+                    self.credits_live_lines.append(index)
+                else:
+                    text_surface, _ = self.font_manager.render_text(text, size, self.credit_line_color(text, size))
+                    lines.append((text_surface, offset))
+            offset += spacing
+        self.credits_total_height = offset
+        
+        # Lines are centered on their offset, so pad the strip by the tallest half line
+        strip_width = max([surface.get_width() for surface, _ in lines] or [1])
+        self.credits_strip_padding = max([surface.get_height() // 2 + 1 for surface, _ in lines] or [0])
+        self.credits_strip = pygame.Surface(
+            (strip_width, offset + self.credits_strip_padding * 2), pygame.SRCALPHA
+        )
+        self.credits_line_rects = []  # Area of each pre-rendered line in the strip, top to bottom
+        for text_surface, offset in lines:
+            text_rect = text_surface.get_rect(center=(strip_width // 2, offset + self.credits_strip_padding))
+            self.credits_strip.blit(text_surface, text_rect)
+            self.credits_line_rects.append(text_rect)
+        self.credits_line_tops = [rect.top for rect in self.credits_line_rects]
+        
+        # Dark space background, faded in with surface alpha
+        self.credits_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.credits_background.fill((5, 5, 15))  # Very dark blue
+    
     def draw_credits_screen(self):
         """Draw scrolling credits screen with fade effects"""
+        if self.credits_strip is None:
+            self.build_credits_strip()
+        
         # Fade in effect
         if self.credits_fade_alpha < 255:
             self.credits_fade_alpha += self.credits_fade_speed
             self.credits_fade_alpha = min(255, self.credits_fade_alpha)
         
-        # Dark space background with fade
-        background_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        background_surface.fill((5, 5, 15))  # Very dark blue
-        background_surface.set_alpha(self.credits_fade_alpha)
-        self.screen.blit(background_surface, (0, 0))
+        # Dark space background with fade (opaque blits are far cheaper than alpha 255)
+        self.credits_background.set_alpha(self.credits_fade_alpha if self.credits_fade_alpha < 255 else None)
+        self.screen.blit(self.credits_background, (0, 0))
         
-        # Add some stars to the background
+        # Add some stars to the background, drifting slowly with the credits
         if self.credits_fade_alpha > 100:
-            for i in range(50):
-                star_x = (i * 137) % SCREEN_WIDTH
-                star_y = (i * 211 + int(self.credits_scroll_y * 0.1)) % SCREEN_HEIGHT
-                star_brightness = min(255, self.credits_fade_alpha - 50)
-                star_color = (star_brightness, star_brightness, star_brightness)
-                pygame.draw.circle(self.screen, star_color, (star_x, star_y), 1)
-        
-        # Draw credits text
-        current_y = self.credits_scroll_y
-        
-        for text, size, spacing in self.credits_content:
-            if text:  # Only draw non-empty text
-                # Choose color based on content
-                if size == "huge":
-                    color = YELLOW
-                elif size == "large":
-                    color = GREEN
-                elif "🚀" in text or "👾" in text or "🏆" in text or "⭐" in text:
-                    color = CYAN
-                elif text.startswith("Press"):
-                    color = WHITE if (pygame.time.get_ticks() // 500) % 2 else GRAY
-                else:
-                    color = WHITE
-                
-                # Render text with fade
+            self.starfield.draw(self.screen, pygame.time.get_ticks() * 0.001, self.credits_scroll_y * 0.1,
+                                (self.credits_fade_alpha - 50) / 255)
+        
+        # Draw only the pre-rendered lines inside the visible window
+        view_top = self.credits_strip_padding - math.floor(self.credits_scroll_y + 0.5)
+        strip_x = SCREEN_WIDTH // 2 - self.credits_strip.get_width() // 2
+        first = bisect.bisect_left(self.credits_line_tops, view_top - self.credits_strip_padding * 2)
+        last = bisect.bisect_left(self.credits_line_tops, view_top + SCREEN_HEIGHT)
+        self.credits_strip.set_alpha(self.credits_fade_alpha)
+        self.screen.blits([
+            (self.credits_strip, (strip_x + rect.x, rect.y - view_top), rect)
+            for rect in self.credits_line_rects[first:last]
+            if rect.bottom > view_top
+        ], doreturn=False)
+        
+        # Blinking lines, only when on screen
+        for index in self.credits_live_lines:
+            current_y = self.credits_scroll_y + self.credits_offsets[index]
+            if -50 < current_y < SCREEN_HEIGHT + 50:
+                text, size, _ = self.credits_content[index]
                 text_surface, text_rect = self.font_manager.render_text(
-                    text, size, color, (SCREEN_WIDTH // 2, current_y)
+                    text, size, self.credit_line_color(text, size), (SCREEN_WIDTH // 2, current_y)
                 )
-                
-                # Apply fade alpha
+                # Apply fade alpha (to a copy - the cached surface is shared)
                 if self.credits_fade_alpha < 255:
+                    text_surface = text_surface.copy()
                     text_surface.set_alpha(self.credits_fade_alpha)
-                
-                # Only draw if visible on screen
-                if -50 < current_y < SCREEN_HEIGHT + 50:
-                    self.screen.blit(text_surface, text_rect)
-            
-            current_y += spacing
+                self.screen.blit(text_surface, text_rect)
         
         # Update scroll position if not paused
         if not self.credits_paused:
             self.credits_scroll_y -= self.credits_scroll_speed
             
             # Reset scroll when credits finish
-            total_height = sum(spacing for _, _, spacing in self.credits_content)
-            if self.credits_scroll_y < -total_height:
+            if self.credits_scroll_y < -self.credits_total_height:
                 self.credits_scroll_y = SCREEN_HEIGHT
         
         # Draw pause indicator if paused
@@ -2333,13 +2656,22 @@ class Game:
             )
             self.screen.blit(pause_text, pause_rect)
         
-    def restart_game(self):
-        """Reset game to initial state (Level 1)"""
+    def restart_game(self, start_level=1, seed=None):
+        """Reset game to initial state (Level 1 unless a start level is given)"""
+        self.finish_recording()
+        
+        # Fresh deterministic random stream for this run
+        if seed is None:
+            seed = self.seed if self.seed is not None else random.getrandbits(32)
+        self.run_seed = seed
+        self.rng.seed(seed)
+        self.sim_time = 0.0
+        
         self.state = GameState.PLAYING
         self.score = 0
         self.lives = self.max_lives
-        self.wave = 1
-        self.difficulty_level = 1
+        self.wave = start_level
+        self.difficulty_level = start_level
         self.game_over_reason = ""
         self.level_complete_timer = 0
         self.transition_timer = 0
@@ -2349,19 +2681,21 @@ class Game:
         self.victory_music_played = False
         
         self.player = Player(SCREEN_WIDTH // 2 - 25, SCREEN_HEIGHT - 50, self.visual_assets)
-        self.player_bullets = []  # Reset multiple bullets
-        self.alien_bullets = []
-        self.cosmic_formation = CosmicFormation(self.difficulty_level, self.visual_assets,
-                                              self.alien_design_manager, self.difficulty_manager,
-                                              self.spaceship_designer, self.progressive_spawner)  # Create new cosmic formation
-        self.hit_effects = []  # Clear effects
+        self.player_bullets.clear()  # Reset multiple bullets
+        self.alien_bullets.clear()
+        self.create_cosmic_formation()  # Create new cosmic formation
+        self.clear_hit_effects()  # Clear effects
         self.last_shot_time = 0  # Reset shooting timer
         self.player_hit_timer = 0
         self.player_invulnerable_timer = 0
         
+        # Record this run's input if requested
+        if self.recording_path:
+            self.input_recorder = InputRecorder(self.run_seed, start_level)
+        
         # Start game music
         self.audio_manager.play_music('game_music')
-        print(f"🔄 Game restarted! Starting Level 1 with {self.lives} lives")
+        game_log.info("🔄 Game restarted! Starting Level %d with %d lives", self.difficulty_level, self.lives)
     
     def start_credits(self):
         """Start the credits screen"""
@@ -2372,13 +2706,13 @@ class Game:
         
         # Play ambient menu music for credits
         self.audio_manager.play_music('menu')
-        print("🎬 Starting credits screen")
+        game_log.info("🎬 Starting credits screen")
     
     def exit_credits(self):
         """Exit credits and return to menu"""
         self.state = GameState.MENU
         self.credits_fade_alpha = 0
-        print("🔙 Returning to main menu")
+        game_log.info("🔙 Returning to main menu")
         
     def _create_credits_content(self):
         """Create the credits content with proper formatting"""
@@ -2446,20 +2780,78 @@ class Game:
     
     def restart_level(self):
         """Restart current level while keeping score and progress"""
+        self.finish_recording()  # Recordings cover a single uninterrupted run
         self.state = GameState.PLAYING
         self.previous_state = None
         self.lives = self.max_lives  # Reset lives for the level
         self.player = Player(SCREEN_WIDTH // 2 - 25, SCREEN_HEIGHT - 50, self.visual_assets)
-        self.player_bullets = []  # Clear bullets
-        self.alien_bullets = []
-        self.cosmic_formation = CosmicFormation(self.difficulty_level, self.visual_assets,
-                                              self.alien_design_manager, self.difficulty_manager,
-                                              self.spaceship_designer, self.progressive_spawner)  # Recreate formation for current level
-        self.hit_effects = []  # Clear effects
+        self.player_bullets.clear()  # Clear bullets
+        self.alien_bullets.clear()
+        self.create_cosmic_formation()  # Recreate formation for current level
+        self.clear_hit_effects()  # Clear effects
         self.last_shot_time = 0  # Reset shooting timer
         self.player_hit_timer = 0
         self.player_invulnerable_timer = 0
-        print(f"🔄 Level {self.difficulty_level} restarted! Lives reset to {self.lives}")
+        game_log.info("🔄 Level %d restarted! Lives reset to %d", self.difficulty_level, self.lives)
+    
+    def update(self, keys=None):
+        """Advance game logic by one fixed timestep (no drawing)"""
+        # Only the ticks a recording captures advance the clock, so pausing never shifts a replay's timing
+        if self.state in [GameState.PLAYING, GameState.LEVEL_COMPLETE, GameState.LEVEL_TRANSITION]:
+            self.sim_time += FRAME_MS
+
+            # Capture this tick's input so the run can be replayed exactly
+            if self.input_recorder:
+                keys = self.input_recorder.record(keys if keys is not None else pygame.key.get_pressed())
+        
+        timer = self.frame_timer
+        if self.state == GameState.PLAYING:
+            self.handle_input(keys)
+            timer.lap('handle_input')
+            if self.parallax_background:
+                self.parallax_background.scroll()
+            timer.lap('update_other')
+            self.update_cosmic_formation()
+            timer.lap('update_cosmic_formation')
+            self.update_bullets()
+            timer.lap('update_bullets')
+            self.update_effects()  # Update visual effects
+            timer.lap('update_effects')
+            self.check_collisions()
+            timer.lap('check_collisions')
+            self.check_game_over_conditions()
+        elif self.state in [GameState.LEVEL_COMPLETE, GameState.LEVEL_TRANSITION]:
+            # Handle level transitions
+            self.update_level_transitions()
+            timer.lap('update_other')
+            # Still update effects during transitions
+            self.update_effects()
+            timer.lap('update_effects')
+        elif self.state == GameState.PAUSED:
+            # Only update effects when paused, not game logic
+            pass
+        
+        if self.input_recorder and self.state in [GameState.GAME_OVER, GameState.VICTORY]:
+            self.finish_recording()
+        timer.lap('update_other')
+    
+    def start_recording(self, path):
+        """Record input of every run started from now on to the given file"""
+        self.recording_path = path
+    
+    def finish_recording(self):
+        """Save the active input recording, if any"""
+        if not self.input_recorder:
+            return
+        
+        summary = {
+            'state': self.state.name,
+            'level': self.difficulty_level,
+            'score': self.score,
+            'lives': self.lives
+        }
+        self.input_recorder.save(self.recording_path, summary)
+        self.input_recorder = None
     
     def start_game(self):
         """Start a new game from menu"""
@@ -2468,14 +2860,34 @@ class Game:
         # Start game music
         self.audio_manager.play_music('game')
         
+    def export_frame_timing(self, path):
+        """Write the per-phase frame timing summary to a JSON file and print it"""
+        self.frame_timer.export(path)
+        for line in self.frame_timer.format_summary():
+            game_log.info(line)
+        game_log.info("📄 Frame timing written to %s", path)
+    
+    def export_performance_report(self, path):
+        """Write frame time percentiles, jank and the histogram (JSON) or per-frame times (CSV)"""
+        self.performance_monitor.export(path)
+        stats = self.performance_monitor.get_stats()
+        game_log.info("📈 Frame ms p50 %.1f | p95 %.1f | p99 %.1f | jank %d (%.1f%%) over %d frames",
+                      stats['p50_ms'], stats['p95_ms'], stats['p99_ms'], stats['jank_count'],
+                      stats['jank_percent'], stats['frame_count'])
+        game_log.info("📄 Performance report written to %s", path)
+    
     def run(self):
         """Main game loop"""
         running = True
         
         # Start menu music
         self.audio_manager.play_music('menu')
+        if self.performance_monitor:
+            self.performance_monitor.start()
         
         while running:
+            self.frame_timer.begin_frame()
+            
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -2485,6 +2897,12 @@ class Game:
                     if event.key == pygame.K_m:
                         self.audio_manager.toggle_mute()
                     
+                    # Frame timing overlay (works in any state)
+                    elif event.key == pygame.K_F3:
+                        self.frame_timer.toggle_overlay()
+                    elif event.key == pygame.K_F4 and self.performance_monitor:
+                        self.export_performance_report(self.performance_report_path or PERFORMANCE_REPORT_PATH)
+                    
                     elif event.key == pygame.K_ESCAPE:
                         if self.state == GameState.PLAYING:
                             # Pause the game and music
@@ -2515,6 +2933,7 @@ class Game:
                             self.restart_level()
                         elif event.key == pygame.K_SPACE:
                             # Quit to menu
+                            self.finish_recording()
                             self.state = GameState.MENU
                             self.previous_state = None
                             self.audio_manager.play_music('menu')
@@ -2557,77 +2976,35 @@ class Game:
                             self.state = GameState.MENU
                             self.audio_manager.play_music('menu_music')
                         
+            self.frame_timer.lap('events')
+            
             # Update game logic
-            if self.state == GameState.PLAYING:
-                self.handle_input()
-                self.update_cosmic_formation()
-                self.update_bullets()
-                self.update_effects()  # Update visual effects
-                self.check_collisions()
-                self.check_game_over_conditions()
-            elif self.state in [GameState.LEVEL_COMPLETE, GameState.LEVEL_TRANSITION]:
-                # Handle level transitions
-                self.update_level_transitions()
-                # Still update effects during transitions
-                self.update_effects()
-            elif self.state == GameState.PAUSED:
-                # Only update effects when paused, not game logic
-                pass
+            self.update()
                 
+            # Gameplay frames can use the dirty-rectangle renderer instead of a full redraw
+            dirty_frame = self.dirty_renderer is not None and self.state == GameState.PLAYING
+            
             # Draw enhanced background
-            self.draw_background()
+            if dirty_frame:
+                self.dirty_renderer.begin_frame(self.screen)
+            else:
+                self.draw_background()
             
             # Draw based on game state
             if self.state == GameState.MENU:
                 self.draw_menu()
             elif self.state == GameState.PLAYING:
                 # Draw game objects
-                
-                # Draw player with hit feedback
-                if self.player_hit_timer > 0 and self.player_hit_timer % 6 < 3:
-                    # Flash red when hit
-                    player_surface = pygame.Surface((self.player.width, self.player.height))
-                    player_surface.fill(RED)
-                    player_surface.set_alpha(128)
-                    self.screen.blit(player_surface, (self.player.x, self.player.y))
-                
-                # Draw player (with invulnerability flashing)
-                if self.player_invulnerable_timer <= 0 or self.player_invulnerable_timer % 8 < 4:
-                    self.player.draw(self.screen)
-                
-                # Draw cosmic formation
-                self.cosmic_formation.draw(self.screen)
-                
-                # Draw player bullets (multiple bullets)
-                for bullet in self.player_bullets:
-                    bullet.draw(self.screen)
-                    
-                # Draw alien bullets
-                for bullet in self.alien_bullets:
-                    bullet.draw(self.screen)
-                
-                # Draw hit effects
-                for effect in self.hit_effects:
-                    effect.draw(self.screen, self.font_manager)
-                
-                # Draw warning if player is low on lives
-                if self.lives == 1:
-                    warning_text, warning_rect = self.font_manager.render_text(
-                        "⚠️ LAST LIFE! ⚠️", 'medium', RED, (SCREEN_WIDTH//2, 50)
-                    )
-                    self.screen.blit(warning_text, warning_rect)
-                
-                # Draw UI
-                self.draw_game_ui()
+                drawn_rects = self.draw_playing_scene()
+                if dirty_frame:
+                    self.dirty_renderer.mark(drawn_rects)
                 
             elif self.state == GameState.LEVEL_COMPLETE:
                 # Draw frozen game state
                 self.player.draw(self.screen)
                 self.cosmic_formation.draw(self.screen)
-                for bullet in self.player_bullets:
-                    bullet.draw(self.screen)
-                for bullet in self.alien_bullets:
-                    bullet.draw(self.screen)
+                self.player_bullets.draw(self.screen)
+                self.alien_bullets.draw(self.screen)
                 for effect in self.hit_effects:
                     effect.draw(self.screen, self.font_manager)
                 self.draw_game_ui()
@@ -2643,10 +3020,8 @@ class Game:
                 # Draw frozen game state
                 self.player.draw(self.screen)
                 self.cosmic_formation.draw(self.screen)
-                for bullet in self.player_bullets:
-                    bullet.draw(self.screen)
-                for bullet in self.alien_bullets:
-                    bullet.draw(self.screen)
+                self.player_bullets.draw(self.screen)
+                self.alien_bullets.draw(self.screen)
                 for effect in self.hit_effects:
                     effect.draw(self.screen, self.font_manager)
                 self.draw_game_ui()
@@ -2669,10 +3044,8 @@ class Game:
                 self.cosmic_formation.draw(self.screen)
                 
                 # Draw bullets
-                for bullet in self.player_bullets:
-                    bullet.draw(self.screen)
-                for bullet in self.alien_bullets:
-                    bullet.draw(self.screen)
+                self.player_bullets.draw(self.screen)
+                self.alien_bullets.draw(self.screen)
                 
                 # Draw effects
                 for effect in self.hit_effects:
@@ -2701,10 +3074,8 @@ class Game:
                 self.cosmic_formation.draw(self.screen)
                 
                 # Draw bullets
-                for bullet in self.player_bullets:
-                    bullet.draw(self.screen)
-                for bullet in self.alien_bullets:
-                    bullet.draw(self.screen)
+                self.player_bullets.draw(self.screen)
+                self.alien_bullets.draw(self.screen)
                 
                 # Draw hit effects
                 for effect in self.hit_effects:
@@ -2723,15 +3094,74 @@ class Game:
                 # Draw pause overlay
                 self.ui_manager.draw_pause_screen(self.screen)
             
+            if self.frame_timer.overlay_visible:
+                overlay_font = self.font_manager.get_font(TEXT_SIZES['small'])
+                overlay_rect = self.frame_timer.draw_overlay(self.screen, overlay_font)
+                if dirty_frame:
+                    self.dirty_renderer.mark([overlay_rect])
+            self.frame_timer.lap('draw')
+            
             # Update display
-            pygame.display.flip()
+            if dirty_frame:
+                self.dirty_renderer.end_frame()
+            else:
+                if self.dirty_renderer:
+                    self.dirty_renderer.invalidate()
+                pygame.display.flip()
+            self.frame_timer.lap('display.flip')
             self.clock.tick(FPS)
+            self.frame_timer.lap('clock.tick')
+            self.frame_timer.end_frame()
+            if self.performance_monitor:
+                self.performance_monitor.update()
             
+        # Save any unfinished input recording
+        self.finish_recording()
+        
+        if self.frame_timing_path and self.performance_monitor:
+            self.export_frame_timing(self.frame_timing_path)
+        if self.performance_report_path and self.performance_monitor:
+            self.export_performance_report(self.performance_report_path)
+        
         # Cleanup audio system
         self.audio_manager.cleanup()
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    game = Game()
+    import argparse
+    parser = argparse.ArgumentParser(description="Cosmic Raiders")
+    parser.add_argument("--seed", type=int, default=None, help="seed the gameplay RNG for a repeatable session")
+    parser.add_argument("--record", metavar="PATH", default=None, help="record each run's input to PATH for replay")
+    parser.add_argument("--dirty-rects", action="store_true", help="redraw only changed screen areas during gameplay")
+    parser.add_argument("--parallax", action="store_true", help="scrolling star layers behind gameplay")
+    parser.add_argument("--sprite-atlas", action="store_true", help="blit sprites from packed atlas pages")
+    parser.add_argument("--log", metavar="SPEC", default=None,
+                        help='log levels, e.g. "WARNING,combat=DEBUG,spawner=DEBUG"')
+    parser.add_argument("--asset-report", action="store_true", help="print bytes and pixel format of every sprite")
+    parser.add_argument("--frame-timing", nargs="?", const="frame_timing.json", default=None, metavar="PATH",
+                        help="write per-phase frame timings to PATH on exit (F3 shows them in game)")
+    parser.add_argument("--perf-report", metavar="PATH", default=None,
+                        help="write frame time percentiles to PATH (.json or .csv) on exit (F4 writes one any time)")
+    parser.add_argument("--profile-startup", nargs="?", const=startup_profiler.DEFAULT_REPORT_PATH, default=None,
+                        metavar="PATH", help="time each startup stage and import, write a JSON report and exit")
+    args = parser.parse_args()
+    
+    if args.log:
+        default_level, subsystem_levels = game_logger.parse_levels(args.log)
+        game_logger.configure(default_level, subsystem_levels)
+    
+    game = Game(seed=args.seed, dirty_rects=args.dirty_rects, parallax=args.parallax,
+                sprite_atlas=args.sprite_atlas)
+    if args.asset_report and hasattr(game, 'asset_finalizer'):
+        print("\n".join(game.asset_finalizer.format_report()))
+    if args.profile_startup:
+        startup_profiler.mark("Game")
+        startup_profiler.finish(args.profile_startup)
+        pygame.quit()
+        sys.exit(0)
+    if args.record:
+        game.start_recording(args.record)
+    game.frame_timing_path = args.frame_timing
+    game.performance_report_path = args.perf_report
     game.run()
@@ -1,7 +1,8 @@
 import random
 
 class DifficultyManager:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random  # Injectable session RNG
         self.level_configs = self.create_level_configurations()
     
     def create_level_configurations(self):
@@ -97,7 +98,7 @@ class DifficultyManager:
         distribution = config['alien_distribution']
         
         # Weighted random selection
-        rand = random.random()
+        rand = self.rng.random()
         cumulative = 0
         
         for alien_type, probability in distribution.items():
@@ -136,7 +137,7 @@ class DifficultyManager:
     def get_bullet_pattern(self, level):
         """Get appropriate bullet pattern for level"""
         config = self.get_level_config(level)
-        return random.choice(config['bullet_patterns'])
+        return self.rng.choice(config['bullet_patterns'])
     
     def get_level_summary(self, level):
         """Get human-readable summary of level difficulty"""
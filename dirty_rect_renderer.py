@@ -0,0 +1,81 @@
+"""
+Dirty Rectangle Renderer for Cosmic Raiders
+Restores only the screen areas sprites covered last frame from the cached
+background and pushes only changed areas to the display, falling back to a
+full redraw when too much of the screen is dirty
+"""
+
+import pygame
+
+FULL_REDRAW_RATIO = 0.5  # Flip the whole screen once half of it is dirty
+
+
+class DirtyRectRenderer:
+    def __init__(self, background=None, fill_color=(0, 0, 0), full_redraw_ratio=FULL_REDRAW_RATIO):
+        self.background = background
+        self.fill_color = fill_color
+        self.full_redraw_ratio = full_redraw_ratio
+        self.screen = None
+        self.previous_rects = []
+        self.current_rects = []
+        self.needs_full_redraw = True
+
+        # Statistics
+        self.frame_count = 0
+        self.full_redraw_count = 0
+
+    def set_background(self, background):
+        """Use a new cached background (forces a full redraw)"""
+        self.background = background
+        self.invalidate()
+
+    def invalidate(self):
+        """Force the next frame to redraw and present the whole screen"""
+        self.needs_full_redraw = True
+
+    def restore(self, rect):
+        """Paint the cached background back over one screen area"""
+        if self.background:
+            self.screen.blit(self.background, rect, rect)
+        else:
+            self.screen.fill(self.fill_color, rect)
+
+    def begin_frame(self, screen):
+        """Erase last frame's sprites (or the whole screen after invalidate)"""
+        self.screen = screen
+        if self.needs_full_redraw:
+            self.restore(screen.get_rect())
+        else:
+            for rect in self.previous_rects:
+                self.restore(rect)
+        self.current_rects = []
+
+    def mark(self, rects):
+        """Record screen areas drawn this frame (None and empty rects are ignored)"""
+        for rect in rects:
+            if rect and rect.width > 0 and rect.height > 0:
+                self.current_rects.append(rect)
+
+    def end_frame(self):
+        """Push changed areas to the display and remember them for the next frame"""
+        self.frame_count += 1
+        dirty_rects = self.previous_rects + self.current_rects
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+
+        if self.needs_full_redraw or dirty_area > screen_area * self.full_redraw_ratio:
+            pygame.display.flip()
+            self.full_redraw_count += 1
+        else:
+            pygame.display.update(dirty_rects)
+
+        self.previous_rects = self.current_rects
+        self.needs_full_redraw = False
+
+    def get_stats(self):
+        """Get frame counts for partial vs full presents"""
+        return {
+            'frames': self.frame_count,
+            'full_redraws': self.full_redraw_count,
+            'partial_updates': self.frame_count - self.full_redraw_count
+        }
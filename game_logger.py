@@ -0,0 +1,137 @@
+"""
+Game Logger for Cosmic Raiders
+Leveled logging with per-subsystem switches: records go into a bounded queue
+and a background thread writes them, so log calls never stall a frame
+"""
+
+import os
+import sys
+import queue
+import atexit
+import threading
+import logging
+import logging.handlers
+
+ROOT_LOGGER = "cosmic_raiders"
+LOG_QUEUE_SIZE = 2000  # Records beyond this are dropped (and counted), never waited on
+DEFAULT_LEVEL = logging.INFO
+
+# Environment override, e.g. COSMIC_RAIDERS_LOG="WARNING,combat=DEBUG,spawner=DEBUG"
+LOG_ENV_VAR = "COSMIC_RAIDERS_LOG"
+
+_handler = None
+_listener = None
+_listener_started = False
+_listener_lock = threading.Lock()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records when the queue is full instead of blocking"""
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped_count = 0
+
+    def enqueue(self, record):
+        if not _listener_started:
+            start_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def prepare(self, record):
+        # Message formatting is left to the writer thread
+        return record
+
+
+def resolve_level(level, context="log level"):
+    """Get a valid level (name or number), warning and falling back to DEFAULT_LEVEL on a bad name"""
+    if isinstance(level, int):
+        return level
+    name = str(level).strip().upper()
+    if name in logging._nameToLevel:
+        return name
+    print(f"⚠️ Unknown {context} {level!r}, using {logging.getLevelName(DEFAULT_LEVEL)}", file=sys.stderr)
+    return logging.getLevelName(DEFAULT_LEVEL)
+
+
+def parse_levels(spec):
+    """Parse "LEVEL,subsystem=LEVEL,..." into (default level, {subsystem: level})"""
+    default_level = None
+    subsystem_levels = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" in part:
+            subsystem, level = part.split("=", 1)
+            subsystem = subsystem.strip()
+            subsystem_levels[subsystem] = resolve_level(level, f"log level for {subsystem}")
+        else:
+            default_level = resolve_level(part)
+    return default_level, subsystem_levels
+
+
+def configure(level=None, subsystem_levels=None, stream=None):
+    """Set up the queue, the writer thread and per-subsystem levels"""
+    global _handler, _listener
+    shutdown()
+
+    env_level, env_subsystems = parse_levels(os.environ.get(LOG_ENV_VAR))
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(resolve_level(level or env_level or DEFAULT_LEVEL))
+    root.propagate = False
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _handler = DroppingQueueHandler(log_queue)
+    root.handlers = [_handler]
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter("%(message)s"))
+    _listener = logging.handlers.QueueListener(log_queue, output)  # Started by the first record
+
+    levels = dict(env_subsystems)
+    levels.update(subsystem_levels or {})
+    for subsystem, subsystem_level in levels.items():
+        set_level(subsystem, subsystem_level)
+
+
+def start_listener():
+    """Start the writer thread (on the first record, so importing a module starts no threads)"""
+    global _listener_started
+    with _listener_lock:
+        if _listener is not None and not _listener_started:
+            _listener.start()
+            _listener_started = True
+
+
+def get_logger(subsystem):
+    """Get the logger for one subsystem (e.g. "combat", "spawner", "audio")"""
+    if _handler is None:
+        configure()
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+def set_level(subsystem, level):
+    """Change one subsystem's level at runtime (names or logging constants)"""
+    logging.getLogger(f"{ROOT_LOGGER}.{subsystem}").setLevel(resolve_level(level, f"log level for {subsystem}"))
+
+
+def get_stats():
+    """Get queue depth and how many records were dropped"""
+    if _handler is None:
+        return {'queued': 0, 'dropped': 0}
+    return {'queued': _handler.queue.qsize(), 'dropped': _handler.dropped_count}
+
+
+def shutdown():
+    """Flush queued records and stop the writer thread"""
+    global _listener, _listener_started
+    with _listener_lock:
+        if _listener is not None and _listener_started:
+            _listener.stop()
+        _listener = None
+        _listener_started = False
+
+
+atexit.register(shutdown)
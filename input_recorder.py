@@ -0,0 +1,121 @@
+"""
+Input Recorder for Cosmic Raiders
+Records the per-frame keys that Game.handle_input reads and plays them back,
+so a seeded run can be reproduced exactly (and reused as a benchmark)
+"""
+
+import json
+import os
+import pygame
+
+RECORDING_VERSION = 1
+
+# The only keys handle_input looks at during gameplay
+RECORDED_KEYS = (pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d, pygame.K_SPACE)
+
+
+class KeyState:
+    """Snapshot of pressed keys for scripted, headless or replayed input"""
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    @classmethod
+    def from_mask(cls, mask):
+        """Build a key state from a recorded bit mask"""
+        return cls(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+
+def encode_keys(keys):
+    """Pack the recorded subset of a key state into a bit mask"""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class InputRecorder:
+    def __init__(self, seed, start_level=1):
+        self.seed = seed
+        self.start_level = start_level
+        self.frames = []
+
+    def record(self, keys):
+        """Record one frame of input and return the key state the game should use"""
+        mask = encode_keys(keys)
+        self.frames.append(mask)
+        return KeyState.from_mask(mask)
+
+    def save(self, path, summary=None):
+        """Save the recording as run-length encoded JSON"""
+        runs = []
+        for mask in self.frames:
+            if runs and runs[-1][0] == mask:
+                runs[-1][1] += 1
+            else:
+                runs.append([mask, 1])
+
+        data = {
+            'version': RECORDING_VERSION,
+            'seed': self.seed,
+            'start_level': self.start_level,
+            'frame_count': len(self.frames),
+            'frames': runs,
+            'summary': summary or {}
+        }
+
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(data, f)
+            print(f"📼 Input recording saved: {path} ({len(self.frames)} frames)")
+        except Exception as e:
+            print(f"⚠️ Failed to save input recording: {e}")
+
+
+class InputPlayback:
+    def __init__(self, frames, seed, start_level=1, summary=None):
+        self.frames = frames
+        self.seed = seed
+        self.start_level = start_level
+        self.summary = summary or {}
+        self.position = 0
+
+    @classmethod
+    def load(cls, path):
+        """Load a recording saved by InputRecorder"""
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        if data.get('version') != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('version')}")
+
+        frames = []
+        for mask, count in data['frames']:
+            frames.extend([mask] * count)
+
+        return cls(frames, data['seed'], data.get('start_level', 1), data.get('summary'))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def rewind(self):
+        """Start playback from the first frame again"""
+        self.position = 0
+
+    def is_finished(self):
+        """Check if all recorded frames have been played"""
+        return self.position >= len(self.frames)
+
+    def next_keys(self):
+        """Get the key state for the next frame (None when finished)"""
+        if self.is_finished():
+            return None
+        mask = self.frames[self.position]
+        self.position += 1
+        return KeyState.from_mask(mask)
@@ -0,0 +1,61 @@
+"""
+Object Pool for Cosmic Raiders
+Generic free-list pool: released objects are kept and re-initialised with
+reset() instead of being constructed again, cutting allocation churn
+"""
+
+from game_logger import get_logger
+
+game_log = get_logger("game")
+
+
+class ObjectPool:
+    def __init__(self, factory, max_free=256):
+        """Pool objects built by factory; pooled classes must implement reset()
+        taking the same arguments as their constructor"""
+        self.factory = factory
+        self.max_free = max_free
+        self.free = []
+        self.live_ids = set()  # id() of every object handed out and not yet released
+        self.live_count = 0
+        self.created_count = 0
+        self.reused_count = 0
+
+    def acquire(self, *args, **kwargs):
+        """Get an initialised object, reusing a free one when available"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused_count += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.created_count += 1
+        self.live_ids.add(id(obj))
+        self.live_count += 1
+        return obj
+
+    def release(self, obj):
+        """Return an object to the pool once the game no longer references it (False if it was not live)"""
+        if id(obj) not in self.live_ids:
+            # A second release would put the object on the free list twice and hand it to two owners
+            game_log.warning("⚠️ Ignoring release of a %s that is not live in this pool", type(obj).__name__)
+            return False
+        self.live_ids.discard(id(obj))
+        self.live_count -= 1
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+        return True
+
+    def release_all(self, objects):
+        """Return every object in an iterable to the pool"""
+        for obj in objects:
+            self.release(obj)
+
+    def get_stats(self):
+        """Get live/free counts and reuse statistics"""
+        return {
+            'live': self.live_count,
+            'free': len(self.free),
+            'created': self.created_count,
+            'reused': self.reused_count
+        }
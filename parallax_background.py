@@ -0,0 +1,125 @@
+"""
+Parallax Background for Cosmic Raiders
+Gameplay background built from pre-rendered, vertically wrapping layers that
+scroll at different speeds; each layer costs at most two blits per frame.
+The layers are generated once and then loaded from the art cache
+"""
+
+import random
+import pygame
+from art_cache import get_art_cache, generator_version
+
+PARALLAX_SEED = 1977  # Private seed so the layers look the same every run
+
+# Star layers from far to near: (name, star count, speed in px/frame, sizes, brightness range)
+STAR_LAYERS = [
+    ("far_stars", 110, 0.25, [1], (90, 170)),
+    ("mid_stars", 60, 0.6, [1, 1, 2], (140, 220)),
+    ("near_stars", 30, 1.2, [1, 2, 2, 3], (200, 255)),
+]
+
+NEBULA_COLORS = [
+    (80, 40, 120),   # Purple nebula
+    (40, 80, 120),   # Blue nebula
+    (120, 60, 40),   # Orange nebula
+    (60, 120, 80)    # Green nebula
+]
+
+
+class ParallaxLayer:
+    def __init__(self, name, surface, speed):
+        self.name = name
+        self.surface = surface
+        self.speed = speed
+        self.offset = 0.0
+
+    def scroll(self, frames=1):
+        """Move the layer down, wrapping at its height"""
+        if self.speed:
+            self.offset = (self.offset + self.speed * frames) % self.surface.get_height()
+
+    def draw(self, screen):
+        """Draw the layer with one blit, or two where it wraps"""
+        offset = int(self.offset)
+        if offset == 0:
+            screen.blit(self.surface, (0, 0))
+        else:
+            screen.blit(self.surface, (0, offset))
+            screen.blit(self.surface, (0, offset - self.surface.get_height()))
+
+
+class ParallaxBackground:
+    def __init__(self, width, height, seed=PARALLAX_SEED):
+        self.width = width
+        self.height = height
+        surfaces = self.load_or_create_layers(seed)
+
+        # Distant space (gradient and nebulae) stays put; only the stars drift past
+        self.layers = [ParallaxLayer("deep_space", surfaces['deep_space'], 0)]
+        for name, _, speed, _, _ in STAR_LAYERS:
+            self.layers.append(ParallaxLayer(name, surfaces[name], speed))
+
+    def load_or_create_layers(self, seed):
+        """Load the layer surfaces from the art cache, rendering them on a miss"""
+        version = generator_version(__file__, f"{self.width}x{self.height}:{seed}")
+        surfaces = get_art_cache().load("parallax_layers", version)
+        if surfaces is None:
+            rng = random.Random(seed)
+            surfaces = {'deep_space': self.create_deep_space(rng)}
+            for name, count, _, sizes, brightness in STAR_LAYERS:
+                surfaces[name] = self.create_star_layer(rng, count, sizes, brightness)
+            get_art_cache().save("parallax_layers", version, surfaces)
+        return surfaces
+
+    def create_deep_space(self, rng):
+        """Render the opaque gradient and soft nebulae"""
+        surface = pygame.Surface((self.width, self.height))
+        for y in range(self.height):
+            color_intensity = int(20 + (y / self.height) * 15)
+            color = (color_intensity // 3, color_intensity // 4, color_intensity)
+            pygame.draw.line(surface, color, (0, y), (self.width, y))
+
+        for _ in range(5):
+            x = rng.randint(100, self.width - 100)
+            y = rng.randint(100, self.height - 100)
+            radius = rng.randint(30, 80)
+            color = rng.choice(NEBULA_COLORS)
+            for r in range(radius, 0, -5):
+                nebula_surf = pygame.Surface((r * 2, r * 2))
+                nebula_surf.set_alpha(max(10, 50 - (radius - r)))
+                nebula_surf.fill(color)
+                surface.blit(nebula_surf, (x - r, y - r))
+        return surface
+
+    def create_star_layer(self, rng, count, sizes, brightness_range):
+        """Render a transparent star layer that tiles seamlessly top to bottom"""
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        for _ in range(count):
+            x = rng.randint(0, self.width - 1)
+            y = rng.randint(0, self.height - 1)
+            size = rng.choice(sizes)
+            brightness = rng.randint(*brightness_range)
+            color = (brightness, brightness, brightness)
+            # Stars crossing the bottom edge are drawn again at the top so the wrap has no seam
+            for wrap_y in (y, y - self.height, y + self.height):
+                pygame.draw.circle(surface, color, (x, wrap_y), size)
+        return surface
+
+    def convert(self):
+        """Convert layers to the display format; sparse star layers get RLE acceleration"""
+        for layer in self.layers:
+            if layer.surface.get_flags() & pygame.SRCALPHA:
+                layer.surface = layer.surface.convert_alpha()
+                layer.surface.set_alpha(255, pygame.RLEACCEL)
+            else:
+                layer.surface = layer.surface.convert()
+
+    def scroll(self, frames=1):
+        """Advance every layer by its own speed"""
+        for layer in self.layers:
+            layer.scroll(frames)
+
+    def draw(self, screen):
+        """Draw all layers, far to near"""
+        for layer in self.layers:
+            layer.draw(screen)
@@ -1,19 +1,194 @@
 """
 Performance Monitor for Cosmic Raiders
-Tracks FPS, memory usage, and performance metrics
+Tracks FPS, memory usage, and performance metrics, plus per-phase frame
+timings kept in a fixed-size ring buffer
 """
 
 import pygame
 import time
-import psutil
+import json
+import csv
 import os
+import numpy as np
+from startup_profiler import get_memory_bytes
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Memory comes from /proc and CPU from process time instead
+
+# Named phases of one frame of Game.run, in the order they happen
+FRAME_PHASES = (
+    'events',
+    'handle_input',
+    'update_cosmic_formation',
+    'update_bullets',
+    'update_effects',
+    'check_collisions',
+    'update_other',
+    'draw',
+    'display.flip',
+    'clock.tick'
+)
+PHASE_HISTORY = 600  # Frames kept in the ring buffer (10 seconds at 60 FPS)
+FRAME_HISTORY = 3600  # Frame times kept for percentiles and the histogram (a minute at 60 FPS)
+JANK_FACTOR = 1.2  # Frames longer than this many budgets count as jank (clock.tick rounds to whole ms)
+HISTOGRAM_BIN_MS = 1.0
+HISTOGRAM_MAX_MS = 50.0  # Longer frames land in the last bin
+OVERLAY_REFRESH_FRAMES = 30  # Frames between overlay text updates
+PHASE_COLORS = [
+    (90, 170, 255), (255, 200, 60), (255, 110, 80), (240, 90, 200), (150, 230, 120),
+    (255, 150, 40), (160, 160, 160), (80, 230, 230), (200, 130, 255), (130, 130, 170)
+]
+
+
+class PhaseTimer:
+    """Lap timer splitting each frame into named phases, with a ring buffer of recent frames"""
+    def __init__(self, phases=FRAME_PHASES, history=PHASE_HISTORY, target_fps=60):
+        self.phases = list(phases)
+        self.phase_index = {phase: i for i, phase in enumerate(self.phases)}
+        self.budget_ms = 1000.0 / target_fps
+        self.samples = np.zeros((history, len(self.phases)))  # Milliseconds per phase per frame
+        self.index = 0
+        self.count = 0
+        self.current = [0.0] * len(self.phases)
+        self.last_time = time.perf_counter()
+        self.overlay_visible = False
+        self.overlay = None
+        self.overlay_age = 0
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        self.current = [0.0] * len(self.phases)
+        self.last_time = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap to a phase"""
+        now = time.perf_counter()
+        self.current[self.phase_index[phase]] += (now - self.last_time) * 1000.0
+        self.last_time = now
+
+    def end_frame(self):
+        """Store the finished frame in the ring buffer, overwriting the oldest one"""
+        self.samples[self.index] = self.current
+        self.index = (self.index + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+
+    def get_recent(self):
+        """Get the stored frames (oldest first) as a frames x phases array"""
+        if self.count < len(self.samples):
+            return self.samples[:self.count]
+        return np.roll(self.samples, -self.index, axis=0)
+
+    def get_summary(self):
+        """Get the mean and worst time per phase over the stored frames"""
+        recent = self.get_recent()
+        phases = {}
+        for phase, column in zip(self.phases, recent.T if len(recent) else [[]] * len(self.phases)):
+            mean = float(np.mean(column)) if len(column) else 0.0
+            phases[phase] = {
+                'mean_ms': mean,
+                'max_ms': float(np.max(column)) if len(column) else 0.0,
+                'budget_share': mean / self.budget_ms
+            }
+        return {
+            'frames': int(self.count),
+            'budget_ms': self.budget_ms,
+            'mean_frame_ms': float(recent.sum(axis=1).mean()) if len(recent) else 0.0,
+            'phases': phases
+        }
+
+    def format_summary(self):
+        """Get the summary as text lines, one per phase"""
+        summary = self.get_summary()
+        lines = [f"⏱️ {summary['mean_frame_ms']:.2f} ms/frame of {summary['budget_ms']:.1f} ms "
+                 f"over {summary['frames']} frames"]
+        for phase, stats in summary['phases'].items():
+            lines.append(f"   {phase:<24} {stats['mean_ms']:6.2f} ms  max {stats['max_ms']:6.2f} ms  "
+                         f"{stats['budget_share'] * 100:5.1f}%")
+        return lines
+
+    def export(self, path):
+        """Write the summary and the raw ring buffer as JSON"""
+        report = self.get_summary()
+        report['frames_ms'] = {phase: [round(value, 4) for value in column]
+                               for phase, column in zip(self.phases, self.get_recent().T)}
+        with open(path, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+        return report
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen phase breakdown"""
+        self.overlay_visible = not self.overlay_visible
+        self.overlay = None
+        return self.overlay_visible
+
+    def build_overlay(self, font):
+        """Render the overlay: a stacked bar against the frame budget and one line per phase"""
+        summary = self.get_summary()
+        lines = [(f"{summary['mean_frame_ms']:.2f} / {summary['budget_ms']:.1f} ms", (255, 255, 255))]
+        for color, (phase, stats) in zip(PHASE_COLORS, summary['phases'].items()):
+            lines.append((f"{phase} {stats['mean_ms']:.2f}", color))
+        texts = [font.render(text, True, color) for text, color in lines]
+        line_height = max(text.get_height() for text in texts)  # Pixel fonts render taller than their linesize
+        bar_height = 10
+        width = max(160, max(text.get_width() for text in texts) + 8)
+        overlay = pygame.Surface((width, 8 + bar_height + line_height * len(texts)))
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(200)
+
+        # Budget bar: each phase's share of the frame budget, left to right
+        x = 4.0
+        bar_width = width - 8
+        for color, stats in zip(PHASE_COLORS, summary['phases'].values()):
+            segment = min(stats['budget_share'], 1.0) * bar_width
+            pygame.draw.rect(overlay, color, (int(x), 4, max(1, int(segment)), bar_height))
+            x += segment
+        pygame.draw.rect(overlay, (255, 255, 255), (4, 4, bar_width, bar_height), 1)
+
+        for i, text in enumerate(texts):
+            overlay.blit(text, (4, 6 + bar_height + i * line_height))
+        return overlay
+
+    def draw_overlay(self, screen, font, x=10, y=60):
+        """Draw the overlay if visible (its text is refreshed every OVERLAY_REFRESH_FRAMES frames)"""
+        if not self.overlay_visible or not font:
+            return None
+        self.overlay_age += 1
+        if self.overlay is None or self.overlay_age >= OVERLAY_REFRESH_FRAMES:
+            self.overlay = self.build_overlay(font)
+            self.overlay_age = 0
+        return screen.blit(self.overlay, (x, y))
+
+
+class NullPhaseTimer:
+    """Phase timer that records nothing (headless sessions)"""
+    overlay_visible = False
+
+    def begin_frame(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
 
 class PerformanceMonitor:
     def __init__(self, target_fps=60):
         self.target_fps = target_fps
-        self.frame_times = []
-        self.max_frame_history = 60  # Track last 60 frames
-        self.last_time = time.time()
+        self.budget_ms = 1000.0 / target_fps
+        self.jank_threshold_ms = self.budget_ms * JANK_FACTOR
+        self.max_frame_history = 60  # Average FPS over the last 60 frames
+        
+        # Ring buffer of frame times in milliseconds (constant time per frame)
+        self.frame_times = np.zeros(FRAME_HISTORY)
+        self.frame_index = 0
+        self.frame_samples = 0
+        self.recent_sum = 0.0  # Sum of the last max_frame_history frame times
+        self.jank_count = 0
+        self.last_time = time.perf_counter()
         self.frame_count = 0
         self.fps = 0
         self.avg_fps = 0
@@ -21,9 +196,13 @@ class PerformanceMonitor:
         self.max_fps = 0
         
         # Performance tracking
-        self.process = psutil.Process(os.getpid())
+        self.process = psutil.Process(os.getpid()) if psutil else None
         self.memory_usage = 0
         self.cpu_usage = 0
+        self.last_cpu_sample = (time.time(), time.process_time())
+        
+        # Where each frame's time goes (see PhaseTimer)
+        self.phase_timer = PhaseTimer(target_fps=target_fps)
         
         # Performance warnings
         self.low_fps_threshold = target_fps * 0.8  # 80% of target
@@ -33,14 +212,21 @@ class PerformanceMonitor:
         
     def update(self):
         """Update performance metrics"""
-        current_time = time.time()
+        current_time = time.perf_counter()
         frame_time = current_time - self.last_time
         self.last_time = current_time
+        frame_ms = frame_time * 1000.0
         
-        # Track frame times
-        self.frame_times.append(frame_time)
-        if len(self.frame_times) > self.max_frame_history:
-            self.frame_times.pop(0)
+        # Track frame times, keeping a running sum of the newest max_frame_history
+        history = len(self.frame_times)
+        if self.frame_samples >= self.max_frame_history:
+            self.recent_sum -= self.frame_times[(self.frame_index - self.max_frame_history) % history]
+        self.recent_sum += frame_ms
+        self.frame_times[self.frame_index] = frame_ms
+        self.frame_index = (self.frame_index + 1) % history
+        self.frame_samples = min(self.frame_samples + 1, history)
+        if frame_ms > self.jank_threshold_ms:
+            self.jank_count += 1
         
         # Calculate FPS
         if frame_time > 0:
@@ -49,21 +235,78 @@ class PerformanceMonitor:
             self.max_fps = max(self.max_fps, self.fps)
         
         # Calculate average FPS
-        if self.frame_times:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-            self.avg_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
+        recent_count = min(self.frame_samples, self.max_frame_history)
+        avg_frame_ms = self.recent_sum / recent_count
+        self.avg_fps = 1000.0 / avg_frame_ms if avg_frame_ms > 0 else 0
         
         self.frame_count += 1
         
         # Update system metrics every 30 frames
         if self.frame_count % 30 == 0:
             try:
-                self.memory_usage = self.process.memory_info().rss
-                self.cpu_usage = self.process.cpu_percent()
+                if self.process:
+                    self.memory_usage = self.process.memory_info().rss
+                    self.cpu_usage = self.process.cpu_percent()
+                else:
+                    self.memory_usage = get_memory_bytes()
+                    self.cpu_usage = self._sample_cpu_percent()
                 self._check_performance_warnings()
             except:
                 pass  # Ignore errors in performance monitoring
     
+    def start(self):
+        """Restart the frame clock so time spent before the first frame is not counted"""
+        self.last_time = time.perf_counter()
+    
+    def get_frame_times(self):
+        """Get the stored frame times in milliseconds, oldest first"""
+        if self.frame_samples < len(self.frame_times):
+            return self.frame_times[:self.frame_samples]
+        return np.roll(self.frame_times, -self.frame_index)
+    
+    def get_percentiles(self):
+        """Get p50, p95 and p99 frame times (ms) over the stored frames"""
+        frame_times = self.get_frame_times()
+        if not len(frame_times):
+            return {'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+        p50, p95, p99 = np.percentile(frame_times, [50, 95, 99])
+        return {'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99)}
+    
+    def get_histogram(self, bin_ms=HISTOGRAM_BIN_MS, max_ms=HISTOGRAM_MAX_MS):
+        """Count stored frames per bin_ms-wide bin (the last bin also holds longer frames)"""
+        edges = np.arange(0.0, max_ms + bin_ms, bin_ms)
+        counts, _ = np.histogram(np.minimum(self.get_frame_times(), max_ms), bins=edges)
+        return {'bin_ms': bin_ms, 'counts': counts.tolist()}
+    
+    def export(self, path):
+        """Write frame statistics to path: per-frame rows for .csv, summary and histogram for .json"""
+        frame_times = self.get_frame_times()
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="") as report_file:
+                writer = csv.writer(report_file)
+                writer.writerow(["frame", "frame_ms", "jank"])
+                first_frame = self.frame_count - len(frame_times)
+                for i, frame_ms in enumerate(frame_times):
+                    writer.writerow([first_frame + i, f"{frame_ms:.4f}", int(frame_ms > self.jank_threshold_ms)])
+        else:
+            stats = self.get_stats()
+            stats['min_fps'] = stats['min_fps'] if stats['frame_count'] else 0  # inf is not valid JSON
+            report = {
+                'stats': stats,
+                'histogram': self.get_histogram(),
+                'frame_times_ms': [round(float(frame_ms), 4) for frame_ms in frame_times]
+            }
+            with open(path, "w") as report_file:
+                json.dump(report, report_file, indent=2)
+        return path
+    
+    def _sample_cpu_percent(self):
+        """CPU use since the last sample, from process time (when psutil is missing)"""
+        wall, cpu = time.time(), time.process_time()
+        last_wall, last_cpu = self.last_cpu_sample
+        self.last_cpu_sample = (wall, cpu)
+        return (cpu - last_cpu) / (wall - last_wall) * 100 if wall > last_wall else 0.0
+    
     def _check_performance_warnings(self):
         """Check for performance issues"""
         # Clear old warnings
@@ -93,6 +336,10 @@ class PerformanceMonitor:
             'memory_mb': memory_mb,
             'cpu_percent': self.cpu_usage,
             'frame_count': self.frame_count,
+            'budget_ms': self.budget_ms,
+            'jank_count': self.jank_count,
+            'jank_percent': self.jank_count / self.frame_count * 100 if self.frame_count else 0.0,
+            **self.get_percentiles(),
             'warnings': self.warnings.copy()
         }
     
@@ -104,6 +351,8 @@ class PerformanceMonitor:
         stats = self.get_stats()
         debug_lines = [
             f"FPS: {stats['fps']:.1f} (avg: {stats['avg_fps']:.1f})",
+            f"Frame ms p50/p95/p99: {stats['p50_ms']:.1f}/{stats['p95_ms']:.1f}/{stats['p99_ms']:.1f}",
+            f"Jank: {stats['jank_count']} ({stats['jank_percent']:.1f}%)",
             f"Memory: {stats['memory_mb']:.1f}MB",
             f"CPU: {stats['cpu_percent']:.1f}%",
             f"Frames: {stats['frame_count']}"
@@ -124,7 +373,11 @@ class PerformanceMonitor:
     
     def reset_stats(self):
         """Reset performance statistics"""
-        self.frame_times.clear()
+        self.frame_times.fill(0.0)
+        self.frame_index = 0
+        self.frame_samples = 0
+        self.recent_sum = 0.0
+        self.jank_count = 0
         self.frame_count = 0
         self.min_fps = float('inf')
         self.max_fps = 0
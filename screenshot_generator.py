@@ -8,7 +8,8 @@ import pygame
 import sys
 import os
 import time
-from cosmic_raiders import *
+import math
+import random
 
 class ScreenshotGenerator:
     def __init__(self):
@@ -0,0 +1,149 @@
+"""
+Headless Simulation for Cosmic Raiders
+Steps the game's update path at a fixed timestep without a display surface,
+so balance sweeps, soak tests and bot games can run many times faster than real time
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Never open a window or an audio device from the simulation
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import game_logger
+from cosmic_raiders import Game, GameState, FRAME_MS
+from input_recorder import KeyState, InputPlayback
+
+NO_KEYS = KeyState()
+
+
+def autopilot(game):
+    """Simple bot: chase the lowest alien and keep the trigger held"""
+    aliens = game.cosmic_formation.active_aliens
+    pressed = [pygame.K_SPACE]
+    if aliens:
+        target = max(aliens, key=lambda alien: alien.y)
+        target_x = target.x + target.width // 2
+        player_x = game.player.x + game.player.width // 2
+        if target_x < player_x - game.player.speed:
+            pressed.append(pygame.K_LEFT)
+        elif target_x > player_x + game.player.speed:
+            pressed.append(pygame.K_RIGHT)
+    return KeyState(pressed)
+
+
+class Simulation:
+    def __init__(self, start_level=1, seed=None):
+        """Create a headless game session and start playing"""
+        self.game = Game(headless=True, seed=seed)
+        self.game.audio_manager.muted = True  # No sound in simulation
+        self.tick_count = 0
+        self.start(start_level)
+
+    def start(self, start_level=1, seed=None):
+        """Start a fresh run from the given level"""
+        self.game.restart_game(start_level, seed)
+        self.tick_count = 0
+
+    def step(self, keys=None):
+        """Advance the simulation by one fixed timestep"""
+        self.game.update(keys if keys is not None else NO_KEYS)
+        self.tick_count += 1
+
+    def is_finished(self):
+        """Check if the run has ended (game over or victory)"""
+        return self.game.state in (GameState.GAME_OVER, GameState.VICTORY)
+
+    def run(self, max_ticks, input_source=None, stop_when_finished=True):
+        """Run up to max_ticks steps and return run statistics
+
+        input_source is an optional callable taking the game and returning
+        the KeyState for the next tick (see autopilot).
+        """
+        start_time = time.perf_counter()
+        ticks_run = 0
+
+        while ticks_run < max_ticks:
+            if stop_when_finished and self.is_finished():
+                break
+            keys = input_source(self.game) if input_source else NO_KEYS
+            self.step(keys)
+            ticks_run += 1
+
+        elapsed = time.perf_counter() - start_time
+        return self.get_stats(ticks_run, elapsed)
+
+    def replay(self, playback):
+        """Replay a recorded run and report whether it reproduced the original"""
+        playback.rewind()
+        self.start(playback.start_level, playback.seed)
+
+        start_time = time.perf_counter()
+        while not playback.is_finished():
+            self.step(playback.next_keys())
+        elapsed = time.perf_counter() - start_time
+
+        stats = self.get_stats(len(playback), elapsed)
+        expected = playback.summary
+        stats['matches_recording'] = all(stats.get(key) == value for key, value in expected.items())
+        return stats
+
+    def get_stats(self, ticks_run=None, elapsed=None):
+        """Get a summary of the current run"""
+        stats = {
+            'ticks': self.tick_count,
+            'sim_seconds': self.tick_count * FRAME_MS / 1000.0,
+            'state': self.game.state.name,
+            'level': self.game.difficulty_level,
+            'score': self.game.score,
+            'lives': self.game.lives
+        }
+        if ticks_run is not None and elapsed is not None:
+            stats['wall_seconds'] = elapsed
+            stats['ticks_per_second'] = ticks_run / elapsed if elapsed > 0 else 0.0
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Cosmic Raiders headless at a fixed timestep")
+    parser.add_argument("--ticks", type=int, default=36000, help="maximum ticks to simulate (default: 10 minutes of game time)")
+    parser.add_argument("--level", type=int, default=1, help="level to start from")
+    parser.add_argument("--bot", action="store_true", help="let the autopilot play instead of idling")
+    parser.add_argument("--seed", type=int, default=None, help="seed the gameplay RNG for a repeatable run")
+    parser.add_argument("--replay", metavar="PATH", default=None, help="replay an input recording (benchmark mode)")
+    parser.add_argument("--repeat", type=int, default=1, help="number of times to replay the recording")
+    parser.add_argument("--log", metavar="SPEC", default=None,
+                        help='log levels, e.g. "WARNING,combat=DEBUG,spawner=DEBUG"')
+    args = parser.parse_args()
+
+    if args.log:
+        default_level, subsystem_levels = game_logger.parse_levels(args.log)
+        game_logger.configure(default_level, subsystem_levels)
+
+    if args.replay:
+        playback = InputPlayback.load(args.replay)
+        simulation = Simulation(playback.start_level, playback.seed)
+        for run in range(args.repeat):
+            stats = simulation.replay(playback)
+            result = "✅ matches recording" if stats['matches_recording'] else "❌ diverged from recording"
+            print(f"📼 Replay {run + 1}/{args.repeat}: {stats['ticks']} ticks in {stats['wall_seconds']:.3f}s "
+                  f"- {stats['ticks_per_second']:.0f} ticks/s - {result}")
+        pygame.quit()
+        return 0 if stats['matches_recording'] else 1
+
+    simulation = Simulation(args.level, args.seed)
+    stats = simulation.run(args.ticks, autopilot if args.bot else None)
+
+    print(f"🧪 Simulated {stats['ticks']} ticks ({stats['sim_seconds']:.1f}s game time) "
+          f"in {stats['wall_seconds']:.2f}s - {stats['ticks_per_second']:.0f} ticks/s")
+    print(f"🏁 Final state: {stats['state']} | Level {stats['level']} | Score {stats['score']} | Lives {stats['lives']}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Sound Synth for Cosmic Raiders
+Procedural sound effects (laser sweeps, noise explosions, hit blips) rendered
+with vectorised NumPy straight into the mixer's sample layout and cached by a
+hash of their parameters, in memory and in .audio_cache/
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+import pygame
+from audio_assets import get_audio_cache_dir
+from game_logger import get_logger
+
+audio_log = get_logger("audio")
+
+SYNTH_VERSION = 1  # Bump when the synthesis changes so cached buffers are rebuilt
+
+# Mixer sample size -> NumPy sample type (signed sizes are negative, like pygame's)
+SAMPLE_TYPES = {
+    -8: np.int8,
+    8: np.uint8,
+    -16: np.int16,
+    16: np.uint16,
+    -32: np.int32,
+    32: np.float32
+}
+
+# Effects generated when their WAV file is not shipped
+SYNTH_PRESETS = {
+    'player_shoot': {'kind': 'laser', 'start_hz': 1800, 'end_hz': 280, 'duration': 0.08},
+    'alien_hit': {'kind': 'blip', 'frequency': 660, 'duration': 0.15},
+    'alien_destroy': {'kind': 'explosion', 'duration': 0.3, 'smoothing': 6, 'seed': 1},
+    'player_hit': {'kind': 'explosion', 'duration': 0.15, 'smoothing': 3, 'seed': 2},
+    'level_complete': {'kind': 'laser', 'start_hz': 330, 'end_hz': 990, 'duration': 1.5},
+    'level_advance': {'kind': 'laser', 'start_hz': 440, 'end_hz': 880, 'duration': 1.0},
+    'game_over': {'kind': 'laser', 'start_hz': 440, 'end_hz': 110, 'duration': 2.0},
+    'victory_sound': {'kind': 'laser', 'start_hz': 523, 'end_hz': 1046, 'duration': 2.0}
+}
+
+_default_synth = None
+
+
+def render_laser(rate, start_hz, end_hz, duration, decay=4.0):
+    """Exponential pitch sweep with a decaying envelope"""
+    count = max(1, int(rate * duration))
+    frequencies = np.geomspace(start_hz, end_hz, count)
+    phase = 2 * np.pi * np.cumsum(frequencies) / rate
+    envelope = np.exp(-decay * np.linspace(0.0, 1.0, count))
+    return np.sin(phase) * envelope
+
+
+def render_explosion(rate, duration, smoothing=6, seed=0, decay=5.0):
+    """Low-passed white noise with a sharp attack and a long decay"""
+    count = max(1, int(rate * duration))
+    noise = np.random.default_rng(seed).uniform(-1.0, 1.0, count)
+    if smoothing > 1:
+        noise = np.convolve(noise, np.ones(smoothing) / smoothing, mode="same")
+        noise /= max(np.abs(noise).max(), 1e-9)
+    envelope = np.exp(-decay * np.linspace(0.0, 1.0, count))
+    return noise * envelope
+
+
+def render_blip(rate, frequency, duration, decay=6.0):
+    """Short square-ish tone, the classic arcade hit"""
+    count = max(1, int(rate * duration))
+    wave = np.tanh(3.0 * np.sin(2 * np.pi * frequency * np.arange(count) / rate))
+    envelope = np.exp(-decay * np.linspace(0.0, 1.0, count))
+    return wave * envelope
+
+
+RENDERERS = {
+    'laser': render_laser,
+    'explosion': render_explosion,
+    'blip': render_blip
+}
+
+
+def to_mixer_bytes(samples, mixer_format, amplitude=0.3):
+    """Convert float samples in [-1, 1] to raw bytes in the mixer's sample type and channel count"""
+    _, size, channels = mixer_format
+    sample_type = SAMPLE_TYPES[size]
+    samples = np.clip(samples * amplitude, -1.0, 1.0)
+    if sample_type is not np.float32:
+        info = np.iinfo(sample_type)
+        middle = (int(info.max) + int(info.min) + 1) / 2  # 0 for signed types, the midpoint for unsigned
+        samples = np.round(samples * (info.max - middle) + middle)
+    return np.repeat(samples.astype(sample_type)[:, np.newaxis], channels, axis=1).tobytes()
+
+
+def get_sound_synth():
+    """Get the shared synthesiser (disk cache in .audio_cache/ unless COSMIC_RAIDERS_AUDIO_CACHE is "off")"""
+    global _default_synth
+    if _default_synth is None:
+        _default_synth = SoundSynth(get_audio_cache_dir())
+    return _default_synth
+
+
+class SoundSynth:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.buffers = {}  # parameter hash -> raw mixer-format bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+
+    def get_key(self, params, mixer_format):
+        """Hash the parameters together with the mixer layout they were rendered for"""
+        text = json.dumps([SYNTH_VERSION, list(mixer_format), params], sort_keys=True)
+        return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+    def get_buffer(self, params, mixer_format):
+        """Get raw sample bytes for an effect, rendering them only on a cache miss"""
+        key = self.get_key(params, mixer_format)
+        buffer = self.buffers.get(key)
+        if buffer is not None:
+            self.hits += 1
+            return buffer
+
+        path = os.path.join(self.cache_dir, f"synth-{key}.pcm") if self.cache_dir else None
+        if path and os.path.exists(path):
+            with open(path, "rb") as cache_file:
+                buffer = cache_file.read()
+            self.disk_hits += 1
+        else:
+            settings = dict(params)
+            renderer = RENDERERS[settings.pop('kind')]
+            buffer = to_mixer_bytes(renderer(mixer_format[0], **settings), mixer_format)
+            self.renders += 1
+            if path:
+                self.save(path, buffer)
+        self.buffers[key] = buffer
+        return buffer
+
+    def save(self, path, buffer):
+        """Write a rendered buffer to the disk cache (via a temporary file)"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(buffer)
+            os.replace(temp_path, path)
+        except OSError as e:
+            audio_log.warning("⚠️ Could not cache synthesized sound: %s", e)
+
+    def get_sound(self, params):
+        """Get a new Sound for an effect in the open mixer's layout"""
+        return pygame.mixer.Sound(buffer=self.get_buffer(params, pygame.mixer.get_init()))
+
+    def get_preset(self, name):
+        """Get a Sound for one of the game's effects, or None if it has no preset"""
+        params = SYNTH_PRESETS.get(name)
+        return self.get_sound(params) if params else None
+
+    def get_stats(self):
+        """Get memory hits, disk hits and renders"""
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'renders': self.renders}
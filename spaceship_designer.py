@@ -2,44 +2,123 @@ import pygame
 import os
 import math
 import random
+import threading
+import visual_assets
+from visual_assets import create_flash_sprite
+from art_cache import get_art_cache, generator_version
+from game_logger import get_logger
+
+assets_log = get_logger("assets")
+
+# Spaceship classes and their variants; a level uses one variant of each class
+SPACESHIP_TYPES = {
+    'scout': ['interceptor', 'stealth', 'recon', 'dart', 'phantom'],
+    'fighter': ['assault', 'heavy', 'bomber', 'destroyer', 'gunship'],
+    'cruiser': ['battleship', 'dreadnought', 'carrier', 'fortress', 'titan'],
+    'mothership': ['command', 'flagship', 'overlord', 'leviathan', 'colossus']
+}
 
 class SpaceshipDesigner:
     def __init__(self):
-        self.spaceship_designs = {}
+        # Designs are created on first request (or prefetched for the next level)
+        self.spaceship_designs = {ship_class: {} for ship_class in SPACESHIP_TYPES}
+        self.flash_designs = {ship_class: {} for ship_class in SPACESHIP_TYPES}  # Damage-flash variants, built on first hit
         self.design_cache = {}
-        self.load_all_spaceships()
+        self.prefetched = {}  # (ship_class, variant) -> raw design built by the prefetch thread
+        self.design_lock = threading.Lock()
+        self.prefetch_thread = None
+        self.surface_finalizer = None  # Optional callable applied to every new design (e.g. display conversion)
+        self.cache_version = generator_version(__file__, visual_assets.__file__, "spaceship_designs")
+        self.load_level_spaceships(1)
+        assets_log.info("✅ Created %d alien spaceship designs for level 1",
+                        sum(len(variants) for variants in self.spaceship_designs.values()))
+    
+    def get_variant(self, ship_class, level=1):
+        """Get the variant name a level uses for a ship class"""
+        variants = SPACESHIP_TYPES[ship_class]
+        return variants[(level - 1) % len(variants)]
+    
+    def load_level_spaceships(self, level):
+        """Make sure every design a level uses exists"""
+        for ship_class in SPACESHIP_TYPES:
+            self.get_design(ship_class, self.get_variant(ship_class, level))
     
     def load_all_spaceships(self):
-        """Load spaceship designs from files or create procedural ones"""
-        print("🛸 Loading alien spaceship designs...")
-        
-        # Define spaceship types with multiple variants
-        spaceship_types = {
-            'scout': ['interceptor', 'stealth', 'recon', 'dart', 'phantom'],
-            'fighter': ['assault', 'heavy', 'bomber', 'destroyer', 'gunship'],
-            'cruiser': ['battleship', 'dreadnought', 'carrier', 'fortress', 'titan'],
-            'mothership': ['command', 'flagship', 'overlord', 'leviathan', 'colossus']
-        }
-        
-        for ship_class, variants in spaceship_types.items():
-            self.spaceship_designs[ship_class] = {}
-            
+        """Create every spaceship design up front"""
+        assets_log.info("🛸 Loading alien spaceship designs...")
+        for ship_class, variants in SPACESHIP_TYPES.items():
             for variant in variants:
-                # Try to load from file first
-                ship_path = f"spaceship_designs/{ship_class}_{variant}.png"
-                if os.path.exists(ship_path):
-                    try:
-                        sprite = pygame.image.load(ship_path)
-                        self.spaceship_designs[ship_class][variant] = sprite
-                        print(f"📁 Loaded {ship_class} {variant} from file")
-                    except Exception as e:
-                        print(f"⚠️ Error loading {ship_path}: {e}")
-                        self.spaceship_designs[ship_class][variant] = self.create_spaceship(ship_class, variant)
-                else:
-                    # Create procedural spaceship
-                    self.spaceship_designs[ship_class][variant] = self.create_spaceship(ship_class, variant)
+                self.get_design(ship_class, variant)
+        assets_log.info("✅ Created %d alien spaceship designs",
+                        sum(len(variants) for variants in self.spaceship_designs.values()))
+    
+    def prefetch_level(self, level):
+        """Create the raw surfaces a level needs on a background thread (finalized on first use)"""
+        missing = [
+            (ship_class, self.get_variant(ship_class, level)) for ship_class in SPACESHIP_TYPES
+            if self.get_variant(ship_class, level) not in self.spaceship_designs[ship_class]
+        ]
+        if not missing:
+            return None
+        
+        def prefetch():
+            for ship_class, variant in missing:
+                with self.design_lock:
+                    if (ship_class, variant) not in self.prefetched and variant not in self.spaceship_designs[ship_class]:
+                        self.prefetched[(ship_class, variant)] = self.build_design(ship_class, variant)
         
-        print(f"✅ Created {sum(len(variants) for variants in self.spaceship_designs.values())} alien spaceship designs")
+        self.prefetch_thread = threading.Thread(target=prefetch, name=f"spaceship-prefetch-{level}", daemon=True)
+        self.prefetch_thread.start()
+        return self.prefetch_thread
+    
+    def get_design(self, ship_class, variant):
+        """Get one design, creating it on first request (main thread only)"""
+        design = self.spaceship_designs[ship_class].get(variant)
+        if design is None:
+            with self.design_lock:
+                design = self.prefetched.pop((ship_class, variant), None)
+                if design is None:
+                    design = self.build_design(ship_class, variant)
+            design = self.publish_design(ship_class, variant, design)
+        return design
+    
+    def get_flash_design(self, ship_class, variant):
+        """Get the damage-flash variant of a design, creating it the first time a ship is hit (main thread only)"""
+        flash_sprite = self.flash_designs[ship_class].get(variant)
+        if flash_sprite is None:
+            flash_sprite = create_flash_sprite(self.get_design(ship_class, variant))
+            if self.surface_finalizer:
+                flash_sprite = self.surface_finalizer(flash_sprite, f"spaceships_flash.{ship_class}.{variant}")
+            self.flash_designs[ship_class][variant] = flash_sprite
+        return flash_sprite
+    
+    def build_design(self, ship_class, variant):
+        """Load a design from file or the art cache, or create it procedurally"""
+        cache_name = f"spaceship_{ship_class}_{variant}"
+        cached = get_art_cache().load(cache_name, self.cache_version)
+        if cached is not None:
+            sprite = cached['design']
+        else:
+            ship_path = f"spaceship_designs/{ship_class}_{variant}.png"
+            sprite = None
+            if os.path.exists(ship_path):
+                try:
+                    sprite = pygame.image.load(ship_path)
+                    assets_log.info("📁 Loaded %s %s from file", ship_class, variant)
+                except Exception as e:
+                    assets_log.warning("⚠️ Error loading %s: %s", ship_path, e)
+            if sprite is None:
+                # Create procedural spaceship
+                sprite = self.create_spaceship(ship_class, variant)
+            get_art_cache().save(cache_name, self.cache_version, {'design': sprite})
+        return sprite
+    
+    def publish_design(self, ship_class, variant, sprite):
+        """Finalize a built design (display conversion must happen on the main thread) and make it available"""
+        if self.surface_finalizer:
+            sprite = self.surface_finalizer(sprite, f"spaceships.{ship_class}.{variant}")
+        self.spaceship_designs[ship_class][variant] = sprite
+        return sprite
     
     def create_spaceship(self, ship_class, variant):
         """Create procedural alien spaceship designs"""
@@ -417,10 +496,11 @@ class SpaceshipDesigner:
             for i in range(7):
                 x = 8 + i * 6
                 pygame.draw.ellipse(ship, (120, 160, 120), (x, 12, 8, 11))
-            # Bio-luminescent spots
+            # Bio-luminescent spots (private RNG: designs may be built on the prefetch thread)
+            spot_rng = random.Random(variant)
             for i in range(15):
-                x = random.randint(5, 50)
-                y = random.randint(8, 27)
+                x = spot_rng.randint(5, 50)
+                y = spot_rng.randint(8, 27)
                 pygame.draw.circle(ship, (150, 255, 150), (x, y), 1)
                 
         else:  # colossus
@@ -450,30 +530,23 @@ class SpaceshipDesigner:
         
         return ship
     
-    def get_spaceship_design(self, ship_class, level=1):
-        """Get appropriate spaceship design for level"""
-        if ship_class not in self.spaceship_designs:
-            return self.create_basic_ship()
-        
-        variants = list(self.spaceship_designs[ship_class].keys())
-        if not variants:
-            return self.create_basic_ship()
+    def get_spaceship_design(self, ship_class, level=1, flash=False):
+        """Get appropriate spaceship design for level (flash=True for the damage-flash variant)"""
+        if ship_class not in SPACESHIP_TYPES:
+            basic_ship = self.create_basic_ship()
+            return create_flash_sprite(basic_ship) if flash else basic_ship
         
         # Use different variants based on level
-        variant_index = (level - 1) % len(variants)
-        return self.spaceship_designs[ship_class][variants[variant_index]]
+        variant = self.get_variant(ship_class, level)
+        return self.get_flash_design(ship_class, variant) if flash else self.get_design(ship_class, variant)
     
     def get_random_spaceship(self, ship_class):
         """Get random spaceship variant"""
-        if ship_class not in self.spaceship_designs:
-            return self.create_basic_ship()
-        
-        variants = list(self.spaceship_designs[ship_class].keys())
-        if not variants:
+        if ship_class not in SPACESHIP_TYPES:
             return self.create_basic_ship()
         
-        variant = random.choice(variants)
-        return self.spaceship_designs[ship_class][variant]
+        variant = random.choice(SPACESHIP_TYPES[ship_class])
+        return self.get_design(ship_class, variant)
     
     def get_ship_class_for_alien_type(self, alien_type):
         """Map alien types to ship classes"""
@@ -0,0 +1,78 @@
+"""
+Spatial Hash for Cosmic Raiders
+Uniform-grid broad phase: entities are bucketed by the cells their rect
+overlaps, so a collision query only tests entities sharing those cells
+"""
+
+import pygame
+
+DEFAULT_CELL_SIZE = 64  # Roughly one large alien ship per cell
+
+
+class SpatialHash:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = []
+        self.rects = []
+        self.item_indices = {}
+
+    def clear(self):
+        """Remove all entities (call once per tick before re-inserting)"""
+        self.cells.clear()
+        self.items.clear()
+        self.rects.clear()
+        self.item_indices.clear()
+
+    def _cells_for(self, rect):
+        """Yield the grid cells a rect overlaps"""
+        size = self.cell_size
+        left = int(rect.left) // size
+        right = (int(rect.right) - 1) // size
+        top = int(rect.top) // size
+        bottom = (int(rect.bottom) - 1) // size
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                yield (cell_x, cell_y)
+
+    def insert(self, item, rect):
+        """Add an entity with its collision rect"""
+        index = len(self.items)
+        self.items.append(item)
+        self.rects.append(pygame.Rect(rect))
+        self.item_indices[id(item)] = index
+
+        for cell in self._cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = [index]
+            else:
+                bucket.append(index)
+        return index
+
+    def remove(self, item):
+        """Remove an entity so later queries in this tick skip it"""
+        index = self.item_indices.pop(id(item), None)
+        if index is not None:
+            self.items[index] = None
+
+    def query(self, rect):
+        """Get entities colliding with rect, in insertion order"""
+        candidates = set()
+        for cell in self._cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket:
+                candidates.update(bucket)
+
+        if not candidates:
+            return []
+
+        hits = []
+        for index in sorted(candidates):
+            item = self.items[index]
+            if item is not None and self.rects[index].colliderect(rect):
+                hits.append(item)
+        return hits
+
+    def __len__(self):
+        return len(self.item_indices)
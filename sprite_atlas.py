@@ -0,0 +1,142 @@
+"""
+Sprite Atlas for Cosmic Raiders
+Packs many small sprites into a few large page surfaces (shelf packing) with a
+name -> (page, sub-rect) index, so draw paths can batch blits from the pages
+"""
+
+import pygame
+from game_logger import get_logger
+
+assets_log = get_logger("assets")
+
+ATLAS_PAGE_SIZE = 1024
+ATLAS_PADDING = 1  # Transparent gap between sprites so neighbours never bleed
+MAX_ATLAS_SPRITE = 256  # Larger surfaces (backgrounds) stay standalone
+
+
+class SpriteAtlas:
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pending = []  # (name, surface, container, key) waiting for build()
+        self.pages = []
+        self.index = {}  # name -> (page number, rect)
+        self.sources = {}  # packed surface -> (page surface, rect)
+
+    def add(self, name, surface, container=None, key=None):
+        """Queue a sprite for packing; container[key] is swapped for the packed copy on build()"""
+        width, height = surface.get_size()
+        if width == 0 or height == 0 or max(width, height) > min(MAX_ATLAS_SPRITE, self.page_size):
+            return False
+        self.pending.append((name, surface, container, key))
+        return True
+
+    def add_container(self, container, prefix):
+        """Queue every surface in a (nested) dict or list"""
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in list(items):
+            name = f"{prefix}.{key}"
+            if isinstance(value, pygame.Surface):
+                self.add(name, value, container, key)
+            elif isinstance(value, (dict, list)):
+                self.add_container(value, name)
+
+    def add_game_assets(self, visual_assets=None, alien_design_manager=None, spaceship_designer=None):
+        """Queue all sprites cached by the game's asset managers"""
+        if visual_assets:
+            self.add_container(visual_assets.sprites, "visual_assets")
+        if alien_design_manager:
+            self.add_container(alien_design_manager.design_variations, "alien_designs")
+            self.add_container(alien_design_manager.flash_variations, "alien_designs_flash")
+        if spaceship_designer:
+            self.add_container(spaceship_designer.spaceship_designs, "spaceships")
+            self.add_container(spaceship_designer.flash_designs, "spaceships_flash")
+
+    def pack(self, sizes):
+        """Place (width, height) boxes on shelves; returns (page number, x, y) per box"""
+        order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+        placements = [None] * len(sizes)
+        page, shelf_x, shelf_y, shelf_height = 0, 0, 0, 0
+        for i in order:
+            width, height = sizes[i][0] + self.padding, sizes[i][1] + self.padding
+            if shelf_x + width > self.page_size:
+                # Start a new shelf below the current one
+                shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+            if shelf_y + height > self.page_size:
+                # Start a new page
+                page, shelf_x, shelf_y, shelf_height = page + 1, 0, 0, 0
+            placements[i] = (page, shelf_x, shelf_y)
+            shelf_x += width
+            shelf_height = max(shelf_height, height)
+        return placements
+
+    def build(self):
+        """Pack the queued sprites into pages and point their containers at the packed copies"""
+        if not self.pending:
+            return self
+
+        sizes = [surface.get_size() for _, surface, _, _ in self.pending]
+        placements = self.pack(sizes)
+        page_count = max(page for page, _, _ in placements) + 1
+
+        # Trim every page to the area actually used
+        extents = [[1, 1] for _ in range(page_count)]
+        for (page, x, y), (width, height) in zip(placements, sizes):
+            extents[page][0] = max(extents[page][0], x + width)
+            extents[page][1] = max(extents[page][1], y + height)
+        first_page = len(self.pages)
+        for width, height in extents:
+            self.pages.append(pygame.Surface((width, height), pygame.SRCALPHA))
+
+        rects = []
+        for (_, surface, _, _), (page, x, y) in zip(self.pending, placements):
+            rect = pygame.Rect((x, y), surface.get_size())
+            self.pages[first_page + page].blit(surface, rect)  # Exact copy onto the transparent page
+            rects.append(rect)
+        if pygame.display.get_surface() is not None:
+            self.pages[first_page:] = [page.convert_alpha() for page in self.pages[first_page:]]
+
+        for (name, _, container, key), (page, _, _), rect in zip(self.pending, placements, rects):
+            page_number = first_page + page
+            page_surface = self.pages[page_number]
+            packed = page_surface.subsurface(rect)  # Shares the page's pixels
+            self.index[name] = (page_number, rect)
+            self.sources[packed] = (page_surface, rect)
+            if container is not None:
+                container[key] = packed
+
+        assets_log.info("🗺️ Packed %d sprites into %d atlas page(s)", len(self.pending), page_count)
+        self.pending = []
+        return self
+
+    def get(self, name):
+        """Get (page surface, sub-rect) for a packed sprite name"""
+        page_number, rect = self.index[name]
+        return self.pages[page_number], rect
+
+    def lookup(self, surface):
+        """Get (page surface, sub-rect) for a packed sprite surface, or None"""
+        return self.sources.get(surface)
+
+    def source(self, surface, dest):
+        """Get a Surface.blits entry drawing surface at dest, from its page when it is packed"""
+        packed = self.sources.get(surface)
+        if packed is None:
+            return surface, dest
+        page_surface, rect = packed
+        return page_surface, dest, rect
+
+    def get_stats(self):
+        """Get sprite and page counts and page memory"""
+        return {
+            'sprites': len(self.index),
+            'pages': len(self.pages),
+            'page_sizes': [page.get_size() for page in self.pages],
+            'bytes': sum(page.get_pitch() * page.get_height() for page in self.pages)
+        }
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __len__(self):
+        return len(self.index)
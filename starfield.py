@@ -0,0 +1,81 @@
+"""
+Starfield for Cosmic Raiders
+Twinkling star layer generated once into NumPy arrays: brightness is computed
+for every star in one vectorised step and the stars are drawn with a single
+batched blit from a handful of pre-rendered star stamps
+"""
+
+import random
+import numpy as np
+import pygame
+
+STAR_COUNT = 50
+STAR_SEED = 42  # Fixed seed for consistent star positions
+TWINKLE_SPEED = 2.0
+TWINKLE_MIN = 100  # Dimmest twinkle brightness (out of 255)
+BRIGHTNESS_LEVELS = 16  # Pre-rendered brightness steps per star kind
+
+# Star kinds as (color, radius); radius 0 is a single pixel
+STAR_KINDS = [
+    ((255, 255, 255), 2),
+    ((200, 200, 255), 1),
+    ((255, 255, 200), 0),
+]
+
+
+def create_star_stamp(color, radius, alpha):
+    """Render one star at one brightness onto a small transparent surface"""
+    size = radius * 2 + 1
+    stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+    if radius == 0:
+        stamp.set_at((0, 0), (*color, alpha))
+    else:
+        pygame.draw.circle(stamp, (*color, alpha), (radius, radius), radius)
+    return stamp
+
+
+class Starfield:
+    def __init__(self, width, height, count=STAR_COUNT, seed=STAR_SEED, twinkle_speed=TWINKLE_SPEED):
+        self.width = width
+        self.height = height
+        self.twinkle_speed = twinkle_speed
+
+        # Private RNG so the gameplay random stream is untouched
+        star_rng = random.Random(seed)
+        positions = [(star_rng.randint(0, width), star_rng.randint(0, height)) for _ in range(count)]
+        self.x = np.array([x for x, _ in positions], dtype=np.int32)
+        self.y = np.array([y for _, y in positions], dtype=np.int32)
+        self.kind = np.arange(count, dtype=np.int32) % len(STAR_KINDS)
+        self.phase = np.arange(count, dtype=np.float64) * 0.5
+
+        # Stamps are blitted from their top-left corner, so offset by each kind's radius
+        radii = np.array([radius for _, radius in STAR_KINDS], dtype=np.int32)
+        self.draw_x = (self.x - radii[self.kind]).tolist()
+        self.radius = radii[self.kind]
+        self.stamp_base = self.kind * BRIGHTNESS_LEVELS
+
+        # Flat list indexed by kind * BRIGHTNESS_LEVELS + level
+        self.stamps = [
+            create_star_stamp(color, radius, round(level * 255 / (BRIGHTNESS_LEVELS - 1)))
+            for color, radius in STAR_KINDS
+            for level in range(BRIGHTNESS_LEVELS)
+        ]
+
+    def convert(self):
+        """Convert the star stamps to the display format (needs a display mode)"""
+        self.stamps = [stamp.convert_alpha() for stamp in self.stamps]
+
+    def get_levels(self, time_offset, brightness=1.0):
+        """Get every star's brightness step for a moment in time"""
+        twinkle = TWINKLE_MIN + (255 - TWINKLE_MIN) * np.abs(np.sin(time_offset * self.twinkle_speed + self.phase))
+        return np.rint(twinkle * (brightness * (BRIGHTNESS_LEVELS - 1) / 255)).astype(np.int32)
+
+    def draw(self, screen, time_offset, scroll_y=0, brightness=1.0):
+        """Draw every star in one batched blit; scroll_y wraps the field vertically"""
+        if brightness <= 0:
+            return
+        stamp_indices = (self.stamp_base + self.get_levels(time_offset, min(1.0, brightness))).tolist()
+        draw_y = ((self.y + int(scroll_y)) % self.height - self.radius).tolist()
+        stamps = self.stamps
+        screen.blits([(stamps[index], (x, y)) for index, x, y in zip(stamp_indices, self.draw_x, draw_y)],
+                     doreturn=False)
@@ -0,0 +1,210 @@
+"""
+Startup Profiler for Cosmic Raiders
+Opt-in cold-start profiling (--profile-startup): times every game module import
+and every startup stage, with memory growth and live surfaces per stage, and
+writes the breakdown as a JSON report
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import importlib.abc
+import importlib.machinery
+
+PROFILE_FLAG = "--profile-startup"
+DEFAULT_REPORT_PATH = "startup_profile.json"
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+TRACKED_PACKAGES = ("pygame", "numpy")  # Third-party imports that dominate cold start
+
+_active = None
+
+
+def get_memory_bytes():
+    """Resident memory of the process (includes SDL pixel buffers, unlike tracemalloc)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # Peak, in KB on Linux
+        except ImportError:
+            return 0
+
+
+def count_surfaces():
+    """Count live pygame surfaces and their pixel bytes (subsurfaces share their parent's pixels)"""
+    pygame = sys.modules.get("pygame")
+    if pygame is None:
+        return 0, 0
+    surfaces = {}
+    visited = set()
+    # Surfaces are not tracked by the garbage collector, and neither are dicts holding only
+    # surfaces and strings, so walk down from the tracked containers
+    pending = gc.get_objects()
+    while pending:
+        container = pending.pop()
+        for referent in gc.get_referents(container):
+            if isinstance(referent, pygame.Surface):
+                surfaces[id(referent)] = referent
+            elif isinstance(referent, (dict, list, tuple)) and not gc.is_tracked(referent):
+                if id(referent) not in visited:
+                    visited.add(id(referent))
+                    pending.append(referent)
+    pixel_bytes = 0
+    for surface in surfaces.values():
+        try:
+            if surface.get_parent() is None:
+                pixel_bytes += surface.get_pitch() * surface.get_height()
+        except pygame.error:
+            pass  # Display surface after the display was closed
+    return len(surfaces), pixel_bytes
+
+
+class TimedLoader(importlib.abc.Loader):
+    """Loader wrapper that times module execution"""
+    def __init__(self, loader, import_timer):
+        self.loader = loader
+        self.import_timer = import_timer
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.import_timer.begin()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.import_timer.end(module.__name__)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path hook that times imports of game modules and the big third-party packages"""
+    def __init__(self):
+        self.records = []
+        self.stack = []  # [start time, time spent in nested imports]
+
+    def is_tracked(self, fullname, spec):
+        if fullname in TRACKED_PACKAGES:
+            return True
+        return bool(spec.has_location and spec.origin) and os.path.dirname(os.path.abspath(spec.origin)) == GAME_DIR
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is None or spec.loader is None or not self.is_tracked(fullname, spec):
+            return None
+        spec.loader = TimedLoader(spec.loader, self)
+        return spec
+
+    def begin(self):
+        self.stack.append([time.perf_counter(), 0.0])
+
+    def end(self, name):
+        start, nested = self.stack.pop()
+        seconds = time.perf_counter() - start
+        if self.stack:
+            self.stack[-1][1] += seconds
+        self.records.append({'module': name, 'seconds': seconds, 'self_seconds': seconds - nested})
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.import_timer = ImportTimer()
+        self.stages = []
+        self.snapshot()
+
+    def snapshot(self):
+        """Remember the current memory and surface totals (not counted as stage time)"""
+        self.last_memory = get_memory_bytes()
+        self.last_surfaces, self.last_surface_bytes = count_surfaces()
+        self.last_time = time.perf_counter()
+
+    def install(self):
+        """Start timing imports"""
+        sys.meta_path.insert(0, self.import_timer)
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if self.import_timer in sys.meta_path:
+            sys.meta_path.remove(self.import_timer)
+
+    def mark(self, name):
+        """Close the stage that ran since the previous mark"""
+        seconds = time.perf_counter() - self.last_time
+        memory = get_memory_bytes()
+        surfaces, surface_bytes = count_surfaces()
+        self.stages.append({
+            'stage': name,
+            'seconds': seconds,
+            'memory_bytes': memory - self.last_memory,
+            'surfaces': surfaces - self.last_surfaces,
+            'surface_bytes': surface_bytes - self.last_surface_bytes
+        })
+        self.snapshot()
+
+    def get_report(self):
+        """Get the full breakdown as a JSON-serialisable dict"""
+        surfaces, surface_bytes = count_surfaces()
+        return {
+            'stage_seconds': sum(stage['seconds'] for stage in self.stages),
+            'memory_bytes': get_memory_bytes(),
+            'surfaces': surfaces,
+            'surface_bytes': surface_bytes,
+            'stages': self.stages,
+            'imports': self.import_timer.records
+        }
+
+    def format_summary(self):
+        """Get a short human-readable summary of the slowest stages and imports"""
+        report = self.get_report()
+        lines = [f"⏱️ Startup stages: {report['stage_seconds'] * 1000:.1f} ms, "
+                 f"{report['surfaces']} surfaces ({report['surface_bytes'] / 1024:.0f} KB)"]
+        for stage in sorted(self.stages, key=lambda stage: -stage['seconds'])[:8]:
+            lines.append(f"   {stage['stage']:<24} {stage['seconds'] * 1000:8.1f} ms "
+                         f"{stage['memory_bytes'] / 1024:+8.0f} KB {stage['surfaces']:+5d} surfaces")
+        for record in sorted(self.import_timer.records, key=lambda record: -record['self_seconds'])[:8]:
+            lines.append(f"   import {record['module']:<17} {record['self_seconds'] * 1000:8.1f} ms")
+        return lines
+
+
+def start():
+    """Start profiling (imports made from now on are timed)"""
+    global _active
+    if _active is None:
+        _active = StartupProfiler()
+        _active.install()
+    return _active
+
+
+def start_if_requested(argv=None):
+    """Start profiling when --profile-startup is on the command line"""
+    argv = sys.argv if argv is None else argv
+    if any(arg == PROFILE_FLAG or arg.startswith(PROFILE_FLAG + "=") for arg in argv[1:]):
+        return start()
+    return None
+
+
+def mark(name):
+    """Close a startup stage (does nothing unless profiling)"""
+    if _active is not None:
+        _active.mark(name)
+
+
+def finish(path=DEFAULT_REPORT_PATH):
+    """Stop profiling, write the JSON report and return it"""
+    global _active
+    if _active is None:
+        return None
+    report = _active.get_report()
+    summary = _active.format_summary()
+    _active.uninstall()
+    _active = None
+
+    with open(path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+    for line in summary:
+        print(line)
+    print(f"📄 Startup profile written to {path}")
+    return report
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk procedural art cache
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from art_cache import ArtCache, generator_version
+from visual_assets import VisualAssets
+
+
+def test_round_trip():
+    """Cached surfaces should come back pixel-identical with the same layout"""
+    print("🧪 Testing art cache round trip...")
+
+    pygame.display.init()
+    opaque = pygame.Surface((8, 6))
+    opaque.fill((10, 20, 30))
+    opaque.set_colorkey((10, 20, 30))
+    container = {
+        'sprites': VisualAssets().sprites,
+        'opaque': [opaque]
+    }
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ArtCache(cache_dir)
+        assert cache.load("assets", "v1") is None
+        assert cache.save("assets", "v1", container)
+        loaded = cache.load("assets", "v1")
+        assert cache.load("assets", "v2") is None  # Another generator version misses
+        assert cache.get_stats() == {'hits': 1, 'misses': 2, 'writes': 1}
+
+    assert list(loaded['sprites']) == list(container['sprites'])
+    assert len(loaded['sprites']['explosion_frames']) == len(container['sprites']['explosion_frames'])
+    assert loaded['opaque'][0].get_colorkey() == opaque.get_colorkey()
+    for name, sprite in container['sprites'].items():
+        for original, cached in zip(sprite if isinstance(sprite, list) else [sprite],
+                                    loaded['sprites'][name] if isinstance(sprite, list) else [loaded['sprites'][name]]):
+            mode = "RGBA" if original.get_flags() & pygame.SRCALPHA else "RGB"
+            assert pygame.image.tobytes(original, mode) == pygame.image.tobytes(cached, mode), name
+    print(f"✅ {len(container['sprites'])} sprite entries survived the round trip")
+
+
+def test_generator_version():
+    """Editing a generator or dropping a sprite file should change the version"""
+    print("🧪 Testing generator versions...")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        source = os.path.join(work_dir, "generator.py")
+        sprite_dir = os.path.join(work_dir, "sprites")
+        os.mkdir(sprite_dir)
+        with open(source, "w") as source_file:
+            source_file.write("COLOR = (255, 0, 0)\n")
+
+        version = generator_version(source, sprite_dir)
+        assert generator_version(source, sprite_dir) == version
+        with open(os.path.join(sprite_dir, "player_ship.png"), "wb") as sprite_file:
+            sprite_file.write(b"png")
+        with_sprite = generator_version(source, sprite_dir)
+        assert with_sprite != version
+        with open(source, "w") as source_file:
+            source_file.write("COLOR = (0, 255, 0)\n")
+        assert generator_version(source, sprite_dir) != with_sprite
+    print("✅ Generator versions track source and asset changes")
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_generator_version()
+    print("🎉 Art cache tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the music transcoding cache, streamer and SFX bank
+"""
+
+import os
+import sys
+import wave
+import shutil
+import tempfile
+import threading
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from audio_assets import SoundBank, MusicStreamer, transcode_music, source_key
+from audio_manager import AudioManager, MIXER_SETTINGS
+from optimized_audio_manager import OptimizedAudioManager
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+MUSIC_PATH = os.path.join(GAME_DIR, "sounds", "menu_music.wav")
+
+
+def test_transcode_music_cached():
+    """Music should be transcoded once to the mixer rate and reused afterwards"""
+    print("🧪 Testing music transcoding...")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cached = transcode_music(MUSIC_PATH, 22050, cache_dir, encoder=None)
+        assert cached != MUSIC_PATH and cached.startswith(cache_dir)
+        with wave.open(MUSIC_PATH) as source, wave.open(cached) as result:
+            assert result.getframerate() == 22050
+            assert result.getnchannels() == source.getnchannels()
+            assert abs(result.getnframes() / 22050 - source.getnframes() / source.getframerate()) < 0.01
+        modified = os.path.getmtime(cached)
+        assert transcode_music(MUSIC_PATH, 22050, cache_dir, encoder=None) == cached
+        assert os.path.getmtime(cached) == modified
+        assert os.path.getsize(cached) < os.path.getsize(MUSIC_PATH)
+    assert transcode_music(MUSIC_PATH, 22050, "", encoder=None) == MUSIC_PATH  # Cache off
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        source = os.path.join(work_dir, "track.wav")
+        shutil.copyfile(MUSIC_PATH, source)
+        key = source_key(source)
+        assert source_key(source) == key
+        os.utime(source, ns=(0, os.stat(source).st_mtime_ns + 1_000_000_000))  # An edited track
+        assert source_key(source) != key
+    print("✅ Music transcoded once and reused")
+
+
+def test_sound_bank_and_streamer():
+    """Effects should decode into the bank and music switches should happen off the caller's thread"""
+    print("🧪 Testing sound bank and music streamer...")
+
+    pygame.mixer.init(22050, -16, 2, 256)
+    cache_dir = tempfile.TemporaryDirectory()
+    os.environ["COSMIC_RAIDERS_AUDIO_CACHE"] = cache_dir.name
+    try:
+        bank = SoundBank()
+        bank.load('player_shoot', os.path.join(GAME_DIR, "sounds", "laser_shoot.wav"), 0.3)
+        assert 'player_shoot' in bank and bank.get_stats()['bytes'] > 0
+        assert abs(bank.get('player_shoot').get_volume() - 0.3) < 0.01
+
+        streamer = MusicStreamer()
+        streamer.play(MUSIC_PATH)
+        assert streamer.wait_idle(30)
+        assert streamer.current_path == MUSIC_PATH and pygame.mixer.music.get_busy()
+        streamer.stop()
+        assert streamer.wait_idle(30) and streamer.current_path is None
+        streamer.close()
+
+        # Switches queued behind a busy worker collapse to the newest, but prepares still run
+        executed = []
+        started, release = threading.Event(), threading.Event()
+        coalescing = MusicStreamer()
+        coalescing.execute = lambda command: (started.set(), release.wait(10), executed.append(command))
+        coalescing.play('a')
+        assert started.wait(10)  # The worker is now busy with play('a')
+        coalescing.play('b')
+        coalescing.prepare(['x'])
+        coalescing.play('c')
+        release.set()
+        assert coalescing.wait_idle(30)
+        coalescing.close()
+        assert executed == [('play', 'a', -1), ('play', 'c', -1), ('prepare', ['x'])], executed
+    finally:
+        del os.environ["COSMIC_RAIDERS_AUDIO_CACHE"]
+        cache_dir.cleanup()
+        pygame.mixer.quit()
+    print("✅ Sound bank and streamer working")
+
+
+def test_audio_engine_loads_in_background():
+    """The audio engine should open the mixer once and decode effects off the main thread"""
+    print("🧪 Testing background audio loading...")
+
+    os.environ["COSMIC_RAIDERS_AUDIO_CACHE"] = "off"
+    try:
+        audio = OptimizedAudioManager()  # Compatibility name for the same engine
+        assert isinstance(audio, AudioManager)
+        audio.play_sound('alien_destroy')  # Skipped or played, but never waits for decoding
+        assert audio.wait_until_loaded(30)
+        assert audio.loader_thread.name == "sound-loader"
+        assert 'player_shoot' in audio.sound_bank and audio.sounds_loaded
+        assert pygame.mixer.get_init() == (MIXER_SETTINGS['frequency'], MIXER_SETTINGS['size'],
+                                           MIXER_SETTINGS['channels'])
+        audio.play_sound('player_shoot')
+        assert audio.voice_manager.get_stats()['played'] >= 1
+        audio.cleanup()
+    finally:
+        del os.environ["COSMIC_RAIDERS_AUDIO_CACHE"]
+    print("✅ Effects decoded in the background")
+
+
+if __name__ == "__main__":
+    test_transcode_music_cached()
+    test_sound_bank_and_streamer()
+    test_audio_engine_loads_in_background()
+    print("🎉 Audio asset tests completed successfully!")
+    sys.exit(0)
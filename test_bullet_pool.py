@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the structure-of-arrays bullet pool
+"""
+
+import sys
+
+import pygame
+from bullet_pool import BulletPool, BULLET_BASE_SPEED, OFF_SCREEN_MARGIN
+
+
+def test_spawn_grow_and_compact():
+    """Spawning past capacity should grow the arrays, and compact() should keep survivors in order"""
+    print("🧪 Testing bullet pool growth and compaction...")
+
+    pool = BulletPool(1, 600, capacity=4)
+    for i in range(10):
+        assert pool.spawn(i * 10, 300) == i
+    assert pool.capacity >= 10 and len(pool) == 10
+    assert list(pool.x[:pool.count]) == [i * 10 for i in range(10)]  # Grown arrays kept every bullet
+
+    for index in (0, 3, 4, 9):
+        pool.kill(index)
+    assert len(pool) == 6 and pool.count == 10  # Slots are only reclaimed by compact()
+    pool.compact()
+    assert pool.count == 6
+    assert list(pool.x[:pool.count]) == [10, 20, 50, 60, 70, 80]
+    assert pool.alive[:6].all() and not pool.alive[6:10].any()
+    print("✅ Pool grew and compacted in firing order")
+
+
+def test_update_culls_off_screen():
+    """Bullets should move by speed * direction and disappear once they leave the screen"""
+    print("🧪 Testing bullet movement and culling...")
+
+    pool = BulletPool(1, 600)
+    pool.spawn(100, 5)  # Player bullet about to leave the top
+    pool.spawn(200, 300)
+    pool.spawn(300, 595, direction=-1)  # Alien bullet about to leave the bottom
+    pool.spawn(400, 300, speed_multiplier=1.5, direction=-1)
+    pool.update()
+    assert list(pool.y[:pool.count]) == [5 - BULLET_BASE_SPEED, 300 - BULLET_BASE_SPEED,
+                                         595 + BULLET_BASE_SPEED, 300 + BULLET_BASE_SPEED * 1.5]
+    pool.update()
+    assert len(pool) == 2 and list(pool.x[:pool.count]) == [200, 400]
+    assert all(-OFF_SCREEN_MARGIN <= y <= 600 + OFF_SCREEN_MARGIN for y in pool.y[:pool.count])
+    print("✅ Off-screen bullets culled")
+
+
+def test_overlapping_matches_rects():
+    """Vectorised overlap tests should agree with the per-bullet Rects the game used before"""
+    print("🧪 Testing bullet overlap queries...")
+
+    pool = BulletPool(-1, 600)
+    starts = [(100.7, 50.0), (120.2, 60.0), (300.0, 400.0), (98.0, 47.5), (-3.6, 81.0)]
+    legacy_rects = []
+    for x, y in starts:
+        pool.spawn(x, y, speed_multiplier=0.75)  # 6 px a frame downwards
+        legacy_rects.append(pygame.Rect(x, y, pool.width, pool.height))
+    pool.update()
+    for rect, (_, y) in zip(legacy_rects, starts):
+        rect.y = y + BULLET_BASE_SPEED * 0.75  # The old Bullet.update assigned the float y
+
+    for index, legacy in enumerate(legacy_rects):
+        assert pool.get_rect(index) == legacy, (index, pool.get_rect(index), legacy)
+
+    target = pygame.Rect(90, 40, 40, 30)
+    expected = [index for index, legacy in enumerate(legacy_rects) if legacy.colliderect(target)]
+    assert list(pool.overlapping(target)) == expected == [0, 1, 3]
+    pool.kill(1)
+    assert list(pool.overlapping(target)) == [0, 3]  # Dead bullets never collide
+    print("✅ Overlap queries match per-bullet rects")
+
+
+if __name__ == "__main__":
+    test_spawn_grow_and_compact()
+    test_update_culls_off_screen()
+    test_overlapping_matches_rects()
+    print("🎉 Bullet pool tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for the buffered per-subsystem game logger
+"""
+
+import io
+import sys
+import contextlib
+
+import game_logger
+from game_logger import get_logger, parse_levels, LOG_QUEUE_SIZE
+
+
+def test_parse_levels():
+    """Level specs should parse, skip empty parts and fall back on unknown names"""
+    print("🧪 Testing log level parsing...")
+
+    assert parse_levels("WARNING,combat=DEBUG") == ("WARNING", {'combat': "DEBUG"})
+    assert parse_levels(" info , ,spawner = debug,") == ("INFO", {'spawner': "DEBUG"})
+    assert parse_levels("") == (None, {})
+    assert parse_levels(None) == (None, {})
+
+    warnings = io.StringIO()
+    with contextlib.redirect_stderr(warnings):
+        assert parse_levels("verbose,combat=loud") == ("INFO", {'combat': "INFO"})
+        game_logger.configure("verbos", {'combat': "loud"}, stream=io.StringIO())  # Must not raise
+    assert "'verbose'" in warnings.getvalue() and "'loud'" in warnings.getvalue()
+    game_logger.configure()
+    print("✅ Level specs parsed, bad names fall back to INFO")
+
+
+def test_subsystem_filtering_and_flush():
+    """A quiet subsystem should drop DEBUG records, and shutdown() should flush the rest"""
+    print("🧪 Testing subsystem levels and flushing...")
+
+    stream = io.StringIO()
+    game_logger.configure("DEBUG", {'test_quiet': "WARNING"}, stream=stream)
+    quiet = get_logger("test_quiet")
+    chatty = get_logger("test_chatty")
+    quiet.debug("quiet debug")
+    quiet.warning("quiet warning")
+    for i in range(3):
+        chatty.debug("chatty debug %d", i)
+    game_logger.shutdown()
+
+    lines = stream.getvalue().splitlines()
+    assert "quiet debug" not in lines
+    assert lines == ["quiet warning", "chatty debug 0", "chatty debug 1", "chatty debug 2"]
+    game_logger.configure()
+    print("✅ Subsystem levels respected and queued records flushed")
+
+
+def test_dropped_records():
+    """Records beyond the queue size should be dropped and counted, never block"""
+    print("🧪 Testing dropped record counting...")
+
+    game_logger.configure(stream=io.StringIO())
+    game_logger.shutdown()  # No writer thread, so nothing drains the queue
+    log = get_logger("test_flood")
+    for i in range(LOG_QUEUE_SIZE + 25):
+        log.info("record %d", i)
+    stats = game_logger.get_stats()
+    assert stats == {'queued': LOG_QUEUE_SIZE, 'dropped': 25}, stats
+    game_logger.configure()
+    print(f"✅ {stats['dropped']} records dropped past a full queue")
+
+
+if __name__ == "__main__":
+    test_parse_levels()
+    test_subsystem_filtering_and_flush()
+    test_dropped_records()
+    print("🎉 Game logger tests completed successfully!")
+    sys.exit(0)
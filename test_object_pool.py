@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test script for the generic object pool
+"""
+
+import sys
+
+from object_pool import ObjectPool
+
+
+class Token:
+    def __init__(self, value):
+        self.value = value
+
+    def reset(self, value):
+        self.value = value
+
+
+def test_acquire_and_reuse():
+    """Released objects should be re-initialised and handed out again"""
+    print("🧪 Testing object pool reuse...")
+
+    pool = ObjectPool(Token)
+    first = pool.acquire(1)
+    assert pool.release(first)
+    again = pool.acquire(2)
+    assert again is first and again.value == 2
+    assert pool.get_stats() == {'live': 1, 'free': 0, 'created': 1, 'reused': 1}
+    print("✅ Released object reused")
+
+
+def test_double_release_ignored():
+    """Releasing an object twice (or one the pool never handed out) must not duplicate it"""
+    print("🧪 Testing double release...")
+
+    pool = ObjectPool(Token)
+    token, other = pool.acquire(1), pool.acquire(2)
+    assert pool.release(token)
+    assert not pool.release(token)
+    assert not pool.release(Token(3))  # Never acquired from this pool
+    assert pool.get_stats()['live'] == 1 and pool.free == [token]
+
+    first, second = pool.acquire(4), pool.acquire(5)
+    assert first is token and second is not token  # Two owners never share one object
+    assert other.value == 2
+    print("✅ Double release ignored")
+
+
+if __name__ == "__main__":
+    test_acquire_and_reuse()
+    test_double_release_ignored()
+    print("🎉 Object pool tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for frame timing in the performance monitor
+"""
+
+import os
+import sys
+import json
+import csv
+import random
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from performance_monitor import PerformanceMonitor, PhaseTimer, FRAME_PHASES
+
+
+def test_phase_ring_buffer():
+    """The ring buffer should keep only the newest frames, oldest first"""
+    print("🧪 Testing phase timer ring buffer...")
+
+    timer = PhaseTimer(phases=('update', 'draw'), history=4)
+    for frame in range(6):
+        timer.begin_frame()
+        timer.lap('update')
+        timer.current[1] = float(frame)  # Known draw times
+        timer.end_frame()
+    assert timer.count == 4
+    assert list(timer.get_recent()[:, 1]) == [2.0, 3.0, 4.0, 5.0]
+    summary = timer.get_summary()
+    assert summary['phases']['draw']['mean_ms'] == 3.5 and summary['phases']['draw']['max_ms'] == 5.0
+    print("✅ Ring buffer keeps the newest frames")
+
+
+def test_game_loop_phases():
+    """Game.run should time every phase of a frame and export the summary on exit"""
+    print("🧪 Testing game loop frame timing...")
+
+    from cosmic_raiders import Game
+    random.seed(2024)
+    game = Game(seed=5)
+    game.audio_manager.muted = True
+    game.start_game()
+    with tempfile.TemporaryDirectory() as work_dir:
+        game.frame_timing_path = os.path.join(work_dir, "frame_timing.json")
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        try:
+            game.run()
+        except SystemExit:
+            pass
+        with open(game.frame_timing_path) as report_file:
+            report = json.load(report_file)
+
+    assert report['frames'] == 1 and game.frame_timer.overlay_visible
+    assert list(report['phases']) == list(FRAME_PHASES)
+    assert all(len(values) == 1 for values in report['frames_ms'].values())
+    assert report['phases']['clock.tick']['mean_ms'] > 0
+    print(f"✅ Frame timed at {report['mean_frame_ms']:.2f} ms")
+
+
+def test_frame_percentiles_and_export():
+    """Frame times should give percentiles, a jank count and JSON/CSV exports"""
+    print("🧪 Testing frame time percentiles...")
+
+    monitor = PerformanceMonitor(target_fps=60)
+    monitor.frame_times = monitor.frame_times[:100]  # Small ring so it wraps
+    frame_ms = [16.0] * 95 + [40.0] * 5 + [16.0] * 50  # Only the newest 100 are kept
+    for value in frame_ms:
+        monitor.last_time -= value / 1000.0  # Pretend value ms passed since the last frame
+        monitor.update()
+
+    stats = monitor.get_stats()
+    assert stats['frame_count'] == 150 and stats['jank_count'] == 5
+    assert abs(stats['p50_ms'] - 16.0) < 0.5 and abs(stats['p99_ms'] - 40.0) < 0.5
+    assert abs(stats['avg_fps'] - 1000.0 / 18.0) < 1.0  # Last 60 frames: 55 x 16 ms and 5 x 40 ms
+    histogram = monitor.get_histogram()
+    assert sum(histogram['counts']) == 100 and histogram['counts'][40] + histogram['counts'][39] == 5
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        json_path = monitor.export(os.path.join(work_dir, "perf.json"))
+        with open(json_path) as report_file:
+            report = json.load(report_file)
+        assert report['stats']['jank_count'] == 5 and len(report['frame_times_ms']) == 100
+        csv_path = monitor.export(os.path.join(work_dir, "perf.csv"))
+        with open(csv_path) as report_file:
+            rows = list(csv.DictReader(report_file))
+        assert len(rows) == 100 and rows[0]['frame'] == '50'
+        assert sum(int(row['jank']) for row in rows) == 5
+    print(f"✅ p50 {stats['p50_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms, {stats['jank_count']} janky frames")
+
+
+if __name__ == "__main__":
+    test_phase_ring_buffer()
+    test_game_loop_phases()
+    test_frame_percentiles_and_export()
+    print("🎉 Performance monitor tests completed successfully!")
+    sys.exit(0)
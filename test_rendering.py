@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Test script for rendering paths (runs against the dummy SDL video driver)
+"""
+
+import os
+import sys
+import random
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import art_cache
+from cosmic_raiders import Game, GameState, FontManager, SCREEN_WIDTH, SCREEN_HEIGHT
+from simulation import autopilot
+from starfield import Starfield
+from parallax_background import ParallaxBackground
+from sprite_atlas import SpriteAtlas
+from asset_finalizer import AssetFinalizer, describe_format
+
+
+def create_game(**kwargs):
+    """Create a muted game whose procedural art is identical between instances"""
+    random.seed(2024)
+    game = Game(seed=5, **kwargs)
+    game.audio_manager.muted = True
+    game.restart_game(1, 5)
+    return game
+
+
+def test_dirty_rects_match_full_redraw():
+    """Dirty-rectangle frames should be pixel-identical to full redraws"""
+    print("🧪 Testing dirty-rectangle renderer...")
+
+    full = create_game()  # Static background, like the dirty-rect game
+    full.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))  # Both games share the display
+    dirty = create_game(dirty_rects=True)
+    renderer = dirty.dirty_renderer
+
+    frames = 0
+    while frames < 600 and full.state == GameState.PLAYING:
+        for game in (full, dirty):
+            game.update(autopilot(game))
+
+        full.draw_background()
+        full.draw_playing_scene()
+        renderer.begin_frame(dirty.screen)
+        renderer.mark(dirty.draw_playing_scene())
+        renderer.end_frame()
+
+        assert pygame.image.tobytes(full.screen, "RGB") == pygame.image.tobytes(dirty.screen, "RGB"), \
+            f"Frame {frames} differs from a full redraw"
+        frames += 1
+
+    stats = renderer.get_stats()
+    assert stats['partial_updates'] > 0
+    print(f"✅ {frames} dirty-rect frames matched full redraws ({stats})")
+
+
+def test_text_cache():
+    """Repeated text renders should hit the LRU cache, which stays bounded"""
+    print("🧪 Testing FontManager text cache...")
+
+    pygame.font.init()
+    font_manager = FontManager(max_cached_texts=3)
+    first, _ = font_manager.render_text("SCORE: 10", 'small', (255, 255, 255))
+    again, _ = font_manager.render_text("SCORE: 10", 'small', (255, 255, 255))
+    assert again is first
+    assert font_manager.get_cache_stats()['hits'] == 1
+
+    for score in range(20, 60, 10):
+        font_manager.render_text(f"SCORE: {score}", 'small', (255, 255, 255))
+    stats = font_manager.get_cache_stats()
+    assert stats['entries'] == 3 and stats['misses'] == 5
+    assert font_manager.render_text("SCORE: 10", 'small', (255, 255, 255))[0] is not first  # Evicted
+
+    font_manager.invalidate("SCORE: 50")
+    assert font_manager.get_cache_stats()['entries'] == 2
+    font_manager.invalidate()
+    assert font_manager.get_cache_stats()['entries'] == 0
+    print(f"✅ Text cache works ({stats})")
+
+
+def test_hud_panels_redraw_on_change():
+    """HUD panels should only be recomposed when the values they show change"""
+    print("🧪 Testing retained HUD panels...")
+
+    game = create_game()
+    game.draw_game_ui()
+    redraws = game.ui_manager.panel_redraws
+    assert redraws > 0
+    for _ in range(10):
+        game.draw_game_ui()
+    assert game.ui_manager.panel_redraws == redraws
+
+    game.score += 100
+    game.draw_game_ui()
+    assert game.ui_manager.panel_redraws == redraws + 1  # Only the score panel
+    print(f"✅ HUD panels recomposed {game.ui_manager.panel_redraws} times over 12 frames")
+
+
+def test_credits_strip():
+    """Credits should be pre-rendered once, with offsets matching the line spacings"""
+    print("🧪 Testing pre-rendered credits...")
+
+    game = create_game()
+    game.start_credits()
+    game.draw_credits_screen()
+    strip = game.credits_strip
+    spacings = [spacing for _, _, spacing in game.credits_content]
+    assert game.credits_offsets == [sum(spacings[:i]) for i in range(len(spacings))]
+    assert game.credits_total_height == sum(spacings)
+
+    misses = game.font_manager.get_cache_stats()['misses']
+    for _ in range(100):
+        game.draw_credits_screen()
+    assert game.credits_strip is strip
+    assert game.font_manager.get_cache_stats()['misses'] == misses
+    print(f"✅ Credits strip {strip.get_size()} with {len(game.credits_line_rects)} lines")
+
+
+def test_starfield():
+    """The starfield should twinkle without touching the global random stream"""
+    print("🧪 Testing starfield...")
+
+    pygame.display.init()
+    random.seed(7)
+    expected = random.random()
+    random.seed(7)
+    starfield = Starfield(SCREEN_WIDTH, SCREEN_HEIGHT)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    starfield.draw(surface, 0.0)
+    assert random.random() == expected
+
+    assert (starfield.get_levels(0.0) != starfield.get_levels(0.4)).any()  # Twinkles over time
+    assert starfield.get_levels(0.0, brightness=0.0).max() == 0
+    print(f"✅ Starfield drew {len(starfield.x)} stars from {len(starfield.stamps)} stamps")
+
+
+def test_parallax_background():
+    """Parallax layers should be opt-in, come from the art cache and stay put while paused"""
+    print("🧪 Testing parallax background...")
+
+    assert create_game().parallax_background is None  # Off unless asked for
+    assert create_game(dirty_rects=True, parallax=True).parallax_background is None
+
+    shared_cache = art_cache._default_cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        art_cache._default_cache = art_cache.ArtCache(cache_dir)
+        try:
+            generated = ParallaxBackground(SCREEN_WIDTH, SCREEN_HEIGHT)
+            cached = ParallaxBackground(SCREEN_WIDTH, SCREEN_HEIGHT)
+            assert art_cache._default_cache.get_stats() == {'hits': 1, 'misses': 1, 'writes': 1}
+        finally:
+            art_cache._default_cache = shared_cache
+    for first, second in zip(generated.layers, cached.layers):
+        mode = "RGBA" if first.surface.get_flags() & pygame.SRCALPHA else "RGB"
+        assert first.name == second.name and second.surface.get_flags() & pygame.SRCALPHA == \
+            first.surface.get_flags() & pygame.SRCALPHA
+        assert pygame.image.tobytes(first.surface, mode) == pygame.image.tobytes(second.surface, mode), first.name
+
+    game = create_game(parallax=True)
+    parallax = game.parallax_background
+    assert parallax is not None
+
+    for _ in range(2000):
+        game.update(autopilot(game))
+    offsets = [layer.offset for layer in parallax.layers]
+    assert all(0 <= offset < SCREEN_HEIGHT for offset in offsets)
+    assert offsets[0] == 0 and len(set(offsets)) == len(offsets)  # Each star layer at its own speed
+
+    game.state = GameState.PAUSED
+    game.update(autopilot(game))
+    assert [layer.offset for layer in parallax.layers] == offsets
+    game.draw_background()
+    print(f"✅ {len(parallax.layers)} parallax layers scrolled to {[round(o, 1) for o in offsets]}")
+
+
+def test_sprite_atlas():
+    """Packed sprites should not overlap and should blit exactly like the originals"""
+    print("🧪 Testing sprite atlas...")
+
+    rng = random.Random(3)
+    sprites = {}
+    for i in range(60):
+        sprite = pygame.Surface((rng.randint(4, 60), rng.randint(4, 60)), pygame.SRCALPHA)
+        sprite.fill((rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), rng.randint(1, 255)))
+        sprites[i] = sprite
+    originals = dict(sprites)
+
+    atlas = SpriteAtlas(page_size=256)
+    atlas.add_container(sprites, "test")
+    atlas.build()
+    assert len(atlas) == 60 and atlas.get_stats()['pages'] > 1
+
+    rects = [atlas.index[f"test.{i}"] for i in range(60)]
+    for i, (page, rect) in enumerate(rects):
+        assert atlas.pages[page].get_rect().contains(rect)
+        assert not any(page == other_page and rect.colliderect(other)
+                       for other_page, other in rects[i + 1:])
+
+    for i, original in originals.items():
+        expected = pygame.Surface((64, 64))
+        expected.blit(original, (2, 2))
+        actual = pygame.Surface((64, 64))
+        actual.blits([atlas.source(sprites[i], (2, 2))])
+        assert pygame.image.tobytes(expected, "RGB") == pygame.image.tobytes(actual, "RGB")
+    print(f"✅ Packed {len(atlas)} sprites ({atlas.get_stats()['page_sizes']})")
+
+
+def test_asset_finalizer():
+    """Sprites should come back in display format, with RLE only where transparency pays for it"""
+    print("🧪 Testing asset finalizer...")
+
+    pygame.display.init()
+    display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    sparse = pygame.Surface((32, 32), pygame.SRCALPHA)  # Mostly transparent, like a bullet sprite
+    pygame.draw.rect(sparse, (255, 255, 0, 255), (12, 0, 8, 32))
+    opaque = pygame.Surface((16, 16))
+    opaque.fill((40, 80, 160))
+    keyed = pygame.Surface((16, 16))
+    keyed.fill((255, 0, 255))
+    keyed.set_colorkey((255, 0, 255))
+    sprites = {'sparse': sparse, 'frames': [opaque, {'keyed': keyed}]}
+
+    finalizer = AssetFinalizer()
+    finalizer.finalize_container(sprites, "test")
+    sparse, opaque, keyed = sprites['sparse'], sprites['frames'][0], sprites['frames'][1]['keyed']
+    assert all(surface.get_bitsize() == display.get_bitsize() for surface in (sparse, opaque, keyed))
+
+    assert sparse.get_flags() & pygame.SRCALPHA and "RLE" in describe_format(sparse)
+    assert "RLE" not in describe_format(opaque) and opaque.get_colorkey() is None
+    assert keyed.get_colorkey()[:3] == (255, 0, 255) and "COLORKEY" in describe_format(keyed)
+
+    assert [entry['name'] for entry in finalizer.report] == ["test.sparse", "test.frames.0", "test.frames.1.keyed"]
+    summary = finalizer.get_summary()
+    assert summary['surfaces'] == len(finalizer.report) == 3
+    assert summary['rle_surfaces'] == sum(1 for entry in finalizer.report if 'RLE' in entry['after_format'])
+    assert summary['after_bytes'] == sum(entry['after_bytes'] for entry in finalizer.report)
+    assert finalizer.format_report()[-1].startswith("3 surfaces")
+    print(f"✅ Finalized {summary['surfaces']} surfaces ({summary['rle_surfaces']} RLE)")
+
+
+if __name__ == "__main__":
+    test_dirty_rects_match_full_redraw()
+    test_text_cache()
+    test_hud_panels_redraw_on_change()
+    test_credits_strip()
+    test_starfield()
+    test_parallax_background()
+    test_sprite_atlas()
+    test_asset_finalizer()
+    print("🎉 Rendering tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test script for the headless fixed-timestep simulation
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+from simulation import Simulation, autopilot
+from cosmic_raiders import GameState, FRAME_MS
+from input_recorder import InputPlayback
+
+
+def test_headless_simulation():
+    """Run the simulation without a display surface and check it advances"""
+    print("🧪 Testing headless simulation...")
+
+    simulation = Simulation()
+    assert simulation.game.screen is None, "Simulation should not create a display surface"
+    assert simulation.game.state == GameState.PLAYING
+
+    stats = simulation.run(600)
+    assert stats['ticks'] > 0
+    assert abs(simulation.game.sim_time - stats['ticks'] * FRAME_MS) < 1e-6
+    print(f"✅ Simulated {stats['ticks']} ticks at {stats['ticks_per_second']:.0f} ticks/s")
+
+
+def test_simulation_faster_than_real_time():
+    """A bot game should run well above the 60 Hz display rate"""
+    print("🧪 Testing simulation speed...")
+
+    simulation = Simulation()
+    stats = simulation.run(3000, autopilot)
+    assert stats['ticks_per_second'] > 1000, f"Too slow: {stats['ticks_per_second']:.0f} ticks/s"
+    print(f"✅ Bot game ran at {stats['ticks_per_second']:.0f} ticks/s (score {stats['score']})")
+
+
+def test_pools_recycle_objects():
+    """Aliens and hit effects should be reused from their pools during play"""
+    print("🧪 Testing object pools...")
+
+    simulation = Simulation(seed=99)
+    simulation.run(6000, autopilot)
+    game = simulation.game
+    stats = game.get_pool_stats()
+
+    assert stats['aliens']['reused'] > 0 and stats['hit_effects']['reused'] > 0
+    assert stats['aliens']['live'] == len(game.cosmic_formation.active_aliens)
+    assert stats['hit_effects']['live'] == len(game.hit_effects)
+    print(f"✅ Pools reused objects: {stats}")
+
+
+def test_record_and_replay():
+    """A recorded bot run should replay to the exact same outcome"""
+    print("🧪 Testing input record/playback...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "run.json")
+
+        simulation = Simulation(seed=1234)
+        simulation.game.start_recording(path)
+        simulation.start(seed=1234)
+        recorded = simulation.run(4000, autopilot)
+        simulation.game.finish_recording()
+
+        playback = InputPlayback.load(path)
+        assert len(playback) == recorded['ticks']
+
+        replayed = Simulation().replay(playback)
+        assert replayed['matches_recording'], f"Replay diverged: {replayed} vs {playback.summary}"
+        assert replayed['score'] == recorded['score']
+        print(f"✅ Replayed {len(playback)} frames to score {replayed['score']} ({replayed['state']})")
+
+
+def test_replay_with_pauses():
+    """Pausing mid-run should not change the replay (paused ticks are neither recorded nor timed)"""
+    print("🧪 Testing replay across pauses...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "run.json")
+
+        simulation = Simulation(seed=77)
+        game = simulation.game
+        game.start_recording(path)
+        simulation.start(seed=77)
+        for tick in range(4000):
+            if simulation.is_finished():
+                break
+            if tick % 500 == 250 and game.state == GameState.PLAYING:
+                game.previous_state, game.state = game.state, GameState.PAUSED
+                paused_at = game.sim_time
+                simulation.run(37, autopilot)  # Held keys while paused must not count
+                assert game.sim_time == paused_at
+                game.state, game.previous_state = game.previous_state, None
+            simulation.step(autopilot(game))
+        recorded = simulation.get_stats()
+        game.finish_recording()
+
+        playback = InputPlayback.load(path)
+        replayed = Simulation().replay(playback)
+        assert replayed['matches_recording'], f"Replay diverged: {replayed} vs {playback.summary}"
+        assert replayed['score'] == recorded['score']
+        print(f"✅ Paused run replayed to score {replayed['score']} ({replayed['state']})")
+
+
+def test_spaceship_designs_prefetched():
+    """Only level 1 designs exist at startup; completing a level prefetches the next level's"""
+    print("🧪 Testing lazy spaceship designs...")
+
+    simulation = Simulation(seed=3)
+    designer = simulation.game.spaceship_designer
+    built = lambda: sum(len(variants) for variants in designer.spaceship_designs.values())
+    assert built() == 4
+    finalized_on = []
+    designer.surface_finalizer = lambda surface, name: (finalized_on.append(threading.current_thread()), surface)[1]
+
+    for _ in range(200):
+        if simulation.game.state == GameState.LEVEL_COMPLETE:
+            break
+        simulation.run(30, autopilot)
+    assert simulation.game.state == GameState.LEVEL_COMPLETE
+    assert designer.prefetch_thread is not None
+    designer.prefetch_thread.join()
+    assert len(designer.prefetched) == 4 and built() == 4  # Raw surfaces wait for the main thread
+    designer.load_level_spaceships(2)
+    assert built() == 8 and not designer.prefetched
+    assert finalized_on and all(thread is threading.main_thread() for thread in finalized_on)
+    for ship_class, variants in designer.spaceship_designs.items():
+        assert designer.get_variant(ship_class, 2) in variants
+        assert not designer.flash_designs[ship_class]  # Nothing was drawn, so no flash variant was needed
+
+    flash = designer.get_spaceship_design('scout', 2, flash=True)
+    assert flash is designer.get_spaceship_design('scout', 2, flash=True)
+    assert list(designer.flash_designs['scout']) == [designer.get_variant('scout', 2)]
+    print(f"✅ {built()} designs built by the start of level 2, flash variants on demand")
+
+
+if __name__ == "__main__":
+    test_headless_simulation()
+    test_simulation_faster_than_real_time()
+    test_pools_recycle_objects()
+    test_record_and_replay()
+    test_replay_with_pauses()
+    test_spaceship_designs_prefetched()
+    print("🎉 Simulation tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test script for cached procedural sound synthesis
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from sound_synth import SoundSynth, SYNTH_PRESETS, to_mixer_bytes
+
+
+def test_synth_cache():
+    """Effects should render once per parameter set and come back from memory or disk afterwards"""
+    print("🧪 Testing sound synthesis cache...")
+
+    mixer_format = (22050, -16, 2)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        synth = SoundSynth(cache_dir)
+        laser = synth.get_buffer(SYNTH_PRESETS['player_shoot'], mixer_format)
+        assert len(laser) == int(22050 * 0.08) * 2 * 2  # Stereo 16-bit frames
+        assert synth.get_buffer(SYNTH_PRESETS['player_shoot'], mixer_format) is laser
+        mono = synth.get_buffer(SYNTH_PRESETS['player_shoot'], (22050, -16, 1))
+        assert len(mono) * 2 == len(laser)
+        assert synth.get_stats() == {'hits': 1, 'disk_hits': 0, 'renders': 2}
+
+        reloaded = SoundSynth(cache_dir)
+        assert reloaded.get_buffer(SYNTH_PRESETS['player_shoot'], mixer_format) == laser
+        assert reloaded.get_stats()['disk_hits'] == 1
+
+    explosion = SoundSynth().get_buffer(SYNTH_PRESETS['alien_destroy'], mixer_format)
+    assert explosion == SoundSynth().get_buffer(SYNTH_PRESETS['alien_destroy'], mixer_format)  # Seeded noise
+    unsigned = np.frombuffer(to_mixer_bytes(np.array([-1.0, 0.0, 1.0]), (22050, 8, 1), 1.0), np.uint8)
+    assert list(unsigned) == [1, 128, 255]
+    signed_32 = np.frombuffer(to_mixer_bytes(np.array([-1.0, 0.0, 1.0]), (44100, -32, 2), 1.0), np.int32)
+    assert list(signed_32) == [-2147483647, -2147483647, 0, 0, 2147483647, 2147483647]
+    print("✅ Synthesized buffers cached in memory and on disk")
+
+
+def test_synth_sound():
+    """Synthesized effects should play on the open mixer"""
+    print("🧪 Testing synthesized sounds...")
+
+    pygame.mixer.init(22050, -16, 2, 256)
+    try:
+        sound = SoundSynth().get_preset('alien_hit')
+        assert abs(sound.get_length() - 0.15) < 0.01
+        assert SoundSynth().get_preset('menu_music') is None
+    finally:
+        pygame.mixer.quit()
+    print("✅ Synthesized sounds playable")
+
+
+if __name__ == "__main__":
+    test_synth_cache()
+    test_synth_sound()
+    print("🎉 Sound synth tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for the spatial hash collision broad phase
+"""
+
+import sys
+import random
+import pygame
+
+from spatial_hash import SpatialHash
+
+
+def test_query_matches_brute_force():
+    """Grid queries should find exactly the rects a full scan finds, in order"""
+    print("🧪 Testing spatial hash queries...")
+
+    rng = random.Random(7)
+    rects = [pygame.Rect(rng.randint(-20, 800), rng.randint(-20, 600), rng.randint(4, 60), rng.randint(4, 40))
+             for _ in range(200)]
+
+    grid = SpatialHash(64)
+    for index, rect in enumerate(rects):
+        grid.insert(index, rect)
+
+    for _ in range(200):
+        probe = pygame.Rect(rng.randint(0, 800), rng.randint(0, 600), 4, 12)
+        expected = [index for index, rect in enumerate(rects) if rect.colliderect(probe)]
+        assert grid.query(probe) == expected
+    print("✅ Spatial hash matches brute-force collision checks")
+
+
+def test_remove_and_clear():
+    """Removed entities are skipped and clear empties the grid"""
+    print("🧪 Testing spatial hash remove/clear...")
+
+    grid = SpatialHash(64)
+    first, second = object(), object()
+    grid.insert(first, pygame.Rect(10, 10, 30, 30))
+    grid.insert(second, pygame.Rect(20, 20, 30, 30))
+
+    probe = pygame.Rect(25, 25, 2, 2)
+    assert grid.query(probe) == [first, second]
+    grid.remove(first)
+    assert grid.query(probe) == [second]
+    assert len(grid) == 1
+
+    grid.clear()
+    assert grid.query(probe) == [] and len(grid) == 0
+    print("✅ Spatial hash remove/clear work")
+
+
+if __name__ == "__main__":
+    test_query_matches_brute_force()
+    test_remove_and_clear()
+    print("🎉 Spatial hash tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the --profile-startup report
+"""
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_profile_startup_report():
+    """--profile-startup should write a JSON breakdown of stages and imports and exit"""
+    print("🧪 Testing startup profiler...")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Generated art and music go to throwaway caches, never the game's own .art_cache/.audio_cache
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                   COSMIC_RAIDERS_ART_CACHE=os.path.join(work_dir, "art_cache"),
+                   COSMIC_RAIDERS_AUDIO_CACHE=os.path.join(work_dir, "audio_cache"))
+        report_path = os.path.join(work_dir, "startup.json")
+        result = subprocess.run(
+            [sys.executable, os.path.join(GAME_DIR, "cosmic_raiders.py"), "--profile-startup", report_path],
+            env=env, cwd=work_dir, capture_output=True, timeout=120
+        )
+        assert result.returncode == 0, result.stderr.decode(errors="replace")
+        with open(report_path) as report_file:
+            report = json.load(report_file)
+
+    stages = [stage['stage'] for stage in report['stages']]
+    for expected in ("imports", "display", "VisualAssets", "SpaceshipDesigner", "AudioManager", "CosmicFormation"):
+        assert expected in stages, f"Missing stage {expected}"
+    assert all(stage['seconds'] >= 0 for stage in report['stages'])
+    assert report['surfaces'] > 0 and report['surface_bytes'] > 0
+
+    modules = {record['module'] for record in report['imports']}
+    assert {"pygame", "visual_assets", "spaceship_designer"} <= modules
+    print(f"✅ {len(stages)} stages and {len(modules)} imports in {report['stage_seconds'] * 1000:.0f} ms")
+
+
+def test_imports_have_no_side_effects():
+    """Importing the game modules should not start pygame, the mixer or any threads"""
+    print("🧪 Testing lazy initialisation...")
+
+    script = (
+        "import threading, pygame\n"
+        "import cosmic_raiders, asset_loader, optimized_audio_manager, screenshot_generator\n"
+        "assert not pygame.get_init() and pygame.mixer.get_init() is None\n"
+        "assert threading.active_count() == 1, threading.enumerate()\n"
+        "game = cosmic_raiders.Game(headless=True, seed=1)\n"
+        "assert pygame.display.get_surface() is None and pygame.mixer.get_init() is None\n"
+        "assert not game.audio_manager.audio_enabled\n"
+        "print('ok')\n"
+    )
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", COSMIC_RAIDERS_ART_CACHE="off")
+    result = subprocess.run([sys.executable, "-c", script], env=env, cwd=GAME_DIR, capture_output=True, timeout=120)
+    assert result.returncode == 0, result.stderr.decode(errors="replace")
+    print("✅ Imports start nothing and headless games never open audio or video")
+
+
+if __name__ == "__main__":
+    test_profile_startup_report()
+    test_imports_have_no_side_effects()
+    print("🎉 Startup profiler tests completed successfully!")
+    sys.exit(0)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test script for the priority-based sound voice manager
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from voice_manager import VoiceManager
+
+
+def test_voice_limits_and_stealing():
+    """Rapid fire should stay within its cap and never take channels from more important effects"""
+    print("🧪 Testing voice manager...")
+
+    pygame.mixer.init(22050, -16, 2, 256)
+    try:
+        tone = pygame.mixer.Sound(buffer=b"\x00\x10" * 22050 * 2 * 5)  # Long enough to stay playing
+        voices = VoiceManager(categories={'weapons': 2, 'events': 1},
+                              rules={'player_shoot': ('weapons', 1, 2), 'player_hit': ('events', 5, 1),
+                                     'level_complete': ('events', 4, 1)})
+
+        for _ in range(10):
+            assert voices.play('player_shoot', tone)
+        assert voices.get_active_count('weapons') == 2  # Capped, restarting the oldest shot
+        assert voices.get_stats()['stolen'] == 8
+
+        assert voices.play('player_hit', tone)
+        assert voices.get_active_count('events') == 1
+        assert not voices.play('level_complete', tone)  # Lower priority never steals a player hit
+        stats = voices.get_stats()
+        assert stats['dropped'] == 1 and stats['played'] == 11
+        assert pygame.mixer.find_channel() not in [voice.channel for voice in voices.voices['weapons']]
+        voices.stop_all()
+        assert voices.get_active_count() == 0
+    finally:
+        pygame.mixer.quit()
+    print(f"✅ Voice stats: {stats}")
+
+
+if __name__ == "__main__":
+    test_voice_limits_and_stealing()
+    print("🎉 Voice manager tests completed successfully!")
+    sys.exit(0)
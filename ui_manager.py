@@ -28,6 +28,11 @@ class UIManager:
             'score_high': (255, 255, 0),
             'score_new': (0, 255, 0)
         }
+        
+        # Retained HUD panels: composited surface plus the inputs it was built from
+        self.panels = {}
+        self.panel_backgrounds = {}
+        self.panel_redraws = 0
     
     def draw_compact_hud(self, screen, game_data):
         """Draw compact, non-intrusive HUD"""
@@ -45,17 +50,42 @@ class UIManager:
         # Bottom-right: Quick stats (minimal)
         self.draw_quick_stats(screen, game_data)
     
+    def draw_panel(self, screen, name, inputs, rect, compose):
+        """Blit a retained HUD panel, recomposing it only when its inputs changed"""
+        panel = self.panels.get(name)
+        if panel is None or panel['inputs'] != inputs or panel['size'] != rect.size:
+            # Labels go on a transparent layer; blitted over the shared background
+            # this gives exactly what drawing them straight to the screen did
+            layer = pygame.Surface(rect.size, pygame.SRCALPHA)
+            compose(layer, *inputs)
+            panel = {'inputs': inputs, 'size': rect.size, 'layer': layer}
+            self.panels[name] = panel
+            self.panel_redraws += 1
+        
+        screen.blit(self.get_panel_background(rect.size), rect.topleft)
+        screen.blit(panel['layer'], rect.topleft)
+    
+    def get_panel_background(self, size):
+        """Get the shared semi-transparent background for a panel size"""
+        background = self.panel_backgrounds.get(size)
+        if background is None:
+            background = pygame.Surface(size, pygame.SRCALPHA)
+            background.fill(self.colors['background'])
+            self.panel_backgrounds[size] = background
+        return background
+    
+    def invalidate_panels(self):
+        """Force every HUD panel to recompose on its next draw"""
+        self.panels.clear()
+    
     def draw_essential_info(self, screen, game_data):
         """Draw essential game information in top-left"""
-        zone = self.ui_zones['top_left']
-        
-        # Semi-transparent background
-        bg_surface = pygame.Surface((zone.width, zone.height), pygame.SRCALPHA)
-        bg_surface.fill(self.colors['background'])
-        screen.blit(bg_surface, zone.topleft)
-        
+        inputs = (game_data.get('lives', 3), game_data.get('level', 1), game_data.get('wave', 1))
+        self.draw_panel(screen, 'essential_info', inputs, self.ui_zones['top_left'], self.compose_essential_info)
+    
+    def compose_essential_info(self, panel, lives, level, wave):
+        """Compose the lives/level panel"""
         # Lives with color coding
-        lives = game_data.get('lives', 3)
         if lives >= 3:
             lives_color = self.colors['health_high']
         elif lives == 2:
@@ -64,31 +94,25 @@ class UIManager:
             lives_color = self.colors['health_low']
         
         lives_text, _ = self.font_manager.render_text(f"♥ {lives}", 'medium', lives_color)
-        screen.blit(lives_text, (zone.x + 5, zone.y + 5))
+        panel.blit(lives_text, (5, 5))
         
         # Level
-        level = game_data.get('level', 1)
         level_text, _ = self.font_manager.render_text(f"LV {level}", 'medium', self.colors['text_accent'])
-        screen.blit(level_text, (zone.x + 5, zone.y + 30))
+        panel.blit(level_text, (5, 30))
         
         # Wave (if different from level)
-        wave = game_data.get('wave', 1)
         if wave != level:
             wave_text, _ = self.font_manager.render_text(f"W{wave}", 'small', self.colors['text_secondary'])
-            screen.blit(wave_text, (zone.x + 5, zone.y + 55))
+            panel.blit(wave_text, (5, 55))
     
     def draw_score_info(self, screen, game_data):
         """Draw score information in top-right"""
-        zone = self.ui_zones['top_right']
-        
-        # Semi-transparent background
-        bg_surface = pygame.Surface((zone.width, zone.height), pygame.SRCALPHA)
-        bg_surface.fill(self.colors['background'])
-        screen.blit(bg_surface, zone.topleft)
-        
-        # Current score
-        score = game_data.get('score', 0)
-        high_score = game_data.get('high_score', 0)
+        inputs = (game_data.get('score', 0), game_data.get('high_score', 0))
+        self.draw_panel(screen, 'score_info', inputs, self.ui_zones['top_right'], self.compose_score_info)
+    
+    def compose_score_info(self, panel, score, high_score):
+        """Compose the score/high score panel"""
+        right = panel.get_width()
         
         # Determine score color
         if score > high_score:
@@ -99,61 +123,57 @@ class UIManager:
             score_color = self.colors['score_normal']
         
         score_text, score_rect = self.font_manager.render_text(f"{score:,}", 'medium', score_color)
-        score_rect.topright = (zone.right - 5, zone.y + 5)
-        screen.blit(score_text, score_rect)
+        score_rect.topright = (right - 5, 5)
+        panel.blit(score_text, score_rect)
         
         # High score (smaller, less prominent) - Fixed positioning
         if high_score > 0:
             high_text, high_rect = self.font_manager.render_text(f"HI:{high_score:,}", 'small', self.colors['text_secondary'])
-            high_rect.topright = (zone.right - 5, zone.y + 30)  # Reduced gap from 35 to 30
-            screen.blit(high_text, high_rect)
+            high_rect.topright = (right - 5, 30)  # Reduced gap from 35 to 30
+            panel.blit(high_text, high_rect)
         
         # New high score indicator - Fixed positioning
         if score > high_score and score > 0:
             new_text, new_rect = self.font_manager.render_text("NEW!", 'small', self.colors['score_new'])
-            new_rect.topright = (zone.right - 5, zone.y + 50)  # Reduced gap from 55 to 50
-            screen.blit(new_text, new_rect)
+            new_rect.topright = (right - 5, 50)  # Reduced gap from 55 to 50
+            panel.blit(new_text, new_rect)
     
     def draw_level_progress(self, screen, game_data):
         """Draw level progress in bottom-left (when needed)"""
-        zone = self.ui_zones['bottom_left']
-        
         # Only show during active gameplay
         if not game_data.get('in_game', False):
             return
         
-        # Semi-transparent background
-        bg_surface = pygame.Surface((zone.width, zone.height), pygame.SRCALPHA)
-        bg_surface.fill(self.colors['background'])
-        screen.blit(bg_surface, zone.topleft)
-        
+        remaining = game_data.get('remaining_aliens', 0)
+        inputs = (game_data.get('formation_name', 'UNKNOWN'), game_data.get('active_aliens', 0), remaining,
+                  game_data.get('max_aliens', 3), game_data.get('total_aliens', remaining))
+        self.draw_panel(screen, 'level_progress', inputs, self.ui_zones['bottom_left'], self.compose_level_progress)
+    
+    def compose_level_progress(self, panel, formation, active, remaining, max_aliens, total_aliens):
+        """Compose the formation/progress panel"""
         # Formation name
-        formation = game_data.get('formation_name', 'UNKNOWN')
         form_text, _ = self.font_manager.render_text(formation, 'small', self.colors['text_accent'])
-        screen.blit(form_text, (zone.x + 5, zone.y + 5))
+        panel.blit(form_text, (5, 5))
         
         # Aliens remaining with max active info
-        active = game_data.get('active_aliens', 0)
-        remaining = game_data.get('remaining_aliens', 0)
-        max_aliens = game_data.get('max_aliens', 3)
         aliens_text, _ = self.font_manager.render_text(f"{active}/{max_aliens} | {remaining}", 'small', self.colors['text_secondary'])
-        screen.blit(aliens_text, (zone.x + 5, zone.y + 25))
+        panel.blit(aliens_text, (5, 25))
         
         # Progress bar
         if remaining > 0:
-            progress = 1.0 - (remaining / game_data.get('total_aliens', remaining))
-            bar_width = zone.width - 20
+            progress = 1.0 - (remaining / total_aliens)
+            bar_width = panel.get_width() - 20
             bar_height = 8
             
             # Background bar
-            bar_bg = pygame.Rect(zone.x + 10, zone.y + 50, bar_width, bar_height)
-            pygame.draw.rect(screen, self.colors['border'], bar_bg)
+            bar_bg = pygame.Rect(10, 50, bar_width, bar_height)
+            pygame.draw.rect(panel, self.colors['border'], bar_bg)
             
             # Progress bar
             progress_width = int(bar_width * progress)
             if progress_width > 0:
-                progress_bar = pygame.Rect(zone.x + 10, zone.y + 50, progress_width, bar_height)
-                pygame.draw.rect(screen, self.colors['text_accent'], progress_bar)
+                progress_bar = pygame.Rect(10, 50, progress_width, bar_height)
+                pygame.draw.rect(panel, self.colors['text_accent'], progress_bar)
     
     def draw_quick_stats(self, screen, game_data):
         """Draw quick stats in bottom-right (minimal)"""
@@ -164,16 +184,17 @@ class UIManager:
         if bullets == 0 and not game_data.get('show_stats', False):
             return
         
-        # Semi-transparent background
-        bg_surface = pygame.Surface((100, 30), pygame.SRCALPHA)  # Smaller area
-        bg_surface.fill(self.colors['background'])
-        screen.blit(bg_surface, (zone.right - 100, zone.bottom - 30))
-        
+        # Smaller area in the zone's bottom-right corner
+        stats_rect = pygame.Rect(zone.right - 100, zone.bottom - 30, 100, 30)
+        self.draw_panel(screen, 'quick_stats', (bullets,), stats_rect, self.compose_quick_stats)
+    
+    def compose_quick_stats(self, panel, bullets):
+        """Compose the active bullets panel"""
         # Active bullets
         if bullets > 0:
             bullet_text, bullet_rect = self.font_manager.render_text(f"⚡{bullets}", 'small', self.colors['text_secondary'])
-            bullet_rect.bottomright = (zone.right - 5, zone.bottom - 5)
-            screen.blit(bullet_text, bullet_rect)
+            bullet_rect.bottomright = (panel.get_width() - 5, panel.get_height() - 5)
+            panel.blit(bullet_text, bullet_rect)
     
     def draw_level_transition(self, screen, level_data):
         """Draw level transition screen with proper spacing"""
@@ -2,6 +2,19 @@ import pygame
 import os
 import math
 import random
+from art_cache import get_art_cache, generator_version
+from game_logger import get_logger
+
+assets_log = get_logger("assets")
+
+# Additive white tint applied to sprites while an alien flashes from damage
+DAMAGE_FLASH_TINT = (255, 255, 255, 100)
+
+def create_flash_sprite(sprite):
+    """Build the damage-flash variant of a sprite (done once when the design is created)"""
+    flash_sprite = sprite.copy()
+    flash_sprite.fill(DAMAGE_FLASH_TINT, special_flags=pygame.BLEND_ADD)
+    return flash_sprite
 
 class VisualAssets:
     def __init__(self):
@@ -10,7 +23,15 @@ class VisualAssets:
     
     def load_all_assets(self):
         """Load all visual assets with fallbacks"""
-        print("🎨 Loading visual assets...")
+        assets_log.info("🎨 Loading visual assets...")
+        
+        # Reuse the art generated by an earlier launch while the generator is unchanged
+        version = generator_version(__file__, "sprites")
+        cached_sprites = get_art_cache().load("visual_assets", version)
+        if cached_sprites is not None:
+            self.sprites = cached_sprites
+            assets_log.info("✅ Visual assets loaded from cache!")
+            return
         
         # Try to load sprite files, create fallbacks if missing
         self.load_or_create_background()
@@ -19,7 +40,8 @@ class VisualAssets:
         self.load_or_create_bullet_sprites()
         self.load_or_create_explosion_sprites()
         
-        print("✅ Visual assets loaded successfully!")
+        get_art_cache().save("visual_assets", version, self.sprites)
+        assets_log.info("✅ Visual assets loaded successfully!")
     
     def load_or_create_background(self):
         """Load or create space background"""
@@ -27,12 +49,12 @@ class VisualAssets:
             bg_path = "sprites/space_background.png"
             if os.path.exists(bg_path):
                 self.sprites['background'] = pygame.image.load(bg_path)
-                print("🌌 Loaded space background from file")
+                assets_log.info("🌌 Loaded space background from file")
             else:
                 self.sprites['background'] = self.create_space_background()
-                print("🌌 Created procedural space background")
+                assets_log.info("🌌 Created procedural space background")
         except Exception as e:
-            print(f"⚠️ Background error: {e}, using fallback")
+            assets_log.warning("⚠️ Background error: %s, using fallback", e)
             self.sprites['background'] = self.create_space_background()
     
     def create_space_background(self):
@@ -81,12 +103,12 @@ class VisualAssets:
             ship_path = "sprites/player_ship.png"
             if os.path.exists(ship_path):
                 self.sprites['player'] = pygame.image.load(ship_path)
-                print("🚀 Loaded player ship from file")
+                assets_log.info("🚀 Loaded player ship from file")
             else:
                 self.sprites['player'] = self.create_player_ship()
-                print("🚀 Created detailed player ship")
+                assets_log.info("🚀 Created detailed player ship")
         except Exception as e:
-            print(f"⚠️ Player ship error: {e}, using fallback")
+            assets_log.warning("⚠️ Player ship error: %s, using fallback", e)
             self.sprites['player'] = self.create_player_ship()
     
     def create_player_ship(self):
@@ -133,12 +155,12 @@ class VisualAssets:
                 alien_path = f"sprites/alien_{alien_type}.png"
                 if os.path.exists(alien_path):
                     self.sprites[f'alien_{alien_type}'] = pygame.image.load(alien_path)
-                    print(f"👾 Loaded {alien_type} alien from file")
+                    assets_log.info("👾 Loaded %s alien from file", alien_type)
                 else:
                     self.sprites[f'alien_{alien_type}'] = self.create_alien_sprite(alien_type)
-                    print(f"👾 Created {alien_type} alien sprite")
+                    assets_log.info("👾 Created %s alien sprite", alien_type)
             except Exception as e:
-                print(f"⚠️ {alien_type} alien error: {e}, using fallback")
+                assets_log.warning("⚠️ %s alien error: %s, using fallback", alien_type, e)
                 self.sprites[f'alien_{alien_type}'] = self.create_alien_sprite(alien_type)
     
     def create_alien_sprite(self, alien_type):
@@ -223,9 +245,9 @@ class VisualAssets:
             else:
                 self.sprites['alien_bullet'] = self.create_laser_bullet(False)
                 
-            print("⚡ Created laser/plasma projectiles")
+            assets_log.info("⚡ Created laser/plasma projectiles")
         except Exception as e:
-            print(f"⚠️ Bullet sprites error: {e}, using fallbacks")
+            assets_log.warning("⚠️ Bullet sprites error: %s, using fallbacks", e)
             self.sprites['player_bullet'] = self.create_laser_bullet(True)
             self.sprites['alien_bullet'] = self.create_laser_bullet(False)
     
@@ -259,9 +281,9 @@ class VisualAssets:
                     self.sprites['explosion_frames'].append(pygame.image.load(exp_path))
                 else:
                     self.sprites['explosion_frames'].append(self.create_explosion_frame(i))
-            print("💥 Created explosion animation frames")
+            assets_log.info("💥 Created explosion animation frames")
         except Exception as e:
-            print(f"⚠️ Explosion sprites error: {e}, using fallbacks")
+            assets_log.warning("⚠️ Explosion sprites error: %s, using fallbacks", e)
             self.sprites['explosion_frames'] = []
             for i in range(6):
                 self.sprites['explosion_frames'].append(self.create_explosion_frame(i))
@@ -0,0 +1,120 @@
+"""
+Voice Manager for Cosmic Raiders
+Plays sound effects on mixer channels reserved per category, caps how many
+copies of each effect can sound at once and steals the oldest lower-priority
+voice when a category is full, so rapid fire never drowns out hits and deaths
+"""
+
+import pygame
+from game_logger import get_logger
+
+audio_log = get_logger("audio")
+
+# Channels reserved for each category (16 in total, the mixer's channel count)
+VOICE_CATEGORIES = {
+    'weapons': 4,
+    'impacts': 7,
+    'events': 5
+}
+
+# Effect -> (category, priority, max concurrent voices); higher priorities steal lower ones
+VOICE_RULES = {
+    'player_shoot': ('weapons', 1, 3),
+    'alien_hit': ('impacts', 2, 3),
+    'alien_destroy': ('impacts', 3, 4),
+    'player_hit': ('events', 5, 1),
+    'level_complete': ('events', 4, 1),
+    'level_advance': ('events', 4, 1),
+    'game_over': ('events', 5, 1),
+    'victory_sound': ('events', 5, 1)
+}
+DEFAULT_VOICE_RULE = ('impacts', 2, 2)
+
+
+class Voice:
+    """One reserved mixer channel and what it is playing"""
+    def __init__(self, channel, category):
+        self.channel = channel
+        self.category = category
+        self.sound_name = None
+        self.priority = 0
+        self.started = 0  # Play sequence number, lower is older
+
+    def is_active(self):
+        return self.sound_name is not None and self.channel.get_busy()
+
+
+class VoiceManager:
+    def __init__(self, categories=VOICE_CATEGORIES, rules=VOICE_RULES, channels=None):
+        self.rules = rules
+        if channels is None:
+            total = sum(categories.values())
+            if pygame.mixer.get_num_channels() < total:
+                pygame.mixer.set_num_channels(total)
+            pygame.mixer.set_reserved(total)  # Keep stray Sound.play() calls off our channels
+            channels = [pygame.mixer.Channel(i) for i in range(total)]
+
+        # Hand out the channels to the categories in order
+        self.voices = {}
+        channels = iter(channels)
+        for category, count in categories.items():
+            self.voices[category] = [Voice(next(channels), category) for _ in range(count)]
+
+        self.sequence = 0
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def get_rule(self, sound_name):
+        """Get (category, priority, max voices) for an effect"""
+        return self.rules.get(sound_name, DEFAULT_VOICE_RULE)
+
+    def play(self, sound_name, sound):
+        """Play an effect on a voice of its category; returns False if it was dropped"""
+        category, priority, max_voices = self.get_rule(sound_name)
+        voices = self.voices.get(category) or self.voices[DEFAULT_VOICE_RULE[0]]
+        active = [voice for voice in voices if voice.is_active()]
+
+        same_effect = [voice for voice in active if voice.sound_name == sound_name]
+        if len(same_effect) >= max_voices:
+            # At the effect's cap: restart its oldest copy instead of taking another channel
+            voice = min(same_effect, key=lambda voice: voice.started)
+            self.stolen += 1
+        else:
+            free = [voice for voice in voices if not voice.is_active()]
+            if free:
+                voice = free[0]
+            else:
+                # Category full: steal the oldest of the lowest-priority voices, never a higher one
+                candidates = [voice for voice in active if voice.priority <= priority]
+                if not candidates:
+                    self.dropped += 1
+                    audio_log.debug("🔇 Dropped %s (no free %s voice)", sound_name, category)
+                    return False
+                voice = min(candidates, key=lambda voice: (voice.priority, voice.started))
+                self.stolen += 1
+
+        self.sequence += 1
+        voice.sound_name = sound_name
+        voice.priority = priority
+        voice.started = self.sequence
+        voice.channel.play(sound)
+        self.played += 1
+        return True
+
+    def stop_all(self):
+        """Stop every voice"""
+        for voices in self.voices.values():
+            for voice in voices:
+                voice.channel.stop()
+                voice.sound_name = None
+
+    def get_active_count(self, category=None):
+        """Count voices currently sounding (in one category or all)"""
+        categories = [category] if category else list(self.voices)
+        return sum(voice.is_active() for name in categories for voice in self.voices[name])
+
+    def get_stats(self):
+        """Get played, dropped and stolen voice counts"""
+        return {'played': self.played, 'dropped': self.dropped, 'stolen': self.stolen,
+                'active': self.get_active_count()}